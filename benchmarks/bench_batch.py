@@ -0,0 +1,54 @@
+"""Benchmark `dr score-batch` throughput against worker count.
+
+Copies the `examples/` corpus `--copies` times into a temp directory and
+scores it with 1..N worker processes. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_batch.py --copies 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from dr.batch import expand_inputs, score_batch
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--copies", type=int, default=100, help="How many copies of the examples corpus to score")
+    p.add_argument("--jobs", default=None, help="Comma-separated worker counts (default: 1,2,4,... up to CPU count)")
+    args = p.parse_args()
+
+    cpus = os.cpu_count() or 1
+    jobs = [int(j) for j in args.jobs.split(",")] if args.jobs else sorted({1, *[2**i for i in range(1, 8) if 2**i <= cpus], cpus})
+    sources = expand_inputs([str(ROOT / "examples")])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(args.copies):
+            target = Path(tmpdir) / f"copy{i:05d}"
+            target.mkdir()
+            for src in sources:
+                shutil.copy(src, target / f"{src.parent.name}-{src.name}")
+        paths = expand_inputs([tmpdir])
+
+        print(f"{len(paths)} files")
+        print(f"{'jobs':>5} {'seconds':>8} {'files/s':>9} {'speedup':>8}")
+        baseline = None
+        for n in jobs:
+            start = time.perf_counter()
+            for _ in score_batch(paths, jobs=n):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{n:>5} {elapsed:>8.2f} {len(paths) / elapsed:>9.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure claim store ingest and lookup throughput as the store grows.
+
+Conversations of synthetic claims (pseudo-words from benchmarks/synth.py, drawn
+Zipf-like so some tokens are very common) are ingested in batches; after each
+checkpoint, lookups for a mix of repeated, reworded and fresh claims are timed.
+Lookups should stay roughly flat as the store grows. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_claim_store.py --claims 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from dr.claim_store import ClaimStore
+from dr.score import CLAIM_CACHE, JACCARD_THRESHOLD
+
+from synth import word
+
+
+def _claim(rng: random.Random, vocabulary: int, words: int) -> str:
+    # Squaring a uniform draw skews toward low word indices, i.e. common tokens.
+    return " ".join(word(int(vocabulary * rng.random() ** 2)) for _ in range(words))
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--claims", type=int, default=1_000_000)
+    p.add_argument("--per-conversation", type=int, default=60)
+    p.add_argument("--checkpoints", type=int, default=4)
+    p.add_argument("--lookups", type=int, default=2000)
+    p.add_argument("--vocabulary", type=int, default=50_000)
+    p.add_argument("--words", type=int, default=5)
+    args = p.parse_args()
+
+    rng = random.Random(0)
+    token_ids = CLAIM_CACHE.token_ids
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ClaimStore(Path(tmp) / "claims.sqlite3")
+        added = 0
+        conversation = 0
+        recent: list[str] = []
+        print(f"{'claims':>10} {'ingest/s':>10} {'lookup/s':>10} {'repeats found':>14}")
+        for checkpoint in range(1, args.checkpoints + 1):
+            target = args.claims * checkpoint // args.checkpoints
+            start = time.perf_counter()
+            batch_claims = 0
+            while added < target:
+                claims = [_claim(rng, args.vocabulary, args.words) for _ in range(min(args.per_conversation, target - added))]
+                store.add(f"c{conversation}", "bench", [(c, token_ids(c)) for c in claims])
+                recent = (recent + claims)[-10_000:]
+                conversation += 1
+                added += len(claims)
+                batch_claims += len(claims)
+            ingest = batch_claims / (time.perf_counter() - start)
+
+            queries = []
+            for i in range(args.lookups):
+                kind = i % 3
+                if kind == 0:
+                    queries.append(rng.choice(recent))
+                elif kind == 1:
+                    words = rng.choice(recent).split()
+                    words[rng.randrange(len(words))] = word(rng.randrange(args.vocabulary))
+                    queries.append(" ".join(words))
+                else:
+                    queries.append(_claim(rng, args.vocabulary, args.words))
+            token_sets = [token_ids(q) for q in queries]
+            start = time.perf_counter()
+            found = 0
+            # One call per 6-claim round, as the scorer makes them.
+            for i in range(0, len(token_sets), 6):
+                found += sum(m is not None for m in store.lookup("bench", token_sets[i : i + 6], JACCARD_THRESHOLD, "query"))
+            lookups = len(token_sets) / (time.perf_counter() - start)
+            print(f"{added:>10} {ingest:>10.0f} {lookups:>10.0f} {found:>9}/{len(queries)}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
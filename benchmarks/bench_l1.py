@@ -0,0 +1,71 @@
+"""Benchmark L1 novelty matching against history size.
+
+Compares the brute-force `max(_jaccard_similarity(...))` scan with `JaccardIndex`
+on synthetic claims drawn from a Zipfian vocabulary. The length, prefix and
+count filters skip most of the history, so the index costs a small fraction of
+the scan; it is not flat, though: the postings of common tokens grow with the
+history, and the per-claim cost still rises roughly linearly, only with a much
+smaller slope than the scan's. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_l1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from itertools import accumulate
+
+from dr.matching import JaccardIndex
+from dr.score import JACCARD_THRESHOLD, _jaccard_similarity, _token_set
+
+
+_VOCAB = [f"term{i}" for i in range(5000)]
+# Zipfian word frequencies (weight 1/rank), as in real text: a few tokens appear in
+# a large share of claims, so their postings grow with the history.
+_CUM_WEIGHTS = list(accumulate(1.0 / rank for rank in range(1, len(_VOCAB) + 1)))
+
+
+def _synthetic_claims(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(_VOCAB, cum_weights=_CUM_WEIGHTS, k=rng.randint(6, 14))) for _ in range(n)]
+
+
+def _time_brute_force(history: list[str], queries: list[str]) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        max(_jaccard_similarity(q, seen) for seen in history)
+    return time.perf_counter() - start
+
+
+def _time_index(history: list[str], queries: list[str]) -> float:
+    index = JaccardIndex(JACCARD_THRESHOLD, _token_set)
+    index.update(history)
+    start = time.perf_counter()
+    for q in queries:
+        index.matches(q)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated history sizes")
+    p.add_argument("--queries", type=int, default=50, help="Claims checked per history size")
+    p.add_argument("--brute-force-max", type=int, default=5000, help="Skip brute force above this history size")
+    args = p.parse_args()
+
+    queries = _synthetic_claims(args.queries, seed=1)
+    print(f"{'history':>8} {'brute_ms/claim':>15} {'index_ms/claim':>15} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        history = _synthetic_claims(size)
+        indexed = _time_index(history, queries) / len(queries) * 1000
+        if size <= args.brute_force_max:
+            brute = _time_brute_force(history, queries) / len(queries) * 1000
+            print(f"{size:>8} {brute:>15.3f} {indexed:>15.3f} {brute / max(indexed, 1e-9):>7.1f}x")
+        else:
+            print(f"{size:>8} {'-':>15} {indexed:>15.3f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
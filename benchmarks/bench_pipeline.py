@@ -0,0 +1,88 @@
+"""Measure embedding prefetch against a stub Ollama server with fixed latency.
+
+Scores a synthetic transcript (benchmarks/synth.py) three ways: lexical only
+(no embeddings), embeddings fetched round by round (`--prefetch 0`), and
+embeddings prefetched ahead of the round being scored. With prefetch the total
+should approach max(network, CPU) rather than their sum. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --rounds 300 --latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dr.score import CLAIM_CACHE, IncrementalScorer
+from dr.semantic import EmbeddingConfig, embedding_client
+
+from synth import generate_transcript
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus delayed
+    # ACKs add ~40ms per keep-alive request and swamp the configured latency.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.server.latency)
+        vectors = [[float(len(p) % 7), float(sum(map(ord, p)) % 11), 1.0] for p in payload["input"]]
+        data = json.dumps({"embeddings": vectors}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _run(rounds: list, config: EmbeddingConfig | None, prefetch: int) -> float:
+    CLAIM_CACHE.clear()
+    scorer = IncrementalScorer(embedding_config=config, keep_rounds=False, profile=False)
+    start = time.perf_counter()
+    for _ in scorer.add_rounds(rounds, prefetch=prefetch):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rounds", type=int, default=300)
+    p.add_argument("--claims-per-round", type=int, default=6)
+    p.add_argument("--latency-ms", type=float, default=5.0, help="Stub server delay per request")
+    p.add_argument("--prefetch", type=int, default=4)
+    args = p.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.latency = args.latency_ms / 1000.0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    config = EmbeddingConfig(url=f"http://{host}:{port}", model="stub", concurrency=1)
+
+    rounds = generate_transcript(rounds=args.rounds, claims_per_round=args.claims_per_round)["rounds"]
+    try:
+        lexical = _run(rounds, None, 0)
+        sequential = _run(rounds, config, 0)
+        pipelined = _run(rounds, config, args.prefetch)
+    finally:
+        embedding_client(config).close()
+        server.shutdown()
+
+    network = args.rounds * args.latency_ms / 1000.0
+    print(f"{args.rounds} rounds, {args.latency_ms:g}ms per embedding request")
+    print(f"lexical only        {lexical * 1000:9.1f}ms")
+    print(f"network (serial)    {network * 1000:9.1f}ms  (one request per round)")
+    print(f"sequential          {sequential * 1000:9.1f}ms")
+    print(f"prefetch {args.prefetch:<2}         {pipelined * 1000:9.1f}ms  ({sequential / pipelined:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
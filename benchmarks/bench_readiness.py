@@ -0,0 +1,97 @@
+"""Micro-benchmark the readiness heuristics on the livefire transcripts.
+
+Times `_compute_readiness` for every livefire round (repeated `--repeat`
+times, as in a long loop or a nightly re-score) against the original
+per-keyword substring scans. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_readiness.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import string
+import time
+from pathlib import Path
+
+from dr import score
+from dr.io import load_transcript
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+# The pre-compilation heuristics, kept here as the baseline to compare against.
+def _legacy_is_specific_action(action: str) -> bool:
+    lowered = action.strip().lower()
+    if not lowered:
+        return False
+    if any(lowered.startswith(prefix) for prefix in score.VAGUE_PREFIXES):
+        return False
+    if any(marker in lowered for marker in score.VAGUE_MARKERS):
+        return False
+    words = lowered.split()
+    has_verb = any(word.strip(string.punctuation) in score.IMPERATIVE_VERBS for word in words)
+    has_concrete_artifact = bool(
+        re.search(r"https?://|\b(pr|branch|file|url|command|tool)\b|\b\w+\.\w+\b|[/`$]", lowered)
+    )
+    if len(words) < 5 and not has_verb:
+        return False
+    return has_verb or has_concrete_artifact
+
+
+def _legacy_next_actions_score(next_actions) -> float:
+    if not isinstance(next_actions, list):
+        return 0.0
+    actions = [a for a in next_actions if isinstance(a, str) and a.strip()]
+    if not actions:
+        return 0.0
+    specific_actions = [a for a in actions if _legacy_is_specific_action(a)]
+    if not specific_actions:
+        return 0.3
+    has_ownership_language = any(marker in a.lower() for a in actions for marker in score.OWNERSHIP_MARKERS)
+    if len(specific_actions) >= 2 and has_ownership_language:
+        return 1.0
+    return 0.7
+
+
+def _legacy_blocker_score(open_questions, next_actions) -> float:
+    texts = []
+    if isinstance(open_questions, list):
+        texts.extend(q for q in open_questions if isinstance(q, str))
+    if isinstance(next_actions, list):
+        texts.extend(a for a in next_actions if isinstance(a, str))
+    haystack = "\n".join(texts).lower()
+    return 0.0 if any(keyword in haystack for keyword in score.BLOCKER_KEYWORDS) else 1.0
+
+
+def _time(outputs: list, next_actions_score, blocker_score) -> float:
+    start = time.perf_counter()
+    for o in outputs:
+        next_actions_score(o.get("next_actions"))
+        blocker_score(o.get("open_questions"), o.get("next_actions"))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--repeat", type=int, default=200, help="Times to replay the livefire rounds")
+    args = p.parse_args()
+
+    outputs = []
+    for path in sorted((ROOT / "examples" / "livefire").glob("*.json")):
+        outputs.extend(r["outputs"] for r in load_transcript(path)["rounds"])
+    outputs *= args.repeat
+
+    legacy = _time(outputs, _legacy_next_actions_score, _legacy_blocker_score)
+    score._text_features.cache_clear()
+    compiled = _time(outputs, score._next_actions_score, score._blocker_score)
+    info = score._text_features.cache_info()
+    print(f"rounds scored:   {len(outputs)}")
+    print(f"legacy scans:    {legacy * 1e6 / len(outputs):8.2f} us/round")
+    print(f"compiled+cached: {compiled * 1e6 / len(outputs):8.2f} us/round ({legacy / compiled:.1f}x)")
+    print(f"feature cache:   {info.hits} hits / {info.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
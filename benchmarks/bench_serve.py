@@ -0,0 +1,97 @@
+"""Measure per-round latency of `dr serve` for appended rounds.
+
+Starts `dr serve` on a free localhost port in a separate process, then POSTs a
+synthetic transcript (benchmarks/synth.py) to `/conversations/{id}/rounds` one
+round at a time over a single keep-alive connection, as a live agent loop
+would. Reports the median, p90, p99 and max round trip in milliseconds, which
+includes HTTP parsing and JSON encoding on both ends as well as scoring. Run
+from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_serve.py --rounds 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from synth import generate_transcript
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1.0)
+            conn.request("GET", "/healthz")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rounds", type=int, default=1000)
+    p.add_argument("--claims-per-round", type=int, default=6)
+    args = p.parse_args()
+
+    rounds = generate_transcript(rounds=args.rounds, claims_per_round=args.claims_per_round)["rounds"]
+    port = _free_port()
+    env = {k: v for k, v in os.environ.items() if not k.startswith("DR_")}
+    env["PYTHONPATH"] = str(ROOT / "src")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "dr.cli", "serve", "--port", str(port)], cwd=ROOT, env=env, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_ready(port)
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        headers = {"Content-Type": "application/json"}
+        latencies = []
+        for r in rounds:
+            body = json.dumps(r).encode("utf-8")
+            start = time.perf_counter()
+            conn.request("POST", "/conversations/bench/rounds", body=body, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            if resp.status != 200:
+                raise SystemExit(f"round {r.get('round')}: HTTP {resp.status}")
+        conn.close()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print(f"{args.rounds} rounds, {args.claims_per_round} claims per round, one keep-alive connection")
+    print(
+        f"median={statistics.median(latencies):.3f}ms  p90={_percentile(latencies, 0.9):.3f}ms  "
+        f"p99={_percentile(latencies, 0.99):.3f}ms  max={max(latencies):.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
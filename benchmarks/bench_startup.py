@@ -0,0 +1,58 @@
+"""Time cold `dr stop` invocations, as run by `bin/dr-stop-ship` in a shell loop.
+
+Each run is a fresh interpreter, so this measures import cost plus scoring one
+small transcript; a bare `python -c pass` is reported as the floor. Exits 1 when
+the median `dr stop` exceeds `--budget-ms` (default 100ms; it measures ~60ms
+locally against ~15ms for bare python). Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_startup.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET_MS = 100.0
+
+
+def _time_runs(argv: list[str], runs: int, env: dict[str, str]) -> list[float]:
+    out: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, check=True)
+        out.append((time.perf_counter() - start) * 1000.0)
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--transcript", default="examples/transcript.meeting-stop.json")
+    ap.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="fail when median dr stop exceeds this")
+    args = ap.parse_args()
+
+    env = {k: v for k, v in os.environ.items() if k != "DR_OLLAMA_URL"}
+    env["PYTHONPATH"] = str(ROOT / "src")
+    cases = {
+        "python -c pass": [sys.executable, "-c", "pass"],
+        "dr stop": [sys.executable, "-m", "dr.cli", "stop", args.transcript],
+    }
+    medians = {}
+    for name, argv in cases.items():
+        times = _time_runs(argv, args.runs, env)
+        medians[name] = statistics.median(times)
+        print(f"{name:16s} median={medians[name]:7.1f}ms  min={min(times):7.1f}ms  runs={args.runs}")
+    if medians["dr stop"] > args.budget_ms:
+        print(f"dr stop median {medians['dr stop']:.1f}ms exceeds budget {args.budget_ms:.1f}ms", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure schema-validation overhead relative to parsing and scoring.
+
+Writes a synthetic JSONL trace and the equivalent JSON transcript, then times
+parsing alone, parsing plus `dr.schema` validation, and scoring. Run from the
+repo root:
+
+    PYTHONPATH=src python benchmarks/bench_validate.py --rounds 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from dr.io import _iter_jsonl_events
+from dr.schema import validate_path, validate_transcript
+from dr.score import score_path
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rounds", type=int, default=5_000)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    rng = random.Random(args.seed)
+    rounds = [
+        {
+            "round": i,
+            "outputs": {
+                "claims": [f"k{rng.randrange(10**9)} q{rng.randrange(10**9)}" for _ in range(5)],
+                "open_questions": ["Who owns the rollout?"],
+                "next_actions": ["Run the migration in staging"],
+                "citations": [{"url": f"https://example.com/{i}"}],
+            },
+        }
+        for i in range(1, args.rounds + 1)
+    ]
+    header = {"version": "0.1", "conversation_id": "bench", "topic": "validation"}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl = Path(tmpdir) / "trace.jsonl"
+        with jsonl.open("w", encoding="utf-8") as fh:
+            fh.write(json.dumps({"type": "transcript_header", **header}) + "\n")
+            for r in rounds:
+                fh.write(json.dumps({"type": "round", **r}) + "\n")
+        doc = json.dumps({**header, "rounds": rounds})
+
+        parse_jsonl = _best_of(lambda: sum(1 for _ in _iter_jsonl_events(jsonl)), args.repeat)
+        validate_jsonl = _best_of(lambda: validate_path(jsonl), args.repeat)
+        parse_json = _best_of(lambda: json.loads(doc), args.repeat)
+        parsed = json.loads(doc)
+        validate_json = _best_of(lambda: validate_transcript(parsed), args.repeat)
+        score = _best_of(lambda: score_path(jsonl), 1)
+
+    print(f"{args.rounds} rounds")
+    print(f"jsonl parse            {parse_jsonl * 1000:9.1f}ms")
+    print(f"jsonl parse+validate   {validate_jsonl * 1000:9.1f}ms  (+{(validate_jsonl / parse_jsonl - 1) * 100:.0f}% over parsing)")
+    print(f"json parse             {parse_json * 1000:9.1f}ms")
+    print(f"json validate (parsed) {validate_json * 1000:9.1f}ms  ({validate_json / parse_json * 100:.0f}% of parsing)")
+    print(f"score                  {score * 1000:9.1f}ms  (validation pass = {validate_jsonl / score * 100:.0f}% of scoring)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark claim-versus-history cosine similarity.
+
+Compares a per-pair `cosine_similarity` loop with `VectorMatrix` on each
+available backend. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/bench_vectors.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from dr.semantic import cosine_similarity
+from dr.vectors import BACKENDS, VectorMatrix, _np
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--dim", type=int, default=768)
+    p.add_argument("--claims", type=int, default=50, help="Claims per round (queries)")
+    p.add_argument("--sizes", default="100,1000,5000", help="Comma-separated history sizes")
+    args = p.parse_args()
+
+    rng = random.Random(0)
+    queries = [[rng.gauss(0, 1) for _ in range(args.dim)] for _ in range(args.claims)]
+    backends = [b for b in BACKENDS if b != "numpy" or _np is not None]
+    print(f"{'history':>8} {'loop_s':>9} " + " ".join(f"{b + '_s':>9}" for b in backends))
+    for size in (int(s) for s in args.sizes.split(",")):
+        history = [[rng.gauss(0, 1) for _ in range(args.dim)] for _ in range(size)]
+        start = time.perf_counter()
+        for q in queries:
+            max(cosine_similarity(q, h) for h in history)
+        loop = time.perf_counter() - start
+
+        timings = []
+        for backend in backends:
+            matrix = VectorMatrix(backend=backend)
+            matrix.extend(history)
+            start = time.perf_counter()
+            matrix.max_similarities(queries)
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>8} {loop:>9.3f} " + " ".join(f"{t:>9.3f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Report how often the MinHash L1 backend disagrees with exact Jaccard.
+
+Checks every claim in `examples/calibration` and `examples/livefire` (or the
+paths given) and prints per-file and total disagreement counts. Run from the
+repo root:
+
+    PYTHONPATH=src python benchmarks/l1_agreement.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from dr.io import load_transcript
+from dr.matching import JaccardIndex, MinHashIndex
+from dr.score import JACCARD_THRESHOLD, _normalized_round_claims, _token_set
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CORPORA = [ROOT / "examples" / "calibration", ROOT / "examples" / "livefire"]
+
+
+def l1_disagreements(transcript: dict, threshold: float = JACCARD_THRESHOLD) -> tuple[int, int]:
+    """Return (disagreeing claim decisions, total claim decisions) for one transcript."""
+
+    exact = JaccardIndex(threshold, _token_set)
+    approx = MinHashIndex(threshold, _token_set)
+    disagreements = 0
+    total = 0
+    for r in transcript.get("rounds") or []:
+        claims = _normalized_round_claims((r.get("outputs") or {}).get("claims") or [])
+        for claim in claims:
+            total += 1
+            if exact.matches(claim) != approx.matches(claim):
+                disagreements += 1
+        exact.update(claims)
+        approx.update(claims)
+    return disagreements, total
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("paths", nargs="*", type=Path, default=DEFAULT_CORPORA, help="Transcript files or directories")
+    args = p.parse_args()
+
+    files: list[Path] = []
+    for path in args.paths:
+        files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+
+    all_disagreements = 0
+    all_total = 0
+    for path in files:
+        disagreements, total = l1_disagreements(load_transcript(path))
+        all_disagreements += disagreements
+        all_total += total
+        print(f"{path.name}: {disagreements}/{total} claims disagree")
+    rate = all_disagreements / all_total if all_total else 0.0
+    print(f"TOTAL: {all_disagreements}/{all_total} claims disagree ({rate:.2%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Benchmark suite: throughput across transcript sizes, with a regression gate.
+
+For each size in `--sizes` a synthetic transcript (benchmarks/synth.py) is
+written as JSON and JSONL, then these cases are timed (best of `--repeat`):
+
+    load_json, load_jsonl   dr.io.load_transcript
+    novelty                 the L0/L1 novelty loop (normalize, exact set, L1 index)
+    readiness               _compute_readiness over consecutive rounds
+    score                   score_transcript on the loaded transcript
+    cli                     `python -m dr.cli score trace.jsonl` end to end
+
+Results are JSON (stdout, or `--output`). With `--baseline FILE` any case whose
+rounds/s falls more than `--max-regression` below the baseline fails the run
+(exit 1). Throughputs are scaled by a fixed pure-Python calibration loop timed
+on both machines, so a baseline recorded elsewhere is roughly comparable; for a
+strict check record the baseline on the same machine. Run from the repo root:
+
+    PYTHONPATH=src python benchmarks/suite.py --baseline benchmarks/baseline.json
+    PYTHONPATH=src python benchmarks/suite.py --update-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from dr import score
+from dr.io import load_transcript
+from dr.matching import make_l1_index
+
+from synth import add_params_arguments, generate_transcript, params_from_args, write_transcript
+
+ROOT = Path(__file__).resolve().parents[1]
+CASES = ("load_json", "load_jsonl", "novelty", "readiness", "score", "cli")
+RESULTS_VERSION = 1
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate() -> float:
+    """Seconds for a fixed interpreter-bound workload (dict/str/set churn, like scoring)."""
+
+    def work() -> None:
+        seen: Dict[str, int] = {}
+        for i in range(200_000):
+            key = f"claim {i % 5000}"
+            seen[key] = seen.get(key, 0) + 1
+        set(k.split()[1] for k in seen)
+
+    return _best_of(work, 5)
+
+
+def _novelty_loop(rounds: List[Dict[str, Any]], l1_backend: str) -> None:
+    score.CLAIM_CACHE.clear()
+    seen_l0: set = set()
+    seen_l1 = make_l1_index(l1_backend, score.JACCARD_THRESHOLD, score.CLAIM_CACHE.token_ids)
+    for r in rounds:
+        claims = score._normalized_round_claims(r["outputs"]["claims"])
+        [c for c in claims if c not in seen_l0]
+        [c for c in claims if not seen_l1.matches(c)]
+        seen_l0.update(claims)
+        seen_l1.update(claims)
+
+
+def _readiness_loop(rounds: List[Dict[str, Any]]) -> None:
+    score._text_features.cache_clear()
+    previous = None
+    for r in rounds:
+        score._compute_readiness(r["outputs"], previous)
+        previous = r["outputs"]
+
+
+def _score(transcript: Dict[str, Any], l1_backend: str) -> None:
+    score.CLAIM_CACHE.clear()
+    score._text_features.cache_clear()
+    score.score_transcript(transcript, l1_backend=l1_backend)
+
+
+def _cli(path: Path, l1_backend: str) -> None:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(ROOT / "src")
+    env.pop("DR_OLLAMA_URL", None)
+    subprocess.run(
+        [sys.executable, "-m", "dr.cli", "score", str(path), "--l1-backend", l1_backend],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+def run_suite(
+    sizes: List[int], params_for: Callable[[int], Any], cases: List[str], repeat: int, l1_backend: str
+) -> Dict[str, Any]:
+    calibration = calibrate()
+    results = []
+    params = None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for rounds in sizes:
+            params = params_for(rounds)
+            transcript = generate_transcript(params)
+            json_path = write_transcript(transcript, Path(tmpdir) / f"synthetic-{rounds}.json")
+            jsonl_path = write_transcript(transcript, Path(tmpdir) / f"synthetic-{rounds}.jsonl")
+            loaded = load_transcript(json_path)
+            timers = {
+                "load_json": lambda: load_transcript(json_path),
+                "load_jsonl": lambda: load_transcript(jsonl_path),
+                "novelty": lambda: _novelty_loop(loaded["rounds"], l1_backend),
+                "readiness": lambda: _readiness_loop(loaded["rounds"]),
+                "score": lambda: _score(loaded, l1_backend),
+                "cli": lambda: _cli(jsonl_path, l1_backend),
+            }
+            for case in cases:
+                seconds = _best_of(timers[case], repeat)
+                results.append(
+                    {
+                        "case": case,
+                        "rounds": rounds,
+                        "seconds": round(seconds, 6),
+                        "rounds_per_s": round(rounds / seconds, 1),
+                    }
+                )
+    meta = {k: v for k, v in asdict(params).items() if k != "rounds"} if params else {}
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "l1_backend": l1_backend,
+        "repeat": repeat,
+        # Best of before and after, so a burst of load on either side does not skew it.
+        "calibration_s": round(min(calibration, calibrate()), 6),
+        "params": meta,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[Tuple[str, int, str]]:
+    """Return `(case, rounds, message)` for each result whose throughput regressed past `max_regression`.
+
+    Baseline throughput is first scaled by the ratio of calibration times, so a
+    slower machine is not reported as a regression. Cases missing from either
+    side are skipped.
+    """
+
+    scale = baseline.get("calibration_s", 1.0) / current.get("calibration_s", 1.0)
+    previous = {(r["case"], r["rounds"]): r["rounds_per_s"] for r in baseline.get("results", [])}
+    failures = []
+    for r in current["results"]:
+        key = (r["case"], r["rounds"])
+        if key not in previous:
+            continue
+        expected = previous[key] * scale
+        if r["rounds_per_s"] < expected * (1.0 - max_regression):
+            drop = 1.0 - r["rounds_per_s"] / expected
+            failures.append(
+                (
+                    r["case"],
+                    r["rounds"],
+                    f"{r['case']} @ {r['rounds']} rounds: {r['rounds_per_s']:.1f} rounds/s, "
+                    f"{drop:.0%} below baseline {expected:.1f} (allowed {max_regression:.0%})",
+                )
+            )
+    return failures
+
+
+def merge_best(current: Dict[str, Any], rerun: Dict[str, Any]) -> None:
+    """Keep the faster of each (case, rounds) measurement from `current` and `rerun`."""
+
+    best = {(r["case"], r["rounds"]): r for r in rerun["results"]}
+    for i, r in enumerate(current["results"]):
+        other = best.get((r["case"], r["rounds"]))
+        if other is not None and other["rounds_per_s"] > r["rounds_per_s"]:
+            current["results"][i] = other
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", default="100,1000,5000", help="Comma-separated round counts")
+    p.add_argument("--cases", default=",".join(CASES), help=f"Comma-separated subset of {', '.join(CASES)}")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--l1-backend", choices=["exact", "minhash"], default="exact")
+    add_params_arguments(p)
+    p.add_argument("--output", help="Write results JSON here instead of stdout")
+    p.add_argument("--baseline", help="Results JSON to compare against")
+    p.add_argument("--max-regression", type=float, default=0.25, help="Allowed throughput drop (fraction)")
+    p.add_argument(
+        "--retries", type=int, default=2, help="Re-measure regressed cases this many times before failing (noisy hosts)"
+    )
+    p.add_argument("--update-baseline", metavar="FILE", help="Write this run's results as the new baseline")
+    args = p.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        p.error(f"unknown case(s): {', '.join(unknown)}")
+
+    def params_for(rounds: int) -> Any:
+        return params_from_args(args, rounds)
+
+    current = run_suite(sizes, params_for, cases, args.repeat, args.l1_backend)
+    failures = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        failures = compare(current, baseline, args.max_regression)
+        for _ in range(args.retries):
+            if not failures:
+                break
+            for case, rounds, _message in failures:
+                merge_best(current, run_suite([rounds], params_for, [case], args.repeat, args.l1_backend))
+            failures = compare(current, baseline, args.max_regression)
+
+    text = json.dumps(current, indent=2) + "\n"
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    if args.update_baseline:
+        Path(args.update_baseline).write_text(text, encoding="utf-8")
+
+    if args.baseline:
+        for _case, _rounds, message in failures:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if failures:
+            raise SystemExit(1)
+        print(f"no regressions beyond {args.max_regression:.0%} vs {args.baseline}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
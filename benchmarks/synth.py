@@ -0,0 +1,184 @@
+"""Seeded synthetic transcript generator for the benchmark suite.
+
+Transcripts are schema-valid v0.1 documents whose shape is controlled by a few
+knobs: rounds, claims per round, how often a claim paraphrases an earlier one
+(reworded, so L0 sees it as new and L1 as a repeat), how fast the open-question
+list grows, and how often a round reports a blocker. The same parameters and
+seed always produce the same transcript. Write one to disk from the repo root:
+
+    PYTHONPATH=src python benchmarks/synth.py --rounds 1000 -o /tmp/synthetic.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+_CONSONANTS = "bdfgklmnprtvz"
+_VOWELS = "aeiou"
+_SYLLABLES = [c + v for c in _CONSONANTS for v in _VOWELS]
+# Filler words are all Jaccard stopwords, so swapping them rewords a claim
+# without changing its L1 token set.
+_FILLER = ("the", "a", "is", "of", "for", "in", "on", "by", "with", "and", "to")
+
+
+def word(i: int) -> str:
+    """The i-th pseudo-word: three or more CV syllables, so never a stopword or stemmed."""
+
+    parts = []
+    for _ in range(3):
+        i, s = divmod(i, len(_SYLLABLES))
+        parts.append(_SYLLABLES[s])
+    while i:
+        i, s = divmod(i - 1, len(_SYLLABLES))
+        parts.append(_SYLLABLES[s])
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class SynthParams:
+    rounds: int = 1000
+    claims_per_round: int = 6
+    # Fraction of claims (after round 1) that reword an earlier claim.
+    paraphrase_rate: float = 0.3
+    # Open questions added per round (fractional values accumulate); 0 keeps the list flat.
+    question_growth: float = 0.05
+    # Probability that a round lists a blocker among its open questions.
+    blocker_rate: float = 0.1
+    # Content words per claim and the vocabulary they are drawn from. A small
+    # vocabulary makes claims share tokens, which is the L1 index's worst case.
+    words_per_claim: int = 4
+    vocabulary: int = 50_000
+    seed: int = 0
+
+
+def _fresh_claim(rng: random.Random, p: SynthParams) -> List[str]:
+    return [word(rng.randrange(p.vocabulary)) for _ in range(p.words_per_claim)]
+
+
+def _render(rng: random.Random, content: List[str]) -> str:
+    words = content[:]
+    rng.shuffle(words)
+    out = []
+    for w in words:
+        out.append(w)
+        out.append(rng.choice(_FILLER))
+    return " ".join(out[:-1]).capitalize() + "."
+
+
+def _next_actions(rng: random.Random, i: int) -> List[str]:
+    topic = word(rng.randrange(10_000))
+    if rng.random() < 0.5:
+        return [f"Run pytest on src/{topic}.py", f"I will update docs/{topic}.md by round {i + 1}"]
+    return [f"Consider looking into {topic}"]
+
+
+def generate_transcript(params: SynthParams | None = None, **overrides: Any) -> Dict[str, Any]:
+    """Build a transcript dict; keyword overrides replace fields of `params`."""
+
+    p = SynthParams(**{**asdict(params or SynthParams()), **overrides})
+    if p.rounds < 1 or p.claims_per_round < 1 or p.words_per_claim < 1 or p.vocabulary < 1:
+        raise ValueError("rounds, claims_per_round, words_per_claim and vocabulary must be >= 1.")
+    for name in ("paraphrase_rate", "blocker_rate"):
+        if not 0.0 <= getattr(p, name) <= 1.0:
+            raise ValueError(f"{name} must be between 0 and 1.")
+    if p.question_growth < 0:
+        raise ValueError("question_growth must be >= 0.")
+
+    rng = random.Random(p.seed)
+    history: List[List[str]] = []
+    questions: List[str] = []
+    pending_questions = 1.0
+    rounds = []
+    for i in range(1, p.rounds + 1):
+        claims = []
+        for _ in range(p.claims_per_round):
+            if history and rng.random() < p.paraphrase_rate:
+                content = rng.choice(history)
+            else:
+                content = _fresh_claim(rng, p)
+                history.append(content)
+            claims.append(_render(rng, content))
+
+        while pending_questions >= 1.0:
+            questions.append(f"Who owns {word(rng.randrange(p.vocabulary))}?")
+            pending_questions -= 1.0
+        pending_questions += p.question_growth
+        open_questions = list(questions)
+        if rng.random() < p.blocker_rate:
+            open_questions.append(f"Blocked on access to {word(rng.randrange(p.vocabulary))}")
+
+        rounds.append(
+            {
+                "round": i,
+                "outputs": {
+                    "claims": claims,
+                    "open_questions": open_questions,
+                    "next_actions": _next_actions(rng, i),
+                },
+            }
+        )
+
+    return {
+        "version": "0.1",
+        "conversation_id": f"synthetic-{p.seed}",
+        "topic": "synthetic benchmark transcript",
+        "meta": {"generator": "benchmarks/synth.py", "params": asdict(p)},
+        "rounds": rounds,
+    }
+
+
+def write_transcript(transcript: Dict[str, Any], path: str | Path) -> Path:
+    """Write as a JSONL trace (`.jsonl`) or a single JSON document (anything else)."""
+
+    out = Path(path)
+    with out.open("w", encoding="utf-8") as fh:
+        if out.suffix == ".jsonl":
+            header = {k: v for k, v in transcript.items() if k != "rounds"}
+            fh.write(json.dumps({"type": "transcript_header", **header}) + "\n")
+            for r in transcript["rounds"]:
+                fh.write(json.dumps({"type": "round", **r}) + "\n")
+        else:
+            json.dump(transcript, fh)
+    return out
+
+
+def add_params_arguments(p: argparse.ArgumentParser) -> None:
+    defaults = SynthParams()
+    p.add_argument("--claims-per-round", type=int, default=defaults.claims_per_round)
+    p.add_argument("--paraphrase-rate", type=float, default=defaults.paraphrase_rate)
+    p.add_argument("--question-growth", type=float, default=defaults.question_growth)
+    p.add_argument("--blocker-rate", type=float, default=defaults.blocker_rate)
+    p.add_argument("--words-per-claim", type=int, default=defaults.words_per_claim)
+    p.add_argument("--vocabulary", type=int, default=defaults.vocabulary)
+    p.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def params_from_args(args: argparse.Namespace, rounds: int) -> SynthParams:
+    return SynthParams(
+        rounds=rounds,
+        claims_per_round=args.claims_per_round,
+        paraphrase_rate=args.paraphrase_rate,
+        question_growth=args.question_growth,
+        blocker_rate=args.blocker_rate,
+        words_per_claim=args.words_per_claim,
+        vocabulary=args.vocabulary,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rounds", type=int, default=SynthParams.rounds)
+    add_params_arguments(p)
+    p.add_argument("-o", "--output", required=True, help="Output path (.jsonl for a trace, else JSON)")
+    args = p.parse_args()
+    print(write_transcript(generate_transcript(params_from_args(args, args.rounds)), args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-__all__ = ["score_transcript"]
+__all__ = ["IncrementalScorer", "score_rounds", "score_transcript"]
 
-from .score import score_transcript
+from .score import IncrementalScorer, score_rounds, score_transcript
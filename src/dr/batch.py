@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .io import COMPRESSION_SUFFIXES
+from .score import score_path
+
+# JSON and JSONL may also be compressed (`trace.jsonl.gz`); packs are memory-mapped and never are.
+TRANSCRIPT_SUFFIXES = (".drpack",) + tuple(s + c for s in (".json", ".jsonl") for c in ("", *COMPRESSION_SUFFIXES))
+# Expected-output fixtures that sit next to transcripts in examples/.
+EXCLUDED_SUFFIXES = tuple(".expected.json" + c for c in ("", *COMPRESSION_SUFFIXES))
+
+
+def _is_transcript(path: Path) -> bool:
+    name = path.name.lower()
+    return name.endswith(TRANSCRIPT_SUFFIXES) and not name.endswith(EXCLUDED_SUFFIXES)
+
+
+def expand_inputs(inputs: Iterable[str], manifest: Optional[str] = None) -> List[Path]:
+    """Resolve directories, globs and a manifest into a de-duplicated, ordered file list.
+
+    - A directory contributes every `*.json` / `*.jsonl` / `*.drpack` under it, compressed
+      JSON/JSONL included (recursively, sorted), skipping `*.expected.json` fixtures.
+    - A pattern containing glob characters contributes its sorted matches.
+    - Any other path is taken as-is (missing files are reported when scored).
+    - A manifest lists one path per line (blank lines and `#` comments ignored);
+      relative paths are resolved against the manifest's directory.
+    """
+
+    raw: List[str] = list(inputs)
+    if manifest:
+        base = Path(manifest).parent
+        for line in Path(manifest).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                raw.append(line if os.path.isabs(line) else str(base / line))
+
+    out: List[Path] = []
+    seen: set[Path] = set()
+
+    def add(path: Path) -> None:
+        if path not in seen:
+            seen.add(path)
+            out.append(path)
+
+    for item in raw:
+        path = Path(item)
+        if path.is_dir():
+            for child in sorted(p for p in path.rglob("*") if p.is_file() and _is_transcript(p)):
+                add(child)
+        elif glob.has_magic(item):
+            for match in sorted(glob.glob(item, recursive=True)):
+                if Path(match).is_file():
+                    add(Path(match))
+        else:
+            add(path)
+    return out
+
+
+def score_file(path: str | Path, l1_backend: str = "exact", validate: bool = False) -> Dict[str, Any]:
+    """Score one file, returning `{"path", "result"}` or `{"path", "error"}` (never raises)."""
+
+    try:
+        return {"path": str(path), "result": score_path(path, l1_backend=l1_backend, validate=validate)}
+    except Exception as exc:  # one bad file must not abort the batch
+        return {"path": str(path), "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _score_file_args(args: tuple) -> Dict[str, Any]:
+    return score_file(*args)
+
+
+def score_batch(
+    paths: List[Path], jobs: int = 1, l1_backend: str = "exact", validate: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result record per path, in input order, scoring across `jobs` processes."""
+
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield score_file(path, l1_backend, validate)
+        return
+
+    # Large chunks amortize IPC; small enough to keep all workers busy until the end.
+    chunksize = max(1, min(64, len(paths) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_score_file_args, [(p, l1_backend, validate) for p in paths], chunksize=chunksize)
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    return json.dumps(record, sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import itertools
+import json
+from bisect import bisect_left
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .io import load_transcript
+from .matching import JaccardIndex
+from .score import (
+    CLAIM_CACHE,
+    HIGH_NOVELTY_THRESHOLD,
+    JACCARD_THRESHOLD,
+    K_LOW_NOVELTY_ESCALATE,
+    LOW_NOVELTY_THRESHOLD,
+    _classify_novelty_rate,
+    _compute_readiness,
+    _normalized_round_claims,
+    _round_float,
+    _round_outputs,
+    _stop_signal,
+)
+
+# Note: K_LOW_NOVELTY_REQUIRED is not read by the scorer, so it is not swept.
+SWEPT_PARAMS = ("jaccard_threshold", "low_novelty_threshold", "high_novelty_threshold", "k_low_novelty_escalate")
+
+
+@dataclass(frozen=True)
+class StopParams:
+    """One setting of the tunable novelty/stop constants (defaults: the shipped values)."""
+
+    jaccard_threshold: float = JACCARD_THRESHOLD
+    low_novelty_threshold: float = LOW_NOVELTY_THRESHOLD
+    high_novelty_threshold: float = HIGH_NOVELTY_THRESHOLD
+    k_low_novelty_escalate: int = K_LOW_NOVELTY_ESCALATE
+
+
+@dataclass(frozen=True)
+class RoundFeatures:
+    """Everything about a round that the swept parameters act on, computed once."""
+
+    round: Any
+    new_l0: int
+    # Each claim's highest Jaccard similarity to any claim of an earlier round, sorted.
+    prior_similarities: Tuple[float, ...]
+    has_history: bool
+    readiness_classification: str
+    blocker_present: bool
+
+
+@dataclass(frozen=True)
+class TranscriptFeatures:
+    name: str
+    rounds: Tuple[RoundFeatures, ...]
+    expected_signal: Optional[str] = None
+    recommended_stop_round: Optional[int] = None
+
+
+def _expected_signal(transcript: Dict[str, Any], path: Optional[Path]) -> Optional[str]:
+    if path is not None and path.suffix == ".json":
+        sibling = path.with_name(path.name[: -len(".json")] + ".expected.json")
+        if sibling.is_file():
+            expected = json.loads(sibling.read_text(encoding="utf-8"))
+            signal = (expected.get("stop_recommendation") or {}).get("signal")
+            if isinstance(signal, str):
+                return signal
+    inline = transcript.get("_expected")
+    if isinstance(inline, dict):
+        for key in ("stop_recommendation", "stop_signal"):
+            if isinstance(inline.get(key), str):
+                return inline[key]
+    return None
+
+
+def extract_features(transcript: Dict[str, Any], name: str = "", path: str | Path | None = None) -> TranscriptFeatures:
+    """One lexical scoring pass over `transcript`, keeping the per-round features.
+
+    Readiness does not depend on the swept parameters and L0 novelty only on the
+    claims, so both are final here; L1 is kept as each claim's maximum prior
+    similarity, which answers "is it new at threshold t?" for every t.
+    """
+
+    rounds = transcript.get("rounds")
+    if not isinstance(rounds, list) or not rounds:
+        raise ValueError("Transcript must contain a non-empty 'rounds' array.")
+
+    seen_l0: set[str] = set()
+    seen_l1 = JaccardIndex(JACCARD_THRESHOLD, CLAIM_CACHE.token_ids)
+    previous: Optional[Dict[str, Any]] = None
+    features: List[RoundFeatures] = []
+    for r in rounds:
+        outputs, raw_claims = _round_outputs(r)
+        claims = _normalized_round_claims(raw_claims)
+        has_history = bool(seen_l1)
+        similarities = tuple(sorted(seen_l1.max_similarity(c) for c in claims))
+        new_l0 = sum(1 for c in claims if c not in seen_l0)
+        seen_l0.update(claims)
+        seen_l1.update(claims)
+        readiness = _compute_readiness(outputs, previous)
+        previous = outputs
+        features.append(
+            RoundFeatures(
+                round=r.get("round"),
+                new_l0=new_l0,
+                prior_similarities=similarities,
+                has_history=has_history,
+                readiness_classification=str(readiness["readiness_classification"]),
+                blocker_present=float(readiness["blocker_score"]) == 0.0,
+            )
+        )
+
+    note = transcript.get("diminishing_returns_note")
+    stop_round = note.get("recommended_stop_round") if isinstance(note, dict) else None
+    return TranscriptFeatures(
+        name=name,
+        rounds=tuple(features),
+        expected_signal=_expected_signal(transcript, Path(path) if path is not None else None),
+        recommended_stop_round=stop_round if isinstance(stop_round, int) else None,
+    )
+
+
+def load_features(paths: Iterable[str | Path]) -> List[TranscriptFeatures]:
+    return [extract_features(load_transcript(p), name=str(p), path=p) for p in paths]
+
+
+def _new_l1_counts(rounds: Sequence[RoundFeatures], threshold: float) -> List[int]:
+    if threshold <= 0.0:
+        # JaccardIndex.matches: every claim matches once anything has been seen.
+        return [0 if f.has_history else len(f.prior_similarities) for f in rounds]
+    return [bisect_left(f.prior_similarities, threshold) for f in rounds]
+
+
+def _replay(
+    rounds: Sequence[RoundFeatures], new_l1: Sequence[int], params: StopParams
+) -> List[str]:
+    """Per-round stop signals under `params`; mirrors `IncrementalScorer.add_round`."""
+
+    low = params.low_novelty_threshold
+    high = params.high_novelty_threshold
+    k_escalate = params.k_low_novelty_escalate
+    peak_l0 = peak_l1 = 0
+    trailing_low = 0
+    trailing_low_had_high = False
+    signals = []
+    for f, n_l1 in zip(rounds, new_l1):
+        peak_l0 = max(peak_l0, f.new_l0)
+        peak_l1 = max(peak_l1, n_l1)
+        rate_l0 = f.new_l0 / max(peak_l0, 1)
+        rate_l1 = n_l1 / max(peak_l1, 1)
+        if min(rate_l0, rate_l1) < low:
+            trailing_low += 1
+            trailing_low_had_high = trailing_low_had_high or f.readiness_classification == "HIGH"
+        else:
+            trailing_low = 0
+            trailing_low_had_high = False
+        novelty_rate = _round_float(min(_round_float(rate_l0), _round_float(rate_l1)))
+        signals.append(
+            _stop_signal(
+                _classify_novelty_rate(novelty_rate, low, high),
+                f.readiness_classification,
+                f.blocker_present,
+                trailing_low,
+                trailing_low_had_high,
+                k_escalate,
+            )
+        )
+    return signals
+
+
+def _outcome(features: TranscriptFeatures, signals: List[str]) -> Dict[str, Any]:
+    stop_round = next((f.round for f, s in zip(features.rounds, signals) if s != "CONTINUE"), None)
+    return {"name": features.name, "signal": signals[-1], "stop_round": stop_round, "signals": signals}
+
+
+def evaluate(features: TranscriptFeatures, params: StopParams = StopParams()) -> Dict[str, Any]:
+    """Final signal, first non-CONTINUE round and per-round signals for one transcript."""
+
+    return _outcome(features, _replay(features.rounds, _new_l1_counts(features.rounds, params.jaccard_threshold), params))
+
+
+def _agreement(corpus: Sequence[TranscriptFeatures], outcomes: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    signal_total = signal_matches = stop_total = stop_matches = 0
+    stop_error = 0.0
+    for features, outcome in zip(corpus, outcomes):
+        if features.expected_signal is not None:
+            signal_total += 1
+            signal_matches += outcome["signal"] == features.expected_signal
+        expected_round = features.recommended_stop_round
+        if expected_round is not None:
+            stop_total += 1
+            stop_round = outcome["stop_round"]
+            stop_matches += stop_round == expected_round
+            # A transcript that never stops counts as stopping one round after its last.
+            if not isinstance(stop_round, int):
+                stop_round = len(features.rounds) + 1
+            stop_error += abs(stop_round - expected_round)
+    return {
+        "signal_matches": signal_matches,
+        "signal_total": signal_total,
+        "stop_round_matches": stop_matches,
+        "stop_round_total": stop_total,
+        "stop_round_mae": round(stop_error / stop_total, 4) if stop_total else None,
+    }
+
+
+def make_grid(**values: Sequence[Any]) -> List[StopParams]:
+    """Cartesian product of per-parameter values (unlisted ones keep their defaults).
+
+    Settings with `low_novelty_threshold > high_novelty_threshold` are dropped.
+    """
+
+    unknown = sorted(set(values) - set(SWEPT_PARAMS))
+    if unknown:
+        raise ValueError(f"Unknown calibration parameter(s): {', '.join(unknown)}")
+    if any(k < 1 for k in values.get("k_low_novelty_escalate") or ()):
+        raise ValueError("k_low_novelty_escalate values must be >= 1.")
+    defaults = asdict(StopParams())
+    axes = [list(values.get(name) or [defaults[name]]) for name in SWEPT_PARAMS]
+    grid = []
+    for combo in itertools.product(*axes):
+        params = StopParams(*combo)
+        if params.low_novelty_threshold <= params.high_novelty_threshold:
+            grid.append(params)
+    return grid
+
+
+def _novelty_rates(rounds: Sequence[RoundFeatures], new_l1: Sequence[int]) -> List[Tuple[float, float]]:
+    """Per round: min(L0, L1) novelty rate, raw (drives the streak) and as rounded for classification."""
+
+    peak_l0 = peak_l1 = 0
+    rates = []
+    for f, n_l1 in zip(rounds, new_l1):
+        peak_l0 = max(peak_l0, f.new_l0)
+        peak_l1 = max(peak_l1, n_l1)
+        rate_l0 = f.new_l0 / max(peak_l0, 1)
+        rate_l1 = n_l1 / max(peak_l1, 1)
+        rates.append((min(rate_l0, rate_l1), _round_float(min(_round_float(rate_l0), _round_float(rate_l1)))))
+    return rates
+
+
+def _k_profile(
+    rounds: Sequence[RoundFeatures], rates: Sequence[Tuple[float, float]], low: float
+) -> Tuple[Optional[int], Dict[int, int], str, int]:
+    """Everything the K-escalation override needs, for one (Jaccard, low) pair.
+
+    Returns the first round index whose decision-matrix signal (before the K
+    override) is not CONTINUE, the first index at which the trailing low-novelty
+    streak (without a HIGH-readiness round) reaches each length, and the last
+    round's pre-override signal and streak. HIGH and MEDIUM novelty both mean
+    CONTINUE, so `high_novelty_threshold` plays no part (given low <= high).
+    """
+
+    trailing_low = 0
+    trailing_low_had_high = False
+    first_stop: Optional[int] = None
+    first_streak: Dict[int, int] = {}
+    longest = 0
+    signal = "CONTINUE"
+    streak = 0
+    for i, (f, (rate, rounded_rate)) in enumerate(zip(rounds, rates)):
+        if rate < low:
+            trailing_low += 1
+            trailing_low_had_high = trailing_low_had_high or f.readiness_classification == "HIGH"
+        else:
+            trailing_low = 0
+            trailing_low_had_high = False
+        streak = 0 if trailing_low_had_high else trailing_low
+        while longest < streak:
+            longest += 1
+            first_streak[longest] = i
+        if rounded_rate < low:
+            signal = "ESCALATE" if f.readiness_classification == "LOW" or f.blocker_present else "SHIP"
+        else:
+            signal = "CONTINUE"
+        if first_stop is None and signal != "CONTINUE":
+            first_stop = i
+    return first_stop, first_streak, signal, streak
+
+
+def sweep(corpus: Sequence[TranscriptFeatures], grid: Iterable[StopParams]) -> List[Dict[str, Any]]:
+    """Agreement with the corpus's expectations for every setting, best first.
+
+    Nothing is rescored: L1 counts and novelty rates are derived once per distinct
+    Jaccard threshold from the cached prior similarities, one pass per (Jaccard, low) pair builds a
+    `_k_profile` per transcript, and each (Jaccard, low, K) is then O(1) per
+    transcript; settings differing only in the high threshold share that result.
+    Results match `evaluate` setting by setting. Rows are sorted by signal plus
+    stop-round matches (descending), then stop-round MAE; ties keep grid order.
+    """
+
+    rates_cache: Dict[float, List[List[Tuple[float, float]]]] = {}
+    profile_cache: Dict[Tuple[float, float], List[Tuple[Optional[int], Dict[int, int], str, int]]] = {}
+    agreement_cache: Dict[Tuple[float, float, int], Dict[str, Any]] = {}
+    rows = []
+    for params in grid:
+        threshold = params.jaccard_threshold
+        k = params.k_low_novelty_escalate
+        key = (threshold, params.low_novelty_threshold)
+        agreement = agreement_cache.get(key + (k,))
+        if agreement is not None:
+            rows.append({"params": dict(vars(params)), **agreement})
+            continue
+        profiles = profile_cache.get(key)
+        if profiles is None:
+            per_transcript = rates_cache.get(threshold)
+            if per_transcript is None:
+                per_transcript = rates_cache[threshold] = [
+                    _novelty_rates(f.rounds, _new_l1_counts(f.rounds, threshold)) for f in corpus
+                ]
+            profiles = profile_cache[key] = [
+                _k_profile(f.rounds, rates, params.low_novelty_threshold) for f, rates in zip(corpus, per_transcript)
+            ]
+
+        outcomes = []
+        for f, (first_stop, first_streak, last_signal, last_streak) in zip(corpus, profiles):
+            stops = [i for i in (first_stop, first_streak.get(k)) if i is not None]
+            outcomes.append(
+                {
+                    "signal": "ESCALATE" if last_streak >= k else last_signal,
+                    "stop_round": f.rounds[min(stops)].round if stops else None,
+                }
+            )
+        agreement = agreement_cache[key + (k,)] = _agreement(corpus, outcomes)
+        rows.append({"params": dict(vars(params)), **agreement})
+
+    def rank(row: Dict[str, Any]) -> Tuple[int, float]:
+        mae = row["stop_round_mae"]
+        return (-(row["signal_matches"] + row["stop_round_matches"]), mae if mae is not None else 0.0)
+
+    rows.sort(key=rank)
+    return rows
+
+
+def calibrate(corpus: Sequence[TranscriptFeatures], grid: Iterable[StopParams], top: int = 10) -> Dict[str, Any]:
+    """`sweep` the grid plus the current defaults; the `dr calibrate --format json` document.
+
+    `results` holds the best `top` rows (all if `top` is 0); `default` is the row
+    for `StopParams()` with its 1-based `rank`.
+    """
+
+    default = StopParams()
+    grid = list(grid)
+    if default not in grid:
+        grid.append(default)
+    rows = sweep(corpus, grid)
+    rank = next(i for i, row in enumerate(rows) if row["params"] == asdict(default))
+    return {
+        "transcripts": len(corpus),
+        "settings": len(rows),
+        "default": dict(rows[rank], rank=rank + 1),
+        "results": rows[:top] if top > 0 else rows,
+    }
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    """A `calibrate` report as the `dr calibrate` text table; the defaults' row is always listed."""
+
+    default = report["default"]
+    shown = list(report["results"])
+    if not any(row["params"] == default["params"] for row in shown):
+        shown.append(default)
+    lines = [
+        f"{report['settings']} settings over {report['transcripts']} transcripts "
+        f"({default['signal_total']} with an expected signal, "
+        f"{default['stop_round_total']} with a recommended stop round)",
+        f"{'signal':>7} {'stop':>7} {'mae':>6}  {'jaccard':>7} {'low':>5} {'high':>5} {'k':>2}",
+    ]
+    for row in shown:
+        params = row["params"]
+        mae = "-" if row["stop_round_mae"] is None else f"{row['stop_round_mae']:.2f}"
+        label = f"  (current defaults, rank {default['rank']})" if params == default["params"] else ""
+        lines.append(
+            f"{row['signal_matches']:>3}/{row['signal_total']:<3} {row['stop_round_matches']:>3}/{row['stop_round_total']:<3} "
+            f"{mae:>6}  {params['jaccard_threshold']:>7.2f} {params['low_novelty_threshold']:>5.2f} "
+            f"{params['high_novelty_threshold']:>5.2f} {params['k_low_novelty_escalate']:>2}{label}"
+        )
+    return "\n".join(lines)
+
+
+def parse_values(spec: str, cast: type = float) -> List[Any]:
+    """Parse `a,b,c` or an inclusive range `start:stop:step` into a list of values."""
+
+    if ":" in spec:
+        parts = spec.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Expected START:STOP:STEP, got {spec!r}")
+        start, stop, step = (cast(p) for p in parts)
+        if step <= 0:
+            raise ValueError(f"Step must be positive in {spec!r}")
+        count = int(round((stop - start) / step)) + 1
+        values = [start + i * step for i in range(count)]
+        return [round(v, 6) if cast is float else v for v in values]
+    return [cast(v) for v in spec.split(",") if v.strip()]
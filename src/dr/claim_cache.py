@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def token_id(token: str) -> int:
+    """Stable 64-bit ID for a canonical token.
+
+    Derived from the token text (BLAKE2b) rather than assigned in arrival order, so
+    IDs agree across processes and runs, and the vocabulary cache can evict freely
+    without invalidating IDs already stored in an index. It is also the token hash
+    `MinHashIndex` uses, so MinHash signatures do not change when given IDs.
+    """
+
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class ClaimCache:
+    """Bounded memo for claim normalization and canonical tokenization.
+
+    Agents repeat claims verbatim, so the same strings are normalized and
+    tokenized round after round. This caches raw text -> normalized text and
+    text -> frozenset of token IDs (see `token_id`), each in an LRU of at most
+    `max_entries`, so memory stays bounded in long-running processes.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[str], str],
+        tokenize: Callable[[str], Iterable[str]],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.max_entries = max_entries
+        self._tokenize = tokenize
+        self.normalize = lru_cache(maxsize=max_entries)(normalize)
+        self._token_id = lru_cache(maxsize=max_entries)(token_id)
+        self.token_ids = lru_cache(maxsize=max_entries)(self._token_ids)
+
+    def _token_ids(self, text: str) -> FrozenSet[int]:
+        to_id = self._token_id
+        return frozenset(to_id(t) for t in self._tokenize(text))
+
+    def clear(self) -> None:
+        self.normalize.cache_clear()
+        self._token_id.cache_clear()
+        self.token_ids.cache_clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for name, cached in (("normalize", self.normalize), ("token_ids", self.token_ids), ("vocabulary", self._token_id)):
+            info = cached.cache_info()
+            lookups = info.hits + info.misses
+            out[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "entries": info.currsize,
+                "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+            }
+        return out
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS token_sets (
+    id INTEGER PRIMARY KEY,
+    topic INTEGER NOT NULL,
+    tokens BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    UNIQUE (topic, tokens)
+);
+CREATE TABLE IF NOT EXISTS postings (
+    topic INTEGER NOT NULL,
+    token INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    set_id INTEGER NOT NULL,
+    PRIMARY KEY (topic, token, size, set_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS token_counts (
+    topic INTEGER NOT NULL,
+    token INTEGER NOT NULL,
+    sets INTEGER NOT NULL,
+    PRIMARY KEY (topic, token)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS mentions (
+    set_id INTEGER NOT NULL,
+    conversation_id TEXT NOT NULL,
+    claim TEXT NOT NULL,
+    added REAL NOT NULL,
+    PRIMARY KEY (set_id, conversation_id)
+) WITHOUT ROWID;
+"""
+
+# Stay well under SQLite's bound-parameter limit.
+_CHUNK = 500
+# Slack for float rounding in the length and overlap bounds; they only prune, the
+# final Jaccard test decides.
+_EPS = 1e-9
+# Page cache for the inverted index (negative = KiB); postings are inserted in
+# token order, i.e. all over the B-tree.
+CACHE_SIZE_KIB = 64 * 1024
+# Checkpoint the WAL less often: each checkpoint rewrites (and syncs) pages that
+# the next batches of postings would dirty again.
+WAL_AUTOCHECKPOINT_PAGES = 10_000
+
+
+def _signed(token: int) -> int:
+    # dr.claim_cache.token_id is unsigned 64-bit; SQLite integers are signed.
+    return token - (1 << 64) if token >= 1 << 63 else token
+
+
+def _chunks(items: Sequence, size: int = _CHUNK) -> Iterable[Sequence]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class ClaimStore:
+    """Persistent store of normalized claims across conversations, grouped by topic.
+
+    Each distinct canonical token set (per topic) is stored once, with an inverted
+    index of token -> (set size, set ID) and a per-token count of sets; `mentions`
+    records which conversations stated it. `lookup` finds, for each claim, a claim
+    from *another* conversation on the same topic with Jaccard similarity >=
+    `threshold` (the L1 rule) using indexed probes only:
+
+    - length filter: a match of size m needs `threshold * n <= m <= n / threshold`,
+      a range scan on the (topic, token, size) key;
+    - prefix filter: a match shares at least `ceil(threshold * n)` of the claim's n
+      tokens, so probing the `n - ceil(threshold * n) + 1` rarest tokens is enough
+      to find every candidate, and the most common tokens are never scanned;
+    - count filter: a match of size m shares at least `threshold * (n + m) / (1 +
+      threshold)` tokens, so candidates sharing too few of the probed ones are
+      dropped in SQL (`GROUP BY ... HAVING`).
+
+    Survivors are verified with exact Jaccard on their stored token sets, so the
+    answer is the same as comparing against every stored claim.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._topics: Dict[str, int] = {}
+        # Several scoring processes may share the store; wait for their writes.
+        self._db = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        self._db.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _topic_id(self, topic: str, create: bool) -> Optional[int]:
+        topic_id = self._topics.get(topic)
+        if topic_id is None:
+            if create:
+                self._db.execute("INSERT OR IGNORE INTO topics (name) VALUES (?)", (topic,))
+            row = self._db.execute("SELECT id FROM topics WHERE name = ?", (topic,)).fetchone()
+            if row is None:
+                return None
+            topic_id = self._topics[topic] = row[0]
+        return topic_id
+
+    def add(self, conversation_id: str, topic: str, claims: Iterable[Tuple[str, FrozenSet[int]]]) -> None:
+        """Record `(normalized claim, token IDs)` pairs as stated in `conversation_id`.
+
+        Claims without tokens are skipped; recording a claim again is a no-op.
+        """
+
+        rows = []
+        sets: Dict[bytes, List[int]] = {}
+        for claim, tokens in claims:
+            if tokens:
+                signed = sorted(_signed(t) for t in tokens)
+                blob = array("q", signed).tobytes()
+                sets[blob] = signed
+                rows.append((claim, blob))
+        if not rows:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                topic_id = self._topic_id(topic, create=True)
+                ids = self._set_ids(topic_id, list(sets))
+                new = [blob for blob in sets if blob not in ids]
+                if new:
+                    self._db.executemany(
+                        "INSERT INTO token_sets (topic, tokens, size) VALUES (?, ?, ?)",
+                        [(topic_id, blob, len(sets[blob])) for blob in new],
+                    )
+                    ids.update(self._set_ids(topic_id, new))
+                    postings = sorted((t, len(sets[blob]), ids[blob]) for blob in new for t in sets[blob])
+                    self._db.executemany(
+                        "INSERT INTO postings VALUES (?, ?, ?, ?)", [(topic_id, *row) for row in postings]
+                    )
+                    self._db.executemany(
+                        "INSERT INTO token_counts VALUES (?, ?, 1) "
+                        "ON CONFLICT(topic, token) DO UPDATE SET sets = sets + 1",
+                        [(topic_id, t) for t, _, _ in postings],
+                    )
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO mentions VALUES (?, ?, ?, ?)",
+                    [(ids[blob], conversation_id, claim, now) for claim, blob in rows],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _set_ids(self, topic_id: int, blobs: List[bytes]) -> Dict[bytes, int]:
+        ids: Dict[bytes, int] = {}
+        for chunk in _chunks(blobs):
+            placeholders = ",".join("?" * len(chunk))
+            for set_id, blob in self._db.execute(
+                f"SELECT id, tokens FROM token_sets WHERE topic = ? AND tokens IN ({placeholders})",
+                [topic_id, *chunk],
+            ):
+                ids[bytes(blob)] = set_id
+        return ids
+
+    def lookup(
+        self,
+        topic: str,
+        token_sets: Sequence[FrozenSet[int]],
+        threshold: float,
+        exclude_conversation: Optional[str] = None,
+    ) -> List[Optional[Tuple[str, str]]]:
+        """For each token set, the earliest `(conversation_id, claim)` matching it, or None.
+
+        A match is a stored claim on `topic` with Jaccard similarity >= `threshold`
+        that was stated in a conversation other than `exclude_conversation`.
+        """
+
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("Claim store threshold must be in (0, 1].")
+        out: List[Optional[Tuple[str, str]]] = [None] * len(token_sets)
+        with self._lock:
+            topic_id = self._topic_id(topic, create=False)
+            if topic_id is None:
+                return out
+            queries = [{_signed(t) for t in tokens} for tokens in token_sets]
+            counts = self._token_counts(topic_id, set().union(*queries))
+            # Pass 1: candidates per query through the prefix, length and count filters.
+            candidates: List[Dict[int, Tuple[int, Optional[int]]]] = []
+            unverified: set = set()
+            for tokens in queries:
+                found, exact = self._candidates(topic_id, tokens, counts, threshold)
+                candidates.append(found)
+                if not exact:
+                    unverified.update(found)
+            # Pass 2: exact Jaccard; overlaps not counted in pass 1 come from the stored token sets.
+            stored = self._token_sets(unverified)
+            matched: List[List[int]] = []
+            for tokens, found in zip(queries, candidates):
+                n = len(tokens)
+                hits = []
+                for set_id, (size, overlap) in found.items():
+                    if overlap is None:
+                        overlap = len(tokens.intersection(stored[set_id]))
+                    if overlap / (n + size - overlap) >= threshold:
+                        hits.append(set_id)
+                matched.append(hits)
+            # Pass 3: the earliest mention from another conversation.
+            earliest = self._earliest_mentions(set().union(*map(set, matched)), exclude_conversation)
+            for i, hits in enumerate(matched):
+                best = min((earliest[s] for s in hits if s in earliest), default=None)
+                if best is not None:
+                    out[i] = (best[1], best[2])
+        return out
+
+    def _candidates(
+        self, topic_id: int, tokens: set, counts: Dict[int, int], threshold: float
+    ) -> Tuple[Dict[int, Tuple[int, Optional[int]]], bool]:
+        """Stored sets that may reach `threshold` with `tokens`: {set ID: (size, overlap or None)}.
+
+        Returns whether the overlaps are exact (every token that can be shared was
+        probed), in which case no stored set needs to be read.
+        """
+
+        n = len(tokens)
+        need = math.ceil(threshold * n - _EPS)
+        known = sorted((t for t in tokens if t in counts), key=counts.__getitem__)
+        if not n or len(known) < need:
+            return {}, True
+        # Tokens no stored set has cannot be shared, so only `known` counts.
+        probe = len(known) - need + 1
+        lo, hi = need, math.floor(n / threshold + _EPS)
+        if probe > _CHUNK:
+            # Pathologically long claim: gather the minimal prefix's postings and verify each.
+            found: Dict[int, Tuple[int, Optional[int]]] = {}
+            for chunk in _chunks(known[:probe]):
+                placeholders = ",".join("?" * len(chunk))
+                for set_id, size in self._db.execute(
+                    f"SELECT set_id, size FROM postings WHERE topic = ? AND token IN ({placeholders}) "
+                    "AND size BETWEEN ? AND ?",
+                    [topic_id, *chunk, lo, hi],
+                ):
+                    found[set_id] = (size, None)
+            return found, False
+        # A match of size m shares at least t * (n + m) / (1 + t) tokens; at most
+        # `len(known) - probe` of them are outside the probed ones.
+        placeholders = ",".join("?" * probe)
+        rows = self._db.execute(
+            f"SELECT set_id, size, COUNT(*) FROM postings WHERE topic = ? AND token IN ({placeholders}) "
+            "AND size BETWEEN ? AND ? GROUP BY set_id HAVING COUNT(*) + ? >= (size + ?) * ? - ?",
+            [topic_id, *known[:probe], lo, hi, len(known) - probe, n, threshold / (1 + threshold), _EPS],
+        )
+        exact = probe == len(known)
+        return {set_id: (size, shared if exact else None) for set_id, size, shared in rows}, exact
+
+    def _token_counts(self, topic_id: int, tokens: set) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        for chunk in _chunks(list(tokens)):
+            placeholders = ",".join("?" * len(chunk))
+            counts.update(
+                self._db.execute(
+                    f"SELECT token, sets FROM token_counts WHERE topic = ? AND token IN ({placeholders})",
+                    [topic_id, *chunk],
+                )
+            )
+        return counts
+
+    def _token_sets(self, set_ids: set) -> Dict[int, set]:
+        stored: Dict[int, set] = {}
+        for chunk in _chunks(list(set_ids)):
+            placeholders = ",".join("?" * len(chunk))
+            for set_id, blob in self._db.execute(
+                f"SELECT id, tokens FROM token_sets WHERE id IN ({placeholders})", chunk
+            ):
+                stored[set_id] = set(array("q", blob))
+        return stored
+
+    def _earliest_mentions(self, set_ids: set, exclude: Optional[str]) -> Dict[int, Tuple[float, str, str]]:
+        earliest: Dict[int, Tuple[float, str, str]] = {}
+        for chunk in _chunks(list(set_ids)):
+            placeholders = ",".join("?" * len(chunk))
+            for set_id, added, conversation_id, claim in self._db.execute(
+                f"SELECT set_id, added, conversation_id, claim FROM mentions WHERE set_id IN ({placeholders}) "
+                "AND conversation_id IS NOT ?",
+                [*chunk, exclude],
+            ):
+                entry = (added, conversation_id, claim)
+                if set_id not in earliest or entry < earliest[set_id]:
+                    earliest[set_id] = entry
+        return earliest
+
+    def clear(self) -> None:
+        with self._lock:
+            self._topics.clear()
+            self._db.execute("BEGIN IMMEDIATE")
+            for table in ("mentions", "token_counts", "postings", "token_sets", "topics"):
+                self._db.execute(f"DELETE FROM {table}")
+            self._db.execute("COMMIT")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            (topics,) = self._db.execute("SELECT COUNT(*) FROM topics").fetchone()
+            (token_sets,) = self._db.execute("SELECT COUNT(*) FROM token_sets").fetchone()
+            mentions, conversations = self._db.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT conversation_id) FROM mentions"
+            ).fetchone()
+        return {"topics": topics, "token_sets": token_sets, "mentions": mentions, "conversations": conversations}
+
+
+_stores: Dict[str, ClaimStore] = {}
+_stores_lock = threading.Lock()
+
+
+def claim_store(path: str | Path) -> ClaimStore:
+    """Return the shared store for `path` (one SQLite connection per process)."""
+
+    resolved = str(Path(path).expanduser().resolve())
+    with _stores_lock:
+        store = _stores.get(resolved)
+        if store is None:
+            store = _stores[resolved] = ClaimStore(resolved)
+        return store
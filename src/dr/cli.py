@@ -1,15 +1,64 @@
 import argparse
 import json
+import os
 import re
 import sys
 
-from .io import load_transcript
-from .score import score_transcript
+from .io import DEFAULT_REORDER_WINDOW, ReorderWindowExceeded, follow_jsonl_rounds, read_transcript_header
+from .matching import L1_BACKENDS
+from .output import FORMATS
+from .score import IncrementalScorer, claim_store_from_env, iter_path_rounds, score_path
 
 
-def _score_path(path: str) -> dict:
-    data = load_transcript(path)
-    return score_transcript(data)
+def _score_path(
+    path: str,
+    l1_backend: str = "exact",
+    round_range: tuple = (None, None),
+    validate: bool = False,
+    profile: bool = False,
+    reorder_window: int = DEFAULT_REORDER_WINDOW,
+) -> dict:
+    # Without --profile, DR_PROFILE=1 still turns profiling on.
+    kwargs = {"profile": True} if profile else {}
+    return score_path(
+        path,
+        l1_backend=l1_backend,
+        first=round_range[0],
+        last=round_range[1],
+        validate=validate,
+        reorder_window=reorder_window,
+        **kwargs,
+    )
+
+
+def _reorder_window(value: str) -> int:
+    window = int(value)
+    if window < 0:
+        raise argparse.ArgumentTypeError("must be 0 or more")
+    return window
+
+
+def _add_reorder_window(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--reorder-window",
+        type=_reorder_window,
+        default=DEFAULT_REORDER_WINDOW,
+        metavar="N",
+        help=f"Out-of-order JSONL rounds fixed up while streaming (default {DEFAULT_REORDER_WINDOW}); a round "
+        "displaced further rescores the whole file sorted; 0 always loads and sorts the whole file",
+    )
+
+
+def _round_range(value: str) -> tuple:
+    """Parse `--rounds FIRST:LAST` (either side may be empty; inclusive)."""
+
+    first, sep, last = value.partition(":")
+    try:
+        if not sep:
+            return int(first), int(first)
+        return (int(first) if first else None), (int(last) if last else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST:LAST round numbers, got {value!r}")
 
 
 def _why_bullets(result: dict) -> list[str]:
@@ -57,22 +106,173 @@ def _print_stop_output(result: dict) -> None:
     print(f"- {_next_action(signal)}")
 
 
+def _tail_path(path: str, poll_interval: float, idle_timeout: float | None, l1_backend: str = "exact") -> None:
+    scorer = IncrementalScorer(l1_backend=l1_backend)
+    last_signal: str | None = None
+    for r in follow_jsonl_rounds(path, poll_interval=poll_interval, idle_timeout=idle_timeout):
+        update = scorer.add_round(r)
+        signal = update["stop_recommendation"]["signal"]
+        if signal != last_signal:
+            _print_stop_output(update)
+            sys.stdout.flush()
+            last_signal = signal
+
+
 def main() -> None:
     p = argparse.ArgumentParser(prog="dr", description="Diminishing returns meter (stop/ship signal, not confidence).")
     sub = p.add_subparsers(dest="cmd", required=True)
 
     s = sub.add_parser("score", help="Score a transcript JSON file")
     s.add_argument("path", help="Path to transcript JSON")
+    s.add_argument(
+        "--l1-backend",
+        choices=sorted(L1_BACKENDS),
+        default="exact",
+        help="L1 paraphrase matcher: exact Jaccard (default) or approximate MinHash/LSH",
+    )
+    s.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="json",
+        help="json: full document (default); columnar: per-round metrics as parallel arrays; "
+        "stream: rounds written as they are scored",
+    )
+    s.add_argument("--rounds", type=_round_range, default=(None, None), metavar="FIRST:LAST", help="Score only these rounds")
+    s.add_argument("--validate", action="store_true", help="Check the transcript against the v0.1 schema before scoring")
+    s.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add a `timings` block: wall time and calls per stage and per round, embedding round trips and bytes "
+        "(also DR_PROFILE=1)",
+    )
+    _add_reorder_window(s)
 
     stop = sub.add_parser("stop", help="Print a minimal stop/ship verdict")
     stop.add_argument("path", help="Path to transcript JSON")
+    stop.add_argument("--l1-backend", choices=sorted(L1_BACKENDS), default="exact", help="L1 paraphrase matcher")
+    stop.add_argument("--rounds", type=_round_range, default=(None, None), metavar="FIRST:LAST", help="Score only these rounds")
+    stop.add_argument("--validate", action="store_true", help="Check the transcript against the v0.1 schema before scoring")
+    _add_reorder_window(stop)
+
+    validate = sub.add_parser("validate", help="Check transcripts against the v0.1 schema and list every error")
+    validate.add_argument("paths", nargs="+", help="Transcript JSON/JSONL/.drpack files")
+
+    pack = sub.add_parser("pack", help="Convert a transcript to the indexed binary .drpack format")
+    pack.add_argument("path", help="Path to transcript JSON/JSONL")
+    pack.add_argument("-o", "--output", help="Output path (default: input with a .drpack suffix)")
+
+    cal = sub.add_parser(
+        "calibrate",
+        help="Sweep novelty/stop thresholds over a corpus and rank settings by agreement with its expectations",
+    )
+    cal.add_argument("inputs", nargs="+", help="Transcript files, directories or glob patterns")
+    cal.add_argument("--jaccard", default="0.3:0.7:0.05", help="L1 Jaccard thresholds: a,b,c or START:STOP:STEP")
+    cal.add_argument("--low", default="0.05:0.35:0.05", help="Low-novelty thresholds")
+    cal.add_argument("--high", default="0.4:0.8:0.1", help="High-novelty thresholds")
+    cal.add_argument("--k-escalate", default="2:4:1", help="Consecutive low-novelty rounds before ESCALATE")
+    cal.add_argument("--top", type=int, default=10, help="Settings to list (0 = all)")
+    cal.add_argument("--format", choices=["table", "json"], default="table")
+
+    tail = sub.add_parser("tail", help="Follow a JSONL trace and print a verdict whenever it changes")
+    tail.add_argument("path", help="Path to trace JSONL")
+    tail.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between checks for new data")
+    tail.add_argument("--idle-timeout", type=float, default=None, help="Exit after this many seconds without new data")
+    tail.add_argument("--l1-backend", choices=sorted(L1_BACKENDS), default="exact", help="L1 paraphrase matcher")
+
+    demux = sub.add_parser(
+        "demux",
+        help="Score a JSONL log of many interleaved conversations (routed by conversation_id); "
+        "prints one JSON record per scored round and a summary per conversation (exit 1 if any conversation failed)",
+    )
+    demux.add_argument("path", help="Combined JSONL log (may be compressed), or - for stdin")
+    demux.add_argument(
+        "--max-active", type=int, default=10_000, help="Conversations kept in memory (least recently active evicted)"
+    )
+    demux.add_argument(
+        "--max-remembered",
+        type=int,
+        default=100_000,
+        help="Conversations whose topic or failure is remembered after eviction (least recently seen forgotten)",
+    )
+    demux.add_argument("--changes-only", action="store_true", help="Only print a round when its conversation's signal changes")
+    demux.add_argument("--l1-backend", choices=sorted(L1_BACKENDS), default="exact", help="L1 paraphrase matcher")
+
+    batch = sub.add_parser(
+        "score-batch",
+        help="Score many transcripts in parallel; prints one JSON result per line (exit 1 if any file failed)",
+    )
+    batch.add_argument("inputs", nargs="*", help="Transcript files, directories or glob patterns")
+    batch.add_argument("--manifest", help="File listing one transcript path per line")
+    batch.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    batch.add_argument("--l1-backend", choices=sorted(L1_BACKENDS), default="exact", help="L1 paraphrase matcher")
+    batch.add_argument("--validate", action="store_true", help="Schema-check each file before scoring it")
+
+    serve = sub.add_parser("serve", help="Run a resident scoring server (localhost HTTP or Unix socket)")
+    serve.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    serve.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("--idle-timeout", type=float, default=900.0, help="Drop conversations idle this many seconds")
+    serve.add_argument("--max-sessions", type=int, default=10_000, help="Max live conversations (LRU beyond this)")
+    serve.add_argument("--l1-backend", choices=sorted(L1_BACKENDS), default="exact", help="L1 paraphrase matcher")
+
+    ec = sub.add_parser("embed-cache", help="Inspect or clear the persistent embedding cache")
+    ec.add_argument("action", choices=["stats", "clear"])
+    ec.add_argument("--dir", default=os.environ.get("DR_EMBED_CACHE_DIR"), help="Cache directory (default: $DR_EMBED_CACHE_DIR)")
+
+    rc = sub.add_parser("result-cache", help="Inspect or clear the persistent score result cache")
+    rc.add_argument("action", choices=["stats", "clear"])
+    rc.add_argument("--dir", default=os.environ.get("DR_RESULT_CACHE_DIR"), help="Cache directory (default: $DR_RESULT_CACHE_DIR)")
+
+    cs = sub.add_parser("claim-store", help="Inspect or clear the cross-conversation claim store")
+    cs.add_argument("action", choices=["stats", "clear"])
+    cs.add_argument("--path", default=os.environ.get("DR_CLAIM_STORE"), help="Store database (default: $DR_CLAIM_STORE)")
 
     args = p.parse_args()
 
     if args.cmd == "score":
         try:
-            result = _score_path(args.path)
-            print(json.dumps(result, indent=2, sort_keys=True))
+            if args.format == "json":
+                result = _score_path(
+                    args.path,
+                    l1_backend=args.l1_backend,
+                    round_range=args.rounds,
+                    validate=args.validate,
+                    profile=args.profile,
+                    reorder_window=args.reorder_window,
+                )
+                print(json.dumps(result, indent=2, sort_keys=True))
+                return
+            from .output import score_columnar, write_json_stream
+
+            if args.validate:
+                from .schema import check_path
+
+                check_path(args.path)
+
+            rounds = iter_path_rounds(args.path, *args.rounds, reorder_window=args.reorder_window)
+            kwargs = {"profile": True} if args.profile else {}
+            # As in score_path: with DR_CLAIM_STORE the file's header names the conversation and topic.
+            store = claim_store_from_env()
+            if store is not None:
+                header = read_transcript_header(args.path)
+                kwargs.update(
+                    claim_store=store, conversation_id=header.get("conversation_id"), topic=header.get("topic")
+                )
+            if args.format == "columnar":
+                try:
+                    result = score_columnar(rounds, l1_backend=args.l1_backend, **kwargs)
+                except ReorderWindowExceeded:
+                    rounds = iter_path_rounds(args.path, *args.rounds, reorder_window=0)
+                    result = score_columnar(rounds, l1_backend=args.l1_backend, **kwargs)
+                print(json.dumps(result, sort_keys=True, separators=(",", ":")))
+            else:
+                try:
+                    write_json_stream(rounds, sys.stdout, l1_backend=args.l1_backend, **kwargs)
+                except ReorderWindowExceeded as exc:
+                    # Rounds already written cannot be taken back, so there is no rescore here.
+                    raise ReorderWindowExceeded(
+                        f"{exc} Rerun with a larger --reorder-window, or 0 to sort the whole file."
+                    ) from None
             return
         except (FileNotFoundError, ValueError) as exc:
             print(f"error: {args.path}: {exc}", file=sys.stderr)
@@ -80,13 +280,188 @@ def main() -> None:
 
     if args.cmd == "stop":
         try:
-            result = _score_path(args.path)
+            result = _score_path(
+                args.path,
+                l1_backend=args.l1_backend,
+                round_range=args.rounds,
+                validate=args.validate,
+                reorder_window=args.reorder_window,
+            )
             _print_stop_output(result)
             return
         except (FileNotFoundError, ValueError) as exc:
             print(f"error: {args.path}: {exc}", file=sys.stderr)
             raise SystemExit(2)
 
+    if args.cmd == "validate":
+        from .schema import validate_path
+
+        invalid = 0
+        for path in args.paths:
+            try:
+                errors = validate_path(path)
+            except (FileNotFoundError, ValueError) as exc:
+                print(f"error: {path}: {exc}", file=sys.stderr)
+                raise SystemExit(2)
+            for error in errors:
+                print(f"{path}: {error}")
+            invalid += bool(errors)
+        if invalid:
+            raise SystemExit(1)
+        return
+
+    if args.cmd == "pack":
+        from .pack import pack_file
+
+        try:
+            out = pack_file(args.path, args.output)
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"error: {args.path}: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+        print(out)
+        return
+
+    if args.cmd == "calibrate":
+        from .batch import expand_inputs
+        from .calibrate import calibrate, format_table, load_features, make_grid, parse_values
+
+        try:
+            grid = make_grid(
+                jaccard_threshold=parse_values(args.jaccard),
+                low_novelty_threshold=parse_values(args.low),
+                high_novelty_threshold=parse_values(args.high),
+                k_low_novelty_escalate=parse_values(args.k_escalate, int),
+            )
+            corpus = load_features(expand_inputs(args.inputs))
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+        report = calibrate(corpus, grid, top=args.top)
+        if args.format == "json":
+            print(json.dumps(report, indent=2, sort_keys=True))
+        else:
+            print(format_table(report))
+        return
+
+    if args.cmd == "tail":
+        try:
+            _tail_path(args.path, args.poll_interval, args.idle_timeout, l1_backend=args.l1_backend)
+            return
+        except KeyboardInterrupt:
+            return
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"error: {args.path}: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+
+    if args.cmd == "demux":
+        from .demux import iter_stdin_events, score_multiplexed
+
+        live = args.path == "-"
+        failed = 0
+        try:
+            for record in score_multiplexed(
+                iter_stdin_events() if live else args.path,
+                l1_backend=args.l1_backend,
+                max_active=args.max_active,
+                max_remembered=args.max_remembered,
+                changes_only=args.changes_only,
+                claim_store=os.environ.get("DR_CLAIM_STORE") or None,
+            ):
+                if record["type"] == "error":
+                    failed += 1
+                    print(f"error: {record['line']}: {record['error']}", file=sys.stderr)
+                print(json.dumps(record, sort_keys=True, separators=(",", ":")), flush=live)
+        except KeyboardInterrupt:
+            return
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"error: {args.path}: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+        if failed:
+            raise SystemExit(1)
+        return
+
+    if args.cmd == "score-batch":
+        from .batch import expand_inputs, format_record, score_batch
+
+        try:
+            paths = expand_inputs(args.inputs, manifest=args.manifest)
+        except OSError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            raise SystemExit(2)
+        failed = 0
+        for record in score_batch(paths, jobs=args.jobs, l1_backend=args.l1_backend, validate=args.validate):
+            if "error" in record:
+                failed += 1
+                print(f"error: {record['path']}: {record['error']}", file=sys.stderr)
+            print(format_record(record))
+        if failed:
+            raise SystemExit(1)
+        return
+
+    if args.cmd == "serve":
+        from .server import serve as run_server
+
+        where = args.unix or f"http://{args.host}:{args.port}"
+        print(f"dr serve listening on {where}", file=sys.stderr)
+        try:
+            run_server(
+                host=args.host,
+                port=args.port,
+                unix_socket=args.unix,
+                idle_timeout=args.idle_timeout,
+                max_sessions=args.max_sessions,
+                l1_backend=args.l1_backend,
+            )
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if args.cmd == "embed-cache":
+        if not args.dir:
+            print("error: no cache directory (pass --dir or set DR_EMBED_CACHE_DIR)", file=sys.stderr)
+            raise SystemExit(2)
+        from .embedding_cache import EmbeddingCache
+
+        cache = EmbeddingCache(args.dir)
+        try:
+            if args.action == "clear":
+                cache.clear()
+            print(json.dumps(cache.stats(), indent=2, sort_keys=True))
+        finally:
+            cache.close()
+        return
+
+    if args.cmd == "result-cache":
+        if not args.dir:
+            print("error: no cache directory (pass --dir or set DR_RESULT_CACHE_DIR)", file=sys.stderr)
+            raise SystemExit(2)
+        from .result_cache import ResultCache
+
+        max_mb = float(os.environ.get("DR_RESULT_CACHE_MAX_MB") or "256")
+        cache = ResultCache(args.dir, max_bytes=int(max_mb * 1024 * 1024))
+        try:
+            if args.action == "clear":
+                cache.clear()
+            print(json.dumps(cache.stats(), indent=2, sort_keys=True))
+        finally:
+            cache.close()
+        return
+
+    if args.cmd == "claim-store":
+        if not args.path:
+            print("error: no claim store (pass --path or set DR_CLAIM_STORE)", file=sys.stderr)
+            raise SystemExit(2)
+        from .claim_store import ClaimStore
+
+        store = ClaimStore(args.path)
+        try:
+            if args.action == "clear":
+                store.clear()
+            print(json.dumps(store.stats(), indent=2, sort_keys=True))
+        finally:
+            store.close()
+        return
+
     raise SystemExit(2)
 
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .io import _iter_jsonl_events
+from .output import flat_round
+from .score import IncrementalScorer
+
+DEFAULT_MAX_ACTIVE = 10_000
+DEFAULT_MAX_REMEMBERED = 100_000
+
+
+class DemuxScorer:
+    """Score many conversations whose events are interleaved in one JSONL stream.
+
+    `transcript_header` and `round` events are routed by their `conversation_id`
+    to a per-conversation `IncrementalScorer` (created on first sight, with
+    `keep_rounds=False` so each holds only its seen-claim state). Rounds are
+    scored in arrival order, as by `dr tail`. At most `max_active` conversations
+    are kept; beyond that the least recently active one is evicted and its verdict
+    so far is emitted as a summary. A conversation that resumes after eviction
+    starts over (under its header's topic), so size `max_active` above the number
+    of concurrently live ones.
+
+    Topics from headers and the IDs of failed conversations outlive eviction, for
+    up to `max_remembered` conversations each (least recently seen forgotten
+    first), so memory stays bounded over an arbitrarily long log.
+
+    `add_event` returns the records to emit:
+
+    - `{"type": "round", "conversation_id", <flat round metrics>, "stop_recommendation"}`
+      for each scored round (with `changes_only`, only when the conversation's
+      signal changes);
+    - `{"type": "summary", "conversation_id", "reason": "evicted" | "end",
+      "rounds_scored", <IncrementalScorer.summary()>}` when a conversation is
+      evicted, and for every active one from `finish()`;
+    - `{"type": "error", "conversation_id", "line", "error"}` for an event that
+      cannot be scored. Its conversation is dropped and its later events are
+      skipped (its verdict would be wrong); the other conversations carry on.
+    """
+
+    def __init__(
+        self,
+        l1_backend: str = "exact",
+        max_active: int = DEFAULT_MAX_ACTIVE,
+        changes_only: bool = False,
+        claim_store: Any = None,
+        max_remembered: int = DEFAULT_MAX_REMEMBERED,
+    ) -> None:
+        if max_active < 1:
+            raise ValueError("max_active must be at least 1.")
+        if max_remembered < 1:
+            raise ValueError("max_remembered must be at least 1.")
+        self.l1_backend = l1_backend
+        self.max_active = max_active
+        self.max_remembered = max_remembered
+        self.changes_only = changes_only
+        self.claim_store = claim_store
+        self._active: "OrderedDict[str, IncrementalScorer]" = OrderedDict()
+        self._signals: Dict[str, str] = {}
+        # Per-conversation header topics and failed conversations, both LRU-bounded.
+        self._topics: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._failed: "OrderedDict[str, None]" = OrderedDict()
+        self.evicted = 0
+        self.rounds_scored = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def _remember(self, table: "OrderedDict[str, Any]", conversation_id: str, value: Any) -> None:
+        table[conversation_id] = value
+        table.move_to_end(conversation_id)
+        while len(table) > self.max_remembered:
+            table.popitem(last=False)
+
+    def _scorer(self, conversation_id: str, out: List[Dict[str, Any]]) -> IncrementalScorer:
+        scorer = self._active.get(conversation_id)
+        if scorer is not None:
+            self._active.move_to_end(conversation_id)
+            return scorer
+        scorer = self._active[conversation_id] = IncrementalScorer(
+            l1_backend=self.l1_backend,
+            keep_rounds=False,
+            profile=False,
+            claim_store=self.claim_store,
+            conversation_id=conversation_id,
+            topic=self._topics.get(conversation_id),
+        )
+        while len(self._active) > self.max_active:
+            evicted_id, evicted = self._active.popitem(last=False)
+            if evicted.topic:
+                # Refresh it, so the topic survives at least as long as other remembered ones.
+                self._remember(self._topics, evicted_id, evicted.topic)
+            self.evicted += 1
+            out.append(self._summary(evicted_id, evicted, "evicted"))
+        return scorer
+
+    def _summary(self, conversation_id: str, scorer: IncrementalScorer, reason: str) -> Dict[str, Any]:
+        self._signals.pop(conversation_id, None)
+        record: Dict[str, Any] = {
+            "type": "summary",
+            "conversation_id": conversation_id,
+            "reason": reason,
+            "rounds_scored": scorer.rounds_scored,
+        }
+        record.update(scorer.summary())
+        return record
+
+    def add_event(self, event: Dict[str, Any], where: str = "event") -> List[Dict[str, Any]]:
+        """Route one event; returns the records it produces (events of other types are ignored)."""
+
+        kind = event.get("type")
+        if kind not in {"round", "transcript_header"}:
+            return []
+        conversation_id = event.get("conversation_id")
+        if not isinstance(conversation_id, str) or not conversation_id:
+            return [self._error(None, where, f"Missing conversation_id on {kind} event.")]
+        if conversation_id in self._failed:
+            return []
+        out: List[Dict[str, Any]] = []
+        if kind == "transcript_header":
+            self._remember(self._topics, conversation_id, event.get("topic"))
+            scorer = self._active.get(conversation_id)
+            if scorer is not None:
+                scorer.topic = event.get("topic") or ""
+            return out
+
+        scorer = self._scorer(conversation_id, out)
+        try:
+            update = scorer.add_round({"round": event.get("round"), "outputs": event.get("outputs") or {}})
+        except Exception as exc:  # one bad conversation must not abort the stream
+            del self._active[conversation_id]
+            self._signals.pop(conversation_id, None)
+            self._topics.pop(conversation_id, None)
+            self._remember(self._failed, conversation_id, None)
+            out.append(self._error(conversation_id, where, f"{type(exc).__name__}: {exc}"))
+            return out
+        self.rounds_scored += 1
+        signal = update["stop_recommendation"]["signal"]
+        if not self.changes_only or self._signals.get(conversation_id) != signal:
+            self._signals[conversation_id] = signal
+            record: Dict[str, Any] = {"type": "round", "conversation_id": conversation_id}
+            record.update(flat_round(update))
+            record["stop_recommendation"] = update["stop_recommendation"]
+            out.append(record)
+        return out
+
+    def _error(self, conversation_id: Optional[str], where: str, message: str) -> Dict[str, Any]:
+        self.errors += 1
+        return {"type": "error", "conversation_id": conversation_id, "line": where, "error": message}
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Summaries for every active conversation (least recently active first); clears them."""
+
+        out = [self._summary(cid, scorer, "end") for cid, scorer in self._active.items()]
+        self._active.clear()
+        self._topics.clear()
+        self._failed.clear()
+        return out
+
+
+def iter_stdin_events(stream: Any = None) -> Iterator[tuple[int, Dict[str, Any]]]:
+    """(line number, event) pairs from JSONL on stdin (or `stream`), one line at a time."""
+
+    for i, line in enumerate(stream if stream is not None else sys.stdin, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSONL at <stdin>:{i}: {exc.msg}") from exc
+        if not isinstance(event, dict):
+            raise ValueError(f"Invalid JSONL event at <stdin>:{i}: expected an object.")
+        yield i, event
+
+
+def score_multiplexed(
+    source: str | Path | Iterable[tuple[int, Dict[str, Any]]],
+    l1_backend: str = "exact",
+    max_active: int = DEFAULT_MAX_ACTIVE,
+    changes_only: bool = False,
+    claim_store: Any = None,
+    max_remembered: int = DEFAULT_MAX_REMEMBERED,
+) -> Iterator[Dict[str, Any]]:
+    """Score every conversation in an interleaved JSONL log in one streaming pass.
+
+    `source` is a path (compressed logs are decompressed on the fly) or an
+    iterable of `(line number, event)` pairs such as `iter_stdin_events()`.
+    Yields `DemuxScorer` records as they are produced, then the final summaries.
+    """
+
+    demux = DemuxScorer(
+        l1_backend=l1_backend,
+        max_active=max_active,
+        changes_only=changes_only,
+        claim_store=claim_store,
+        max_remembered=max_remembered,
+    )
+    if isinstance(source, (str, Path)):
+        p = Path(source)
+        if not p.exists():
+            raise FileNotFoundError(f"Transcript not found: {p}")
+        name = str(p)
+        events: Iterable[tuple[int, Dict[str, Any]]] = _iter_jsonl_events(p)
+    else:
+        name = "<stdin>"
+        events = source
+    for lineno, event in events:
+        yield from demux.add_event(event, where=f"{name}:{lineno}")
+    yield from demux.finish()
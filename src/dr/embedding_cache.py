@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DB_NAME = "embeddings.sqlite3"
+DEFAULT_MAX_ENTRIES = 200_000
+# SQLite may serve reads from a memory map of the database file up to this many bytes.
+MMAP_SIZE = 256 * 1024 * 1024
+# Lookups are read-only; their LRU stamps and hit/miss counts are written in one
+# transaction once this many entries are pending (and on put, stats, close).
+FLUSH_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    key BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Content-addressed on-disk embedding cache.
+
+    Vectors are stored in SQLite keyed by (model, SHA-256 of the normalized claim
+    text) as packed float64 blobs (with `PRAGMA mmap_size`, so SQLite may read the
+    file through a memory map). Least-recently-used entries are evicted once the
+    cache holds more than `max_entries` vectors.
+
+    `get_many` only reads: the `last_used` stamps of the entries it found and the
+    persisted hit/miss counters are buffered and written together every
+    `FLUSH_EVERY` entries, before any `put_many` (so eviction sees them), and on
+    `stats()`/`close()`. A crash loses at most that buffer, which only blurs LRU order.
+
+    `hits`/`misses` count lookups in this process; `stats()` also reports the
+    cumulative counts persisted across runs.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        # Buffered writes from lookups: (model, key) -> last hit time, and counter deltas.
+        self._touched: Dict[Tuple[str, bytes], float] = {}
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._db = sqlite3.connect(str(self.directory / DB_NAME), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self._db.executescript(_SCHEMA)
+        # Running row count so eviction need not scan the table on every put. It
+        # tracks this connection's inserts; other processes' rows show up on reopen.
+        (self._entries,) = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            self._db.close()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Return cached vectors for `texts` (None where missing); their LRU stamps are refreshed lazily."""
+
+        keys = [_text_key(t) for t in texts]
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(keys))
+            # Stay well under SQLite's bound-parameter limit.
+            for i in range(0, len(unique), 500):
+                chunk = unique[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                    [model, *chunk],
+                )
+                for key, blob in rows:
+                    found[bytes(key)] = array("d", blob).tolist()
+            now = time.time()
+            for key in found:
+                self._touched[(model, key)] = now
+            out = [found.get(key) for key in keys]
+            hits = sum(1 for v in out if v is not None)
+            self.hits += hits
+            self.misses += len(out) - hits
+            self._pending_hits += hits
+            self._pending_misses += len(out) - hits
+            if len(self._touched) >= FLUSH_EVERY:
+                self._flush()
+        return out
+
+    def put_many(self, model: str, texts: List[str], vectors: List[List[float]]) -> None:
+        if len(texts) != len(vectors):
+            raise ValueError("texts and vectors must have the same length")
+        now = time.time()
+        # Last vector wins for a text given twice, as INSERT OR REPLACE would have it.
+        by_key = {_text_key(t): array("d", v).tobytes() for t, v in zip(texts, vectors)}
+        rows = [(model, key, blob, now) for key, blob in by_key.items()]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._write_pending()
+                # Update existing rows first so the insert's change count is exactly the new rows.
+                self._db.executemany(
+                    "UPDATE embeddings SET vector = ?, last_used = ? WHERE model = ? AND key = ?",
+                    [(blob, when, m, key) for m, key, blob, when in rows],
+                )
+                before = self._db.total_changes
+                self._db.executemany("INSERT OR IGNORE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+                self._entries += self._db.total_changes - before
+                self._evict()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        excess = self._entries - self.max_entries
+        if excess > 0:
+            deleted = self._db.execute(
+                "DELETE FROM embeddings WHERE (model, key) IN "
+                "(SELECT model, key FROM embeddings ORDER BY last_used LIMIT ?)",
+                (excess,),
+            ).rowcount
+            self._entries -= deleted
+
+    def _write_pending(self) -> None:
+        """Write buffered LRU stamps and counters (inside the caller's transaction)."""
+
+        if self._touched:
+            self._db.executemany(
+                "UPDATE embeddings SET last_used = MAX(last_used, ?) WHERE model = ? AND key = ?",
+                [(when, model, key) for (model, key), when in self._touched.items()],
+            )
+            self._touched = {}
+        if self._pending_hits or self._pending_misses:
+            self._db.executemany(
+                "INSERT INTO counters VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                [("hits", self._pending_hits), ("misses", self._pending_misses)],
+            )
+            self._pending_hits = self._pending_misses = 0
+
+    def _flush(self) -> None:
+        if not (self._touched or self._pending_hits or self._pending_misses):
+            return
+        self._db.execute("BEGIN")
+        try:
+            self._write_pending()
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def flush(self) -> None:
+        """Write buffered LRU stamps and hit/miss counters now."""
+
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched = {}
+            self._pending_hits = self._pending_misses = 0
+            self._db.execute("DELETE FROM embeddings")
+            self._db.execute("DELETE FROM counters")
+            self._entries = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._flush()
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            totals = dict(self._db.execute("SELECT name, value FROM counters").fetchall())
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals.get("hits", 0),
+            "total_misses": totals.get("misses", 0),
+        }
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def embedding_cache(directory: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> EmbeddingCache:
+    """Return the shared cache for `directory` (one SQLite connection per process)."""
+
+    resolved = str(Path(directory).expanduser().resolve())
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            if not _caches:
+                # Shared caches live until exit; write their buffered stamps and counters then.
+                atexit.register(_close_all)
+            cache = _caches[resolved] = EmbeddingCache(resolved, max_entries=max_entries)
+        return cache
+
+
+def _close_all() -> None:
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.close()
@@ -1,24 +1,308 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+# How many rounds the streaming loader may hold back to fix up out-of-order `round` numbers.
+DEFAULT_REORDER_WINDOW = 256
+
+# Compressed transcripts (`trace.jsonl.gz`, `transcript.json.xz`, ...) are decompressed
+# as they are read. Files without one of these suffixes are recognized by magic bytes.
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma", ".zst": "zstd"}
+_MAGIC = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"), (b"\x28\xb5\x2f\xfd", "zstd"))
+
+
+def transcript_suffix(path: str | Path) -> str:
+    """Format suffix of a transcript path, ignoring compression: `.jsonl` for `trace.jsonl.gz`."""
+
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
+
+
+def compression(path: str | Path) -> Optional[str]:
+    """"gzip", "bz2", "lzma" or "zstd" for a compressed file (by suffix, then magic bytes), else None."""
+
+    p = Path(path)
+    by_suffix = COMPRESSION_SUFFIXES.get(p.suffix.lower())
+    if by_suffix is not None:
+        return by_suffix
+    with p.open("rb") as fh:
+        head = fh.read(6)
+    for magic, name in _MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _open_text(p: Path, codec: Optional[str]) -> IO[str]:
+    """Open `p` as UTF-8 text, decompressing `codec` on the fly (nothing is staged on disk)."""
+
+    if codec is None:
+        return p.open("r", encoding="utf-8")
+    if codec == "gzip":
+        import gzip
+
+        return gzip.open(p, "rt", encoding="utf-8")
+    if codec == "bz2":
+        import bz2
+
+        return bz2.open(p, "rt", encoding="utf-8")
+    if codec == "lzma":
+        import lzma
+
+        return lzma.open(p, "rt", encoding="utf-8")
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        raise ValueError(
+            f"Cannot read {p}: zstd decompression needs Python 3.14+ (compression.zstd); "
+            "decompress it first (zstd -d) or recompress with gzip, bz2 or xz."
+        ) from None
+    return zstd.open(p, "rt", encoding="utf-8")
+
+
+def _decompression_errors(codec: Optional[str]) -> Tuple[type, ...]:
+    # Truncated or corrupt compressed data; reported as ValueError like malformed JSON.
+    if codec is None:
+        return ()
+    if codec == "lzma":
+        import lzma
+
+        return (EOFError, OSError, lzma.LZMAError)
+    if codec == "zstd":
+        from compression import zstd
+
+        return (EOFError, OSError, zstd.ZstdError)
+    return (EOFError, OSError)
+
+
+def _round_sort_key(r: Dict[str, Any]) -> Tuple[int, int]:
+    return (0, r["round"]) if isinstance(r.get("round"), int) else (1, 0)
 
 
 def _sort_rounds(rounds: List[Dict[str, Any]]) -> None:
-    rounds.sort(key=lambda r: (0, r["round"]) if isinstance(r.get("round"), int) else (1, 0))
+    rounds.sort(key=_round_sort_key)
+
+
+def _iter_jsonl_events(p: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line number, event) from a JSONL file one line at a time (decompressing as it goes)."""
+
+    codec = compression(p)
+    i = 0
+    with _open_text(p, codec) as fh:
+        try:
+            for i, line in enumerate(fh, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    parsed = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSONL at {p}:{i}: {exc.msg}") from exc
+                if not isinstance(parsed, dict):
+                    raise ValueError(f"Invalid JSONL event at {p}:{i}: expected an object.")
+                yield i, parsed
+        except _decompression_errors(codec) as exc:
+            raise ValueError(f"Corrupt {codec} data in {p} after line {i}: {exc}") from exc
+
+
+def _read_json_object(p: Path) -> Dict[str, Any]:
+    codec = compression(p)
+    with _open_text(p, codec) as fh:
+        try:
+            text = fh.read()
+        except _decompression_errors(codec) as exc:
+            raise ValueError(f"Corrupt {codec} data in {p}: {exc}") from exc
+    try:
+        transcript = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON at {p}:{exc.lineno}: {exc.msg}") from exc
+    if not isinstance(transcript, dict):
+        raise ValueError(f"Invalid JSON transcript at {p}: expected a top-level object.")
+    return transcript
+
+
+class ReorderWindowExceeded(ValueError):
+    """A JSONL round arrived later than the streaming reorder window can fix up."""
+
+
+def _round_from_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    return {"round": event.get("round"), "outputs": event.get("outputs") or {}}
+
+
+def iter_jsonl_rounds(path: str | Path, reorder_window: int = DEFAULT_REORDER_WINDOW) -> Iterator[Dict[str, Any]]:
+    """Stream the rounds of a JSONL trace in `round` order without loading the whole file.
+
+    Out-of-order rounds are fixed up by a reorder buffer of at most `reorder_window`
+    rounds (same ordering as `load_transcript`, ties kept in file order). A round
+    that arrives after a later-numbered round has already been yielded raises
+    `ReorderWindowExceeded` (a `ValueError`) with its line number; `dr.score.score_path`
+    then rescores the file from `load_transcript`, which sorts all rounds.
+    """
+
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"Transcript not found: {p}")
+    if reorder_window < 1:
+        raise ValueError("reorder_window must be at least 1.")
+
+    buffer: List[Tuple[Tuple[int, int], int, Dict[str, Any]]] = []
+    last_key: Tuple[int, int] | None = None
+    last_round: Any = None
+    for i, event in _iter_jsonl_events(p):
+        if event.get("type") != "round":
+            continue
+        r = _round_from_event(event)
+        key = _round_sort_key(r)
+        if last_key is not None and key < last_key:
+            raise ReorderWindowExceeded(
+                f"Out-of-order round at {p}:{i}: round {r['round']!r} arrived after round {last_round!r} "
+                f"was already scored (reorder window: {reorder_window})."
+            )
+        heapq.heappush(buffer, (key, i, r))
+        if len(buffer) > reorder_window:
+            last_key, _, emitted = heapq.heappop(buffer)
+            last_round = emitted["round"]
+            yield emitted
+
+    while buffer:
+        yield heapq.heappop(buffer)[2]
+
+
+class JsonlTail:
+    """Incrementally read events appended to a JSONL file.
+
+    Keeps the file open and remembers the byte offset of the last complete line,
+    so each `read_events()` call costs only the bytes written since the previous
+    call. A trailing partial line is buffered until its newline arrives.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Transcript not found: {self.path}")
+        if compression(self.path):
+            raise ValueError(f"Cannot follow {self.path}: it is compressed; follow the uncompressed trace.")
+        self._fh = self.path.open("rb")
+        self.offset = 0
+        self._partial = b""
+        self._lineno = 0
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "JsonlTail":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def read_events(self) -> List[Dict[str, Any]]:
+        """Return events from complete lines appended since the last call."""
+
+        size = os.fstat(self._fh.fileno()).st_size
+        if size < self.offset:
+            raise ValueError(f"Trace was truncated while following {self.path} (size {size} < offset {self.offset}).")
+        if size == self.offset:
+            return []
+
+        self._fh.seek(self.offset)
+        chunk = self._fh.read(size - self.offset)
+        self.offset += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+
+        events: List[Dict[str, Any]] = []
+        for raw in lines:
+            self._lineno += 1
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                parsed = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise ValueError(f"Invalid JSONL at {self.path}:{self._lineno}: {getattr(exc, 'msg', exc)}") from exc
+            if not isinstance(parsed, dict):
+                raise ValueError(f"Invalid JSONL event at {self.path}:{self._lineno}: expected an object.")
+            events.append(parsed)
+        return events
+
+
+def follow_jsonl_rounds(
+    path: str | Path, poll_interval: float = 1.0, idle_timeout: float | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield rounds from a JSONL trace as they are appended (like `tail -f`).
+
+    Rounds are yielded in file order; a live trace cannot be reordered. Stops after
+    `idle_timeout` seconds without new data (never, if None).
+    """
+
+    with JsonlTail(path) as tail:
+        last_data = time.monotonic()
+        while True:
+            events = tail.read_events()
+            if events:
+                last_data = time.monotonic()
+            for event in events:
+                if event.get("type") == "round":
+                    yield _round_from_event(event)
+            if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                return
+            if not events:
+                time.sleep(poll_interval)
+
+
+def read_transcript_header(path: str | Path) -> Dict[str, Any]:
+    """`conversation_id` and `topic` of a transcript file (None where absent).
+
+    JSONL traces are read up to their header event (or first round), packs only
+    their header; a JSON document has to be loaded whole.
+    """
+
+    p = Path(path)
+    suffix = transcript_suffix(p)
+    header: Dict[str, Any] = {}
+    if suffix == ".drpack":
+        from .pack import PackedTranscript
+
+        with PackedTranscript(p) as pack:
+            header = pack.header
+    elif suffix == ".jsonl":
+        if not p.exists():
+            raise FileNotFoundError(f"Transcript not found: {p}")
+        for _, event in _iter_jsonl_events(p):
+            kind = event.get("type")
+            if kind == "transcript_header":
+                header = event
+                break
+            if kind == "round":
+                break
+    else:
+        header = load_transcript(p)
+    return {"conversation_id": header.get("conversation_id"), "topic": header.get("topic")}
 
 
 def load_transcript(path: str | Path) -> Dict[str, Any]:
     """Load either a transcript JSON object or a JSONL trace into the canonical transcript dict.
 
     - `.json` is expected to already be in transcript v0.1 shape.
+    - `.drpack` is a binary container written by `dr pack` (memory-mapped; see dr.pack).
     - `.jsonl` is expected to be an event stream with at least:
         {"type":"transcript_header", ...}
         {"type":"round", "round": N, "outputs": {...}}
       Optionally:
         {"type":"diminishing_returns_note", ...}
 
+    JSON and JSONL files may be gzip, bz2 or xz compressed (`trace.jsonl.gz`; zstd
+    on Python 3.14+), detected by suffix or magic bytes and decompressed while
+    parsing.
+
     We keep this permissive: the scorer only needs `rounds[*].outputs.claims`.
     """
 
@@ -26,29 +310,27 @@ def load_transcript(path: str | Path) -> Dict[str, Any]:
     if not p.exists():
         raise FileNotFoundError(f"Transcript not found: {p}")
 
-    if p.suffix.lower() == ".jsonl":
-        events: List[Dict[str, Any]] = []
-        for i, line in enumerate(p.read_text(encoding="utf-8").splitlines(), start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                parsed = json.loads(line)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"Invalid JSONL at {p}:{i}: {exc.msg}") from exc
-            if not isinstance(parsed, dict):
-                raise ValueError(f"Invalid JSONL event at {p}:{i}: expected an object.")
-            events.append(parsed)
+    suffix = transcript_suffix(p)
+    if suffix == ".drpack":
+        from .pack import PackedTranscript
 
-        header = next((e for e in events if e.get("type") == "transcript_header"), {})
-        rounds = [
-            {"round": e.get("round"), "outputs": e.get("outputs") or {}}
-            for e in events
-            if e.get("type") == "round"
-        ]
+        with PackedTranscript(p) as pack:
+            return pack.transcript()
+
+    if suffix == ".jsonl":
+        header: Dict[str, Any] = {}
+        note: Dict[str, Any] | None = None
+        rounds: List[Dict[str, Any]] = []
+        for _, event in _iter_jsonl_events(p):
+            kind = event.get("type")
+            if kind == "round":
+                rounds.append(_round_from_event(event))
+            elif kind == "transcript_header" and not header:
+                header = event
+            elif kind == "diminishing_returns_note" and note is None:
+                note = event
         _sort_rounds(rounds)
 
-        note = next((e for e in events if e.get("type") == "diminishing_returns_note"), None)
         out: Dict[str, Any] = {
             "version": header.get("version") or "0.1",
             "conversation_id": header.get("conversation_id"),
@@ -60,14 +342,7 @@ def load_transcript(path: str | Path) -> Dict[str, Any]:
         return out
 
     # default: JSON transcript
-    text = p.read_text(encoding="utf-8")
-    try:
-        transcript = json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Invalid JSON at {p}:{exc.lineno}: {exc.msg}") from exc
-    if not isinstance(transcript, dict):
-        raise ValueError(f"Invalid JSON transcript at {p}: expected a top-level object.")
-
+    transcript = _read_json_object(p)
     rounds = transcript.get("rounds")
     if isinstance(rounds, list):
         sortable_rounds = [r for r in rounds if isinstance(r, dict)]
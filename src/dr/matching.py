@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Collection, Dict, Hashable, Iterable, Iterator, List, Set, Tuple
+
+from .claim_cache import token_id
+
+# Mersenne prime used for the universal hash family a*x + b mod p.
+_MINHASH_PRIME = (1 << 61) - 1
+# Slack for float rounding in the length and prefix bounds (as in dr.claim_store).
+_EPS = 1e-9
+
+
+class JaccardIndex:
+    """Exact L1 matcher backed by an inverted token index.
+
+    Each seen claim is tokenized once (by the caller-supplied `tokenize`) and its
+    canonical token set is stored under an integer ID, with postings bucketed by
+    set size. A lookup for an n-token claim at threshold t applies the standard
+    set-similarity filters before computing any Jaccard:
+
+    - length filter: a match has between `ceil(t * n)` and `floor(n / t)` tokens,
+      so postings of other sizes are skipped;
+    - prefix filter: a match shares at least `ceil(t * n)` of the claim's tokens,
+      so probing the `n - ceil(t * n) + 1` rarest of them finds every match;
+    - count filter: a candidate of size m must share `t * (n + m) / (1 + t)`
+      tokens, so one found in too few probed postings is dropped unverified.
+
+    Common tokens are therefore only probed for claims too short to avoid them.
+    Results are identical to `max(jaccard(claim, seen) for seen in seen_claims) >=
+    threshold` over the same seen set.
+    """
+
+    def __init__(self, threshold: float, tokenize) -> None:
+        self.threshold = threshold
+        self._tokenize = tokenize
+        self._claims: Set[str] = set()
+        # Identical token sets share an ID; their Jaccard to any query is the same.
+        self._ids_by_tokens: Dict[frozenset, int] = {}
+        self._token_sets: List[frozenset] = []
+        # token -> set size -> IDs, and how many stored sets contain each token.
+        self._postings: Dict[Hashable, Dict[int, List[int]]] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._has_empty = False
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __bool__(self) -> bool:
+        return bool(self._claims)
+
+    def add(self, claim: str) -> None:
+        if claim in self._claims:
+            return
+        self._claims.add(claim)
+        tokens = frozenset(self._tokenize(claim))
+        if not tokens:
+            self._has_empty = True
+            return
+        if tokens in self._ids_by_tokens:
+            return
+        claim_id = len(self._token_sets)
+        self._ids_by_tokens[tokens] = claim_id
+        self._token_sets.append(tokens)
+        size = len(tokens)
+        counts = self._counts
+        for token in tokens:
+            self._postings.setdefault(token, {}).setdefault(size, []).append(claim_id)
+            counts[token] = counts.get(token, 0) + 1
+
+    def update(self, claims: Iterable[str]) -> None:
+        for claim in claims:
+            self.add(claim)
+
+    def _similarities(self, tokens: Collection[Hashable], threshold: float) -> Iterator[float]:
+        """Jaccard with every seen set that passes the length and prefix filters for `threshold`.
+
+        Each set that can reach `threshold` is included; a non-positive threshold
+        includes every set sharing a token with `tokens`.
+        """
+
+        n = len(tokens)
+        counts = self._counts
+        known = sorted((t for t in tokens if t in counts), key=counts.__getitem__)
+        if threshold > 0.0:
+            need = max(math.ceil(threshold * n - _EPS), 1)
+            hi = math.floor(n / threshold + _EPS)
+        else:
+            need, hi = 1, math.inf
+        # Tokens no seen set has cannot be shared, so only `known` ones are probed.
+        if len(known) < need:
+            return
+        probe = len(known) - need + 1
+        postings = self._postings
+        shared: Dict[int, int] = {}
+        for token in known[:probe]:
+            for size, ids in postings[token].items():
+                if need <= size <= hi:
+                    for claim_id in ids:
+                        shared[claim_id] = shared.get(claim_id, 0) + 1
+        token_sets = self._token_sets
+        unprobed = len(known) - probe
+        if not unprobed:
+            # Every token that can be shared was probed: the counts are the overlaps.
+            for claim_id, overlap in shared.items():
+                yield overlap / (n + len(token_sets[claim_id]) - overlap)
+            return
+        # Count filter: a match of size m shares at least t * (n + m) / (1 + t) tokens,
+        # at most `unprobed` of them outside the probed ones.
+        scale = threshold / (1.0 + threshold) if threshold > 0.0 else 0.0
+        for claim_id, hits in shared.items():
+            seen = token_sets[claim_id]
+            m = len(seen)
+            if hits + unprobed < (n + m) * scale - _EPS:
+                continue
+            overlap = len(seen.intersection(tokens))
+            yield overlap / (n + m - overlap)
+
+    def matches(self, claim: str) -> bool:
+        """True if some seen claim has Jaccard similarity >= threshold with `claim`."""
+
+        if not self._claims:
+            return False
+        if self.threshold <= 0.0:
+            return True
+        tokens = self._tokenize(claim)
+        if not tokens:
+            # Jaccard(empty, empty) is 1.0; against any non-empty set it is 0.0.
+            return self._has_empty
+        threshold = self.threshold
+        return any(similarity >= threshold for similarity in self._similarities(tokens, threshold))
+
+    def max_similarity(self, claim: str, floor: float = 0.0) -> float:
+        """Highest Jaccard similarity between `claim` and any seen claim (0.0 if none seen).
+
+        For a positive threshold, `matches(claim)` is `max_similarity(claim) >= threshold`
+        (same arithmetic), so one pass can answer `matches` for every threshold. With
+        a positive `floor` only claims that could reach it are compared, so the result
+        is exact when it is >= `floor` and may be 0.0 otherwise.
+        """
+
+        if not self._claims:
+            return 0.0
+        tokens = self._tokenize(claim)
+        if not tokens:
+            return 1.0 if self._has_empty else 0.0
+        return max(self._similarities(tokens, floor), default=0.0)
+
+
+class MinHashIndex:
+    """Approximate L1 matcher using MinHash signatures and LSH banding.
+
+    Each canonical token set gets a `bands * rows` MinHash signature; claims whose
+    signatures agree on every row of at least one band land in the same bucket.
+    Only bucket-mates are verified with exact Jaccard, so a lookup costs roughly
+    `bands` dict probes regardless of history size.
+
+    Disagreements with `JaccardIndex` are one-sided: a true match can be missed
+    when no band collides (probability `(1 - J**rows) ** bands`), but a reported
+    match is always a real one. The defaults (40 bands x 3 rows) miss a pair at
+    exactly J=0.5 about 0.5% of the time, and higher-similarity pairs far less.
+    """
+
+    def __init__(self, threshold: float, tokenize, bands: int = 40, rows: int = 3, seed: int = 1) -> None:
+        if bands < 1 or rows < 1:
+            raise ValueError("MinHash bands and rows must be positive.")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self._tokenize = tokenize
+        rng = random.Random(seed)
+        self._perms: List[Tuple[int, int]] = [
+            (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME)) for _ in range(bands * rows)
+        ]
+        self._claims: Set[str] = set()
+        self._token_sets: List[frozenset] = []
+        self._ids_by_tokens: Dict[frozenset, int] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._has_empty = False
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __bool__(self) -> bool:
+        return bool(self._claims)
+
+    def _band_keys(self, tokens: Iterable[Hashable]) -> List[Tuple[int, ...]]:
+        # Token IDs (dr.claim_cache.token_id) are used as they are; string tokens get the
+        # same hash, which is stable across processes, unlike hash(str).
+        hashes = [t if isinstance(t, int) else token_id(t) for t in tokens]
+        p = _MINHASH_PRIME
+        signature = [min((a * x + b) % p for x in hashes) for a, b in self._perms]
+        r = self.rows
+        return [tuple(signature[i * r : (i + 1) * r]) for i in range(self.bands)]
+
+    def add(self, claim: str) -> None:
+        if claim in self._claims:
+            return
+        self._claims.add(claim)
+        tokens = frozenset(self._tokenize(claim))
+        if not tokens:
+            self._has_empty = True
+            return
+        if tokens in self._ids_by_tokens:
+            return
+        claim_id = len(self._token_sets)
+        self._ids_by_tokens[tokens] = claim_id
+        self._token_sets.append(tokens)
+        for bucket, key in zip(self._buckets, self._band_keys(tokens)):
+            bucket.setdefault(key, []).append(claim_id)
+
+    def update(self, claims: Iterable[str]) -> None:
+        for claim in claims:
+            self.add(claim)
+
+    def matches(self, claim: str) -> bool:
+        """True if an LSH candidate has Jaccard similarity >= threshold with `claim`."""
+
+        if not self._claims:
+            return False
+        if self.threshold <= 0.0:
+            return True
+        tokens = self._tokenize(claim)
+        if not tokens:
+            return self._has_empty
+        if frozenset(tokens) in self._ids_by_tokens:
+            return True
+
+        candidates: Set[int] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(tokens)):
+            candidates.update(bucket.get(key, ()))
+
+        size = len(tokens)
+        threshold = self.threshold
+        for claim_id in candidates:
+            seen = self._token_sets[claim_id]
+            overlap = len(seen.intersection(tokens))
+            if overlap / (size + len(seen) - overlap) >= threshold:
+                return True
+        return False
+
+
+L1_BACKENDS = {
+    "exact": JaccardIndex,
+    "minhash": MinHashIndex,
+}
+
+
+def make_l1_index(backend: str, threshold: float, tokenize):
+    """Return an empty L1 matcher for `backend` (see `L1_BACKENDS`)."""
+
+    try:
+        factory = L1_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown L1 backend {backend!r}; expected one of: {', '.join(sorted(L1_BACKENDS))}.") from None
+    return factory(threshold, tokenize)
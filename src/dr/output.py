@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+from array import array
+from typing import Any, Dict, Iterable, List, TextIO, Tuple
+
+from .score import _FROM_ENV, IncrementalScorer
+
+# Per-round columns, with the `array` typecode backing each one
+# ("o" = plain list, for columns that may hold strings or None).
+ROUND_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("round", "o"),
+    ("claims", "q"),
+    ("new_claims", "q"),
+    ("new_claims_L0", "q"),
+    ("new_claims_L1", "q"),
+    ("novelty_rate", "d"),
+    ("novelty_rate_L0", "d"),
+    ("novelty_rate_L1", "d"),
+    ("action_readiness", "d"),
+    ("readiness_classification", "o"),
+    ("next_actions_score", "d"),
+    ("open_questions_score", "d"),
+    ("blocker_score", "d"),
+    ("similarity_to_prev", "o"),
+)
+# Only present when L2 embedding novelty is active.
+L2_COLUMNS: Tuple[Tuple[str, str], ...] = (("new_claims_L2", "o"), ("novelty_rate_L2", "o"))
+# Only present with a cross-conversation claim store.
+CORPUS_COLUMNS: Tuple[Tuple[str, str], ...] = (("corpus_repeats", "o"),)
+
+# `dr score --format` choices.
+FORMATS = ("json", "columnar", "stream")
+
+
+def flat_round(update: Dict[str, Any]) -> Dict[str, Any]:
+    """One flat row from an `IncrementalScorer.add_round` update.
+
+    Merges the novelty, readiness and semantic entries (they share `round`) and
+    drops the always-null semantic `centroid`.
+    """
+
+    row = dict(update["novelty"])
+    row.update(update["readiness"])
+    row["similarity_to_prev"] = update["semantic"]["similarity_to_prev"]
+    return row
+
+
+class ColumnarRounds:
+    """Per-round metrics as parallel columns instead of one dict per round.
+
+    Numeric columns are `array('q')` / `array('d')`, so a 10k-round transcript
+    costs a few hundred KB rather than tens of thousands of small dicts.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns["round"]) if self._columns else 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        if not self._columns:
+            spec = ROUND_COLUMNS + (L2_COLUMNS if "new_claims_L2" in row else ())
+            spec += CORPUS_COLUMNS if "corpus_repeats" in row else ()
+            self._columns = {name: [] if code == "o" else array(code) for name, code in spec}
+        for name, column in self._columns.items():
+            column.append(row[name])
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {name: column if isinstance(column, list) else column.tolist() for name, column in self._columns.items()}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def score_columnar(
+    rounds: Iterable[Any],
+    l1_backend: str = "exact",
+    profile: Any = _FROM_ENV,
+    claim_store: Any = _FROM_ENV,
+    conversation_id: str | None = None,
+    topic: str | None = None,
+) -> Dict[str, Any]:
+    """Score rounds into the compact columnar document.
+
+    Same `score`, `components`, `stop_recommendation` and `hint` as
+    `score_transcript`; the three `*_by_round` lists are replaced by one `rounds`
+    table of parallel arrays (see `ROUND_COLUMNS`). With a `claim_store` (see
+    `IncrementalScorer`) the table gains a `corpus_repeats` column.
+    """
+
+    scorer = IncrementalScorer(
+        l1_backend=l1_backend,
+        keep_rounds=False,
+        profile=profile,
+        claim_store=claim_store,
+        conversation_id=conversation_id,
+        topic=topic,
+    )
+    table = ColumnarRounds()
+    for update in scorer.add_rounds(rounds):
+        table.append(flat_round(update))
+    out = scorer.summary()
+    out["rounds"] = table.to_dict()
+    return out
+
+
+def write_json_stream(
+    rounds: Iterable[Any],
+    out: TextIO,
+    l1_backend: str = "exact",
+    profile: Any = _FROM_ENV,
+    claim_store: Any = _FROM_ENV,
+    conversation_id: str | None = None,
+    topic: str | None = None,
+) -> None:
+    """Score rounds and write a JSON document as they are scored, never holding all of them.
+
+    Writes `{"rounds": [row, ...], "components": ..., "hint": ..., "score": ...,
+    "stop_recommendation": ...}` with one `flat_round` row per line; the summary
+    keys follow the rounds because they are only final after the last round.
+    Nothing is written for a transcript with no rounds (the `ValueError` is raised
+    first); an invalid later round raises mid-document. `claim_store`,
+    `conversation_id` and `topic` are passed to the scorer, so rows carry
+    `corpus_repeats` when a store is in use.
+    """
+
+    scorer = IncrementalScorer(
+        l1_backend=l1_backend,
+        keep_rounds=False,
+        profile=profile,
+        claim_store=claim_store,
+        conversation_id=conversation_id,
+        topic=topic,
+    )
+    sep = '{"rounds":[\n'
+    for update in scorer.add_rounds(rounds):
+        row = _dumps(flat_round(update))
+        out.write(sep)
+        out.write(row)
+        sep = ",\n"
+    summary = scorer.summary()
+    out.write("\n]")
+    for key, value in sorted(summary.items()):
+        out.write(f",{_dumps(key)}:{_dumps(value)}")
+    out.write("}\n")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .io import COMPRESSION_SUFFIXES, compression, load_transcript
+
+PACK_SUFFIX = ".drpack"
+MAGIC = b"DRPK"
+FORMAT_VERSION = 1
+
+# Output lists stored as length-prefixed UTF-8 strings; everything else in a round
+# (round number, inputs, telemetry, citations, summary, extra keys) rides along as
+# a compact JSON blob, so any schema-valid round survives the trip unchanged.
+PACKED_FIELDS = ("claims", "decisions", "open_questions", "next_actions")
+
+_U32 = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<qQ")  # round number, byte offset of the record
+_PREAMBLE = struct.Struct("<4sHHI")  # magic, format version, reserved, header length
+_TRAILER = struct.Struct("<QQ4s")  # index offset, round count, magic
+_ABSENT = 0xFFFFFFFF  # field count marking "key not present" (distinct from an empty list)
+# Index key for rounds without an integer `round`; they sort last, as in load_transcript.
+_NO_ROUND = 2**63 - 1
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_round(r: Dict[str, Any]) -> bytes:
+    rest = dict(r)
+    outputs = rest.get("outputs")
+    parts: List[bytes] = []
+    if isinstance(outputs, dict):
+        outputs = dict(outputs)
+        rest["outputs"] = outputs
+    for field in PACKED_FIELDS:
+        values = outputs.get(field) if isinstance(outputs, dict) else None
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            # Missing, or not a list of strings: leave it (if any) in the JSON blob.
+            parts.append(_U32.pack(_ABSENT))
+            continue
+        del outputs[field]
+        parts.append(_U32.pack(len(values)))
+        for value in values:
+            data = value.encode("utf-8")
+            parts.append(_U32.pack(len(data)))
+            parts.append(data)
+    blob = _json_bytes(rest)
+    return b"".join([_U32.pack(len(blob)), blob, *parts])
+
+
+def _round_key(r: Dict[str, Any]) -> int:
+    number = r.get("round")
+    if isinstance(number, int) and -(2**63) <= number < _NO_ROUND:
+        return number
+    return _NO_ROUND
+
+
+def write_pack(transcript: Dict[str, Any], path: str | Path) -> int:
+    """Write `transcript` to a `.drpack` container; returns the number of rounds.
+
+    Layout: preamble + header JSON (every top-level key except `rounds`), one
+    record per round in `round` order, then a footer index of
+    (round number, byte offset) pairs and a fixed-size trailer pointing at it.
+    """
+
+    rounds = transcript.get("rounds")
+    if not isinstance(rounds, list) or not all(isinstance(r, dict) for r in rounds):
+        raise ValueError("Transcript must contain a 'rounds' array of objects.")
+    if [_round_key(r) for r in rounds] != sorted(_round_key(r) for r in rounds):
+        raise ValueError("Rounds must be in 'round' order (load the transcript with dr.io.load_transcript).")
+
+    header = _json_bytes({k: v for k, v in transcript.items() if k != "rounds"})
+    index: List[bytes] = []
+    p = Path(path)
+    with p.open("wb") as fh:
+        fh.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header)))
+        fh.write(header)
+        for r in rounds:
+            index.append(_INDEX_ENTRY.pack(_round_key(r), fh.tell()))
+            fh.write(_encode_round(r))
+        index_offset = fh.tell()
+        fh.write(b"".join(index))
+        fh.write(_TRAILER.pack(index_offset, len(rounds), MAGIC))
+    return len(rounds)
+
+
+def pack_file(source: str | Path, dest: str | Path | None = None) -> Path:
+    """Pack a JSON/JSONL transcript; `dest` defaults to the source with a `.drpack` suffix.
+
+    A compressed source is decompressed while reading (`trace.jsonl.gz` -> `trace.drpack`).
+    """
+
+    base = Path(source)
+    if base.suffix.lower() in COMPRESSION_SUFFIXES:
+        base = base.with_suffix("")
+    out = Path(dest) if dest is not None else base.with_suffix(PACK_SUFFIX)
+    write_pack(load_transcript(source), out)
+    return out
+
+
+class PackedTranscript:
+    """Memory-mapped reader for a `.drpack` container.
+
+    Opening reads only the preamble, header and footer index; rounds are decoded
+    on demand, so `iter_rounds(500, 600)` touches just those records' pages.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        p = Path(path)
+        if not p.exists():
+            raise FileNotFoundError(f"Transcript not found: {p}")
+        if compression(p):
+            raise ValueError(f"Cannot read {p}: packs are memory-mapped and cannot be compressed; decompress it first.")
+        self.path = p
+        with p.open("rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < _PREAMBLE.size + _TRAILER.size:
+                raise ValueError(f"Invalid pack at {p}: file too short.")
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, header_len = _PREAMBLE.unpack_from(self._mm, 0)
+            index_offset, count, tail_magic = _TRAILER.unpack_from(self._mm, size - _TRAILER.size)
+            if magic != MAGIC or tail_magic != MAGIC:
+                raise ValueError(f"Invalid pack at {p}: bad magic (not a dr pack file, or truncated).")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Invalid pack at {p}: unsupported format version {version}.")
+            if index_offset + count * _INDEX_ENTRY.size != size - _TRAILER.size:
+                raise ValueError(f"Invalid pack at {p}: corrupt footer index.")
+            header_start = _PREAMBLE.size
+            self.header: Dict[str, Any] = json.loads(self._mm[header_start : header_start + header_len])
+            self._round_numbers: List[int] = []
+            self._offsets: List[int] = []
+            for number, offset in _INDEX_ENTRY.iter_unpack(self._mm[index_offset : index_offset + count * _INDEX_ENTRY.size]):
+                self._round_numbers.append(number)
+                self._offsets.append(offset)
+            self._offsets.append(index_offset)
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._round_numbers)
+
+    def __enter__(self) -> "PackedTranscript":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    @property
+    def round_numbers(self) -> List[Optional[int]]:
+        return [None if n == _NO_ROUND else n for n in self._round_numbers]
+
+    def round_at(self, i: int) -> Dict[str, Any]:
+        """Decode the i-th stored round (file order, which is `round` order)."""
+
+        mm = self._mm
+        pos = self._offsets[i]
+        end = self._offsets[i + 1]
+        (blob_len,) = _U32.unpack_from(mm, pos)
+        pos += 4
+        r = json.loads(mm[pos : pos + blob_len])
+        pos += blob_len
+        outputs = r.get("outputs")
+        for field in PACKED_FIELDS:
+            (count,) = _U32.unpack_from(mm, pos)
+            pos += 4
+            if count == _ABSENT:
+                continue
+            values = []
+            for _ in range(count):
+                (n,) = _U32.unpack_from(mm, pos)
+                pos += 4
+                values.append(mm[pos : pos + n].decode("utf-8"))
+                pos += n
+            outputs[field] = values
+        if pos != end:
+            raise ValueError(f"Invalid pack at {self.path}: corrupt round record {i}.")
+        return r
+
+    def iter_rounds(self, first: int | None = None, last: int | None = None) -> Iterator[Dict[str, Any]]:
+        """Yield rounds with `first <= round <= last` (either bound optional), via the index."""
+
+        lo = 0 if first is None else bisect_left(self._round_numbers, first)
+        hi = len(self._round_numbers) if last is None else bisect_right(self._round_numbers, last)
+        for i in range(lo, hi):
+            yield self.round_at(i)
+
+    def transcript(self) -> Dict[str, Any]:
+        out = dict(self.header)
+        out["rounds"] = list(self.iter_rounds())
+        return out
+
+
+def iter_pack_rounds(path: str | Path, first: int | None = None, last: int | None = None) -> Iterator[Dict[str, Any]]:
+    """Stream rounds `first..last` (inclusive) of a `.drpack` file, closing it when done."""
+
+    with PackedTranscript(path) as pack:
+        yield from pack.iter_rounds(first, last)
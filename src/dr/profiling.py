@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Network counters filled by `dr.semantic.count_network`.
+NETWORK_KEYS = ("requests", "bytes_sent", "bytes_received")
+
+
+class Profiler:
+    """Opt-in per-stage timing for a scoring run (`dr score --profile`, `DR_PROFILE=1`).
+
+    Stages accumulate wall time and call counts; the scorer closes each round with
+    `end_round`, which records that round's stage times and embedding network use
+    and passes them to `hook` (e.g. to forward to a metrics sink). `report()` is the
+    `timings` block added to the score output. A scorer without a profiler only
+    pays a `None` check per stage.
+    """
+
+    def __init__(self, hook: Optional[Callable[[Dict[str, Any]], None]] = None, keep_rounds: bool = True) -> None:
+        self.hook = hook
+        self.keep_rounds = keep_rounds
+        self.stages: Dict[str, List[float]] = {}  # stage -> [seconds, calls]
+        self.network: Dict[str, int] = dict.fromkeys(NETWORK_KEYS, 0)
+        self.rounds: List[Dict[str, Any]] = []
+        self._round_stages: Dict[str, float] = {}
+        self._round_network: Dict[str, int] = {}
+        self._started = perf_counter()
+
+    def add(self, stage: str, seconds: float, per_round: bool = True) -> None:
+        entry = self.stages.get(stage)
+        if entry is None:
+            entry = self.stages[stage] = [0.0, 0]
+        entry[0] += seconds
+        entry[1] += 1
+        if per_round:
+            self._round_stages[stage] = self._round_stages.get(stage, 0.0) + seconds
+
+    def lap(self, stage: str, start: float) -> float:
+        """Charge the time since `start` to `stage`; returns now, the start of the next lap."""
+
+        now = perf_counter()
+        self.add(stage, now - start)
+        return now
+
+    def timed(self, rounds: Iterable[Any], stage: str = "parse") -> Iterator[Any]:
+        """Yield from `rounds`, charging the time spent producing each item to `stage`."""
+
+        it = iter(rounds)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.add(stage, perf_counter() - start, per_round=False)
+                return
+            self.add(stage, perf_counter() - start)
+            yield item
+
+    @staticmethod
+    def new_tally() -> Dict[str, int]:
+        """Zeroed network counters for `dr.semantic.count_network` to fill."""
+
+        return dict.fromkeys(NETWORK_KEYS, 0)
+
+    def add_network(self, counts: Dict[str, int], per_round: bool = True) -> None:
+        """Add a tally of this run's embedding requests (see `dr.semantic.count_network`)."""
+
+        for key in NETWORK_KEYS:
+            self.network[key] += counts[key]
+            if per_round:
+                self._round_network[key] = self._round_network.get(key, 0) + counts[key]
+
+    def end_round(self, round_number: Any) -> None:
+        entry: Dict[str, Any] = {
+            "round": round_number,
+            "stages": {k: round(v, 6) for k, v in self._round_stages.items()},
+        }
+        if self._round_network:
+            entry["network"] = self._round_network
+        self._round_stages = {}
+        self._round_network = {}
+        if self.keep_rounds:
+            self.rounds.append(entry)
+        if self.hook is not None:
+            self.hook(entry)
+
+    def report(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "wall_s": round(perf_counter() - self._started, 6),
+            "stages": {
+                name: {"seconds": round(seconds, 6), "calls": int(calls)} for name, (seconds, calls) in self.stages.items()
+            },
+            "network": dict(self.network),
+        }
+        if self.keep_rounds:
+            out["rounds"] = list(self.rounds)
+        return out
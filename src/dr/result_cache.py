@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DB_NAME = "results.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    version TEXT NOT NULL,
+    result BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def transcript_digest(transcript: Any) -> bytes:
+    """SHA-256 of a transcript dict's canonical JSON (sorted keys, compact separators)."""
+
+    canonical = json.dumps(transcript, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+def file_digest(path: str | Path) -> bytes:
+    """SHA-256 of a transcript file's bytes, read in chunks (the file is not parsed)."""
+
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def scorer_version() -> str:
+    """Package version plus `dr.score.SCORER_VERSION`; entries written under another version are dropped."""
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    from .score import SCORER_VERSION
+
+    try:
+        package = version("diminishing-returns")
+    except PackageNotFoundError:
+        package = "unknown"
+    return f"{package}+{SCORER_VERSION}"
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of score outputs.
+
+    Keys are SHA-256 over the transcript digest, the scorer version and the active
+    scoring parameters (see `key`), so an edited transcript, a changed threshold or
+    a different embedding model simply misses. Invalidation is explicit: entries
+    written by another scorer version are deleted when the cache is opened, and
+    `clear()` (`dr result-cache clear`) drops everything. Results are stored as
+    zlib-compressed JSON; least-recently-used entries are evicted once their total
+    size exceeds `max_bytes`.
+
+    A busy or unwritable database never fails a score: `get` then reports a miss
+    and `put` skips the write.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES, version: Optional[str] = None
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.version = scorer_version() if version is None else version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Batch workers share the database; wait for their writes rather than failing.
+        self._db = sqlite3.connect(
+            str(self.directory / DB_NAME), timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute("DELETE FROM results WHERE version != ?", (self.version,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def key(self, digest: bytes, params: Dict[str, Any]) -> bytes:
+        h = hashlib.sha256(digest)
+        h.update(self.version.encode("utf-8"))
+        h.update(json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached result for `key`, or None."""
+
+        with self._lock:
+            try:
+                row = self._db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._bump_counter("hits" if row is not None else "misses")
+            except sqlite3.OperationalError:
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: bytes, result: Dict[str, Any]) -> None:
+        blob = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"), 1)
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                self._db.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, self.version, blob, len(blob), time.time()),
+                )
+                self._evict()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY last_used"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM results WHERE key = ?", doomed)
+
+    def _bump_counter(self, name: str) -> None:
+        self._db.execute(
+            "INSERT INTO counters VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.execute("DELETE FROM counters")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+            totals = dict(self._db.execute("SELECT name, value FROM counters").fetchall())
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals.get("hits", 0),
+            "total_misses": totals.get("misses", 0),
+        }
+
+
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def result_cache(directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> ResultCache:
+    """Return the shared cache for `directory` (one SQLite connection per process)."""
+
+    resolved = str(Path(directory).expanduser().resolve())
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = _caches[resolved] = ResultCache(resolved, max_bytes=max_bytes)
+        return cache
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .io import _iter_jsonl_events, _read_json_object, transcript_suffix
+
+# Packaged copy of spec/transcript.v0.1.schema.json (tests keep the two identical).
+SCHEMA_PATH = Path(__file__).with_name("transcript.v0.1.schema.json")
+
+# Keywords that only annotate a schema; everything else must be compiled or rejected.
+_ANNOTATIONS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    # JSON Schema counts 1.0 as an integer; booleans are never numbers.
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) or (isinstance({v}, float) and {v}.is_integer()))",
+}
+_KEYWORDS = {
+    "type",
+    "const",
+    "enum",
+    "minimum",
+    "maximum",
+    "minItems",
+    "maxItems",
+    "required",
+    "properties",
+    "additionalProperties",
+    "items",
+}
+_MISSING = object()
+
+Validator = Callable[[Any, str, List[Tuple[str, str]]], None]
+
+
+@dataclass(frozen=True)
+class SchemaError:
+    """One violation: a JSON pointer into the document (or JSONL event) and a message."""
+
+    pointer: str
+    message: str
+    line: Optional[int] = None  # JSONL line number; the pointer is then relative to that event
+
+    def __str__(self) -> str:
+        where = f"line {self.line}: " if self.line is not None else ""
+        return f"{where}{self.pointer or '/'}: {self.message}"
+
+
+class TranscriptValidationError(ValueError):
+    """Raised when a transcript does not match the v0.1 schema; `errors` lists every violation."""
+
+    MAX_REPORTED = 10
+
+    def __init__(self, errors: List[SchemaError]) -> None:
+        self.errors = errors
+        shown = "; ".join(str(e) for e in errors[: self.MAX_REPORTED])
+        more = f"; ... and {len(errors) - self.MAX_REPORTED} more" if len(errors) > self.MAX_REPORTED else ""
+        super().__init__(f"Transcript does not match schema ({len(errors)} error(s)): {shown}{more}")
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+class _Compiler:
+    """Turns a JSON Schema (the subset the transcript spec uses) into one Python function.
+
+    Every check is inlined into a single `validate(v, ptr, errors)` body: property
+    names, constants and pointer segments are resolved at compile time, pointers
+    are f-strings evaluated only when an error is recorded, and arrays of plain
+    items (claims, questions, actions) are checked with one C-level pass over
+    their element types. A valid round therefore costs no calls and no string
+    building.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.consts: Dict[str, Any] = {}
+        self._names = 0
+
+    def _const(self, value: Any) -> str:
+        name = f"_c{len(self.consts)}"
+        self.consts[name] = value
+        return name
+
+    def _var(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def _error(self, depth: int, ptr: str, message: str) -> None:
+        # `ptr` is the body of an f-string, e.g. "{ptr}/rounds/{i3}".
+        self._emit(depth, f"errors.append((f{ptr!r}, {message!r}))")
+
+    @staticmethod
+    def _types(types: Any) -> List[str]:
+        types = [types] if isinstance(types, str) else list(types)
+        for t in types:
+            if t not in _TYPE_CHECKS:
+                raise ValueError(f"Unsupported schema type: {t!r}")
+        return types
+
+    def _type_check(self, types: List[str], v: str) -> str:
+        return " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+
+    @staticmethod
+    def _is_plain(schema: Any) -> bool:
+        return isinstance(schema, dict) and set(schema) - _ANNOTATIONS == {"type"}
+
+    def node(self, schema: Any, v: str, ptr: str, depth: int) -> None:
+        if schema is True:
+            return
+        if schema is False:
+            self._error(depth, ptr, "no value is allowed here")
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"Unsupported schema node: {schema!r}")
+        unknown = set(schema) - _ANNOTATIONS - _KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported schema keyword(s): {', '.join(sorted(unknown))}")
+
+        types: List[str] = []
+        if "type" in schema:
+            types = self._types(schema["type"])
+            self._emit(depth, f"if not ({self._type_check(types, v)}):")
+            self._error(depth + 1, ptr, f"expected {' or '.join(types)}")
+            self._emit(depth, "else:")
+            depth += 1
+        start = len(self.lines)
+        if "const" in schema:
+            self._emit(depth, f"if {v} != {self._const(schema['const'])}:")
+            self._error(depth + 1, ptr, "expected " + json.dumps(schema["const"]))
+        if "enum" in schema:
+            self._emit(depth, f"if {v} not in {self._const(list(schema['enum']))}:")
+            self._error(depth + 1, ptr, "expected one of " + json.dumps(schema["enum"]))
+        for keyword, op, word in (("minimum", "<", ">="), ("maximum", ">", "<=")):
+            if keyword in schema:
+                bound = schema[keyword]
+                self._emit(depth, f"if {self._type_check(['number'], v)} and {v} {op} {bound!r}:")
+                self._error(depth + 1, ptr, f"must be {word} {bound}")
+        self._array(schema, v, ptr, depth, known=types == ["array"])
+        self._object(schema, v, ptr, depth, known=types == ["object"])
+        if len(self.lines) == start:
+            if types:
+                self.lines.pop()  # the "else:" with nothing under it
+            else:
+                self._emit(depth, "pass")
+
+    def _array(self, schema: Dict[str, Any], v: str, ptr: str, depth: int, known: bool) -> None:
+        items = schema.get("items", True)
+        if not ({"minItems", "maxItems"} & set(schema)) and items is True:
+            return
+        if not known:
+            self._emit(depth, f"if isinstance({v}, list):")
+            depth += 1
+        if "minItems" in schema:
+            self._emit(depth, f"if len({v}) < {schema['minItems']}:")
+            self._error(depth + 1, ptr, f"expected at least {schema['minItems']} item(s)")
+        if "maxItems" in schema:
+            self._emit(depth, f"if len({v}) > {schema['maxItems']}:")
+            self._error(depth + 1, ptr, f"expected at most {schema['maxItems']} item(s)")
+        if items is True:
+            return
+        i, x = self._var("i"), self._var("x")
+        item_ptr = ptr + "/{" + i + "}"
+        if self._is_plain(items) and "integer" not in items["type"]:
+            # Exact JSON types, so one set test covers the whole list on the happy path.
+            types = self._types(items["type"])
+            allowed = self._const(frozenset(type(example) for t in types for example in _EXAMPLES[t]))
+            self._emit(depth, f"if not {allowed}.issuperset(map(type, {v})):")
+            depth += 1
+        self._emit(depth, f"for {i}, {x} in enumerate({v}):")
+        self.node(items, x, item_ptr, depth + 1)
+
+    def _object(self, schema: Dict[str, Any], v: str, ptr: str, depth: int, known: bool) -> None:
+        required = schema.get("required", [])
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        if not required and not properties and additional is True:
+            return
+        if not known:
+            self._emit(depth, f"if isinstance({v}, dict):")
+            depth += 1
+        for key in required:
+            self._emit(depth, f"if {key!r} not in {v}:")
+            self._error(depth + 1, ptr, f"missing required property {key!r}")
+        for key, sub in properties.items():
+            if sub is True:
+                continue
+            x = self._var("x")
+            self._emit(depth, f"{x} = {v}.get({key!r}, _MISSING)")
+            self._emit(depth, f"if {x} is not _MISSING:")
+            self.node(sub, x, ptr + "/" + _escape(key).replace("{", "{{").replace("}", "}}"), depth + 1)
+        if additional is not True:
+            k, x = self._var("k"), self._var("x")
+            self._emit(depth, f"for {k}, {x} in {v}.items():")
+            self._emit(depth + 1, f"if {k} not in {self._const(frozenset(properties))}:")
+            extra_ptr = ptr + "/{_escape(" + k + ")}"
+            if additional is False:
+                self._error(depth + 2, extra_ptr, "unexpected property")
+            else:
+                self.node(additional, x, extra_ptr, depth + 2)
+
+
+# One sample value per JSON type, for the element-type fast path on arrays.
+_EXAMPLES: Dict[str, Tuple[Any, ...]] = {
+    "string": ("",),
+    "object": ({},),
+    "array": ([],),
+    "boolean": (True,),
+    "null": (None,),
+    "number": (0, 0.0),
+}
+
+
+def compile_schema(schema: Any) -> Validator:
+    """Compile a JSON Schema into `validate(value, pointer, errors)`.
+
+    Supports the keywords the transcript spec uses (type, const, enum, minimum,
+    maximum, minItems, maxItems, required, properties, additionalProperties,
+    items); any other keyword raises `ValueError` rather than being ignored.
+    Violations are appended to `errors` as `(json_pointer, message)` pairs.
+    """
+
+    compiler = _Compiler()
+    compiler.lines.append("def validate(v, ptr, errors):")
+    compiler.node(schema, "v", "{ptr}", 1)
+    if len(compiler.lines) == 1:
+        compiler.lines.append("    pass")
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING, "_escape": _escape, **compiler.consts}
+    exec(compile("\n".join(compiler.lines), "<dr.schema>", "exec"), namespace)
+    return namespace["validate"]
+
+
+@lru_cache(maxsize=None)
+def _transcript_validators() -> Tuple[Validator, Validator, Validator, int]:
+    """(whole transcript, header fields only, one round, minimum round count)."""
+
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    rounds_schema = schema["properties"]["rounds"]
+    header_schema = dict(schema)
+    header_schema["required"] = [k for k in schema.get("required", []) if k != "rounds"]
+    header_schema["properties"] = {k: v for k, v in schema["properties"].items() if k != "rounds"}
+    return (
+        compile_schema(schema),
+        compile_schema(header_schema),
+        compile_schema(rounds_schema["items"]),
+        int(rounds_schema.get("minItems", 0)),
+    )
+
+
+def _errors(raw: List[Tuple[str, str]], line: Optional[int] = None) -> List[SchemaError]:
+    return [SchemaError(pointer, message, line) for pointer, message in raw]
+
+
+def validate_transcript(transcript: Any) -> List[SchemaError]:
+    """Every schema violation in a transcript v0.1 dict (empty list if valid)."""
+
+    raw: List[Tuple[str, str]] = []
+    _transcript_validators()[0](transcript, "", raw)
+    return _errors(raw)
+
+
+def validate_path(path: str | Path) -> List[SchemaError]:
+    """Validate a transcript file in one streaming pass, collecting every error.
+
+    JSONL traces are checked event by event (pointers are relative to the event,
+    with its line number); the header event supplies the top-level fields, as in
+    `load_transcript`. Malformed JSON still raises `ValueError`.
+    """
+
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"Transcript not found: {p}")
+    _, check_header, check_round, min_rounds = _transcript_validators()
+    suffix = transcript_suffix(p)
+
+    if suffix == ".jsonl":
+        errors: List[SchemaError] = []
+        header: Optional[Tuple[int, Dict[str, Any]]] = None
+        rounds = 0
+        for lineno, event in _iter_jsonl_events(p):
+            kind = event.get("type")
+            raw: List[Tuple[str, str]] = []
+            if kind == "round":
+                rounds += 1
+                check_round(event, "", raw)  # the extra "type" key is allowed by the schema
+            elif kind == "transcript_header" and header is None:
+                header = (lineno, event)
+                fields = {k: v for k, v in event.items() if k != "type"}
+                fields.setdefault("version", "0.1")
+                check_header(fields, "", raw)
+            errors.extend(_errors(raw, lineno))
+        if header is None:
+            raw = []
+            check_header({"version": "0.1"}, "", raw)
+            errors.extend(_errors(raw))
+        if rounds < min_rounds:
+            errors.append(SchemaError("/rounds", f"expected at least {min_rounds} item(s)"))
+        return errors
+
+    if suffix == ".drpack":
+        from .pack import PackedTranscript
+
+        raw = []
+        with PackedTranscript(p) as pack:
+            check_header(pack.header, "", raw)
+            for i, r in enumerate(pack.iter_rounds()):
+                check_round(r, f"/rounds/{i}", raw)
+            if len(pack) < min_rounds:
+                raw.append(("/rounds", f"expected at least {min_rounds} item(s)"))
+        return _errors(raw)
+
+    return validate_transcript(_read_json_object(p))
+
+
+def check_path(path: str | Path) -> None:
+    """Raise `TranscriptValidationError` (listing every violation) unless `path` is schema-valid."""
+
+    errors = validate_path(path)
+    if errors:
+        raise TranscriptValidationError(errors)
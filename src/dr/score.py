@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import os
 import re
 import string
-from typing import Any, Dict, Iterable
-
-from .semantic import cosine_similarity, embedding_config_from_env, embed_ollama, mean_vector
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator
+
+from .claim_cache import ClaimCache
+from .io import (
+    DEFAULT_REORDER_WINDOW,
+    ReorderWindowExceeded,
+    iter_jsonl_rounds,
+    load_transcript,
+    read_transcript_header,
+    transcript_suffix,
+)
+from .matching import make_l1_index
 
 # Spec reference: docs/novelty-and-readiness-spec.md
 # L1 paraphrase-ish matching threshold.
@@ -14,6 +27,11 @@ LOW_NOVELTY_THRESHOLD = 0.15
 HIGH_NOVELTY_THRESHOLD = 0.5
 K_LOW_NOVELTY_REQUIRED = 2
 K_LOW_NOVELTY_ESCALATE = 3
+# L2 semantic paraphrase threshold (cosine), calibrated for MiniLM-class models; see spec section 2.1.
+L2_SIMILARITY_THRESHOLD = 0.82
+# Bump whenever a change alters the output for the same input; cached results
+# (dr.result_cache) written under another version are discarded.
+SCORER_VERSION = 1
 
 # Minimal L0 readiness heuristics from the spec.
 IMPERATIVE_VERBS = {
@@ -159,6 +177,121 @@ JACCARD_TOKEN_CANONICAL_MAP = {
 }
 
 
+# Sentinel: read the embedding config from the environment (see dr.semantic).
+_FROM_ENV = object()
+
+
+# The embedding stack (dr.semantic, dr.vectors and, when installed, NumPy) costs far
+# more to import than lexical scoring takes, so it is only loaded once DR_OLLAMA_URL
+# is set and a scorer actually needs it.
+def _embedding_config_from_env() -> Any:
+    if not os.environ.get("DR_OLLAMA_URL"):
+        return None
+    from .semantic import embedding_config_from_env
+
+    return embedding_config_from_env()
+
+
+def _profiler(profile: Any, keep_rounds: bool = True) -> Any:
+    """Resolve a `profile` argument: a `dr.profiling.Profiler`, True/False, or `_FROM_ENV` (DR_PROFILE=1)."""
+
+    if profile is _FROM_ENV:
+        profile = profile_from_env()
+    if not profile:
+        return None
+    if profile is True:
+        from .profiling import Profiler
+
+        return Profiler(keep_rounds=keep_rounds)
+    return profile
+
+
+def _result_cache(cache: Any) -> Any:
+    """Resolve a `cache` argument: a `dr.result_cache.ResultCache`, a directory, None, or `_FROM_ENV`.
+
+    From the environment, DR_RESULT_CACHE_DIR enables the cache and
+    DR_RESULT_CACHE_MAX_MB bounds its size (default 256).
+    """
+
+    if cache is _FROM_ENV:
+        cache = os.environ.get("DR_RESULT_CACHE_DIR") or None
+    if not cache:
+        return None
+    if isinstance(cache, (str, Path)):
+        from .result_cache import result_cache
+
+        max_mb = float(os.environ.get("DR_RESULT_CACHE_MAX_MB") or "256")
+        return result_cache(cache, max_bytes=int(max_mb * 1024 * 1024))
+    return cache
+
+
+def _claim_store(store: Any) -> Any:
+    """Resolve a `claim_store` argument: a `dr.claim_store.ClaimStore`, a path, None, or `_FROM_ENV` (DR_CLAIM_STORE)."""
+
+    if store is _FROM_ENV:
+        store = os.environ.get("DR_CLAIM_STORE") or None
+    if not store:
+        return None
+    if isinstance(store, (str, Path)):
+        from .claim_store import claim_store
+
+        return claim_store(store)
+    return store
+
+
+# Public resolvers for long-lived callers (e.g. `dr serve`) that read the
+# environment once and pass the results to every scorer they build.
+def profile_from_env() -> bool:
+    """Whether DR_PROFILE asks for profiling."""
+
+    return os.environ.get("DR_PROFILE", "") not in {"", "0"}
+
+
+def result_cache_from_env() -> Any:
+    """The `dr.result_cache.ResultCache` named by DR_RESULT_CACHE_DIR, or None."""
+
+    return _result_cache(_FROM_ENV)
+
+
+def claim_store_from_env() -> Any:
+    """The `dr.claim_store.ClaimStore` named by DR_CLAIM_STORE, or None."""
+
+    return _claim_store(_FROM_ENV)
+
+
+def _cache_params(l1_backend: str, **extra: Any) -> Dict[str, Any]:
+    """Everything besides the transcript that the score output depends on."""
+
+    params: Dict[str, Any] = {
+        "l1_backend": l1_backend,
+        "thresholds": [
+            JACCARD_THRESHOLD,
+            LOW_NOVELTY_THRESHOLD,
+            HIGH_NOVELTY_THRESHOLD,
+            K_LOW_NOVELTY_REQUIRED,
+            K_LOW_NOVELTY_ESCALATE,
+        ],
+        **extra,
+    }
+    config = _embedding_config_from_env()
+    if config:
+        params["embedding_model"] = config.model
+        params["l2_threshold"] = L2_SIMILARITY_THRESHOLD
+        params["l2_exact_limit"] = config.index_exact_limit
+    return params
+
+
+def _cacheable(result: Dict[str, Any]) -> bool:
+    # A round whose embedding request failed scored without L2; rescore it next time.
+    return all(entry.get("new_claims_L2", 0) is not None for entry in result["novelty_by_round"])
+
+
+def embed_ollama(config: Any, texts: list[str]) -> list[list[float]]:
+    from .semantic import embed_ollama as _embed_ollama
+
+    return _embed_ollama(config, texts)
+
+
 def _round_float(value: float) -> float:
     return round(float(value), 4)
 
@@ -182,7 +315,7 @@ def _normalized_round_claims(raw_claims: Iterable[Any]) -> list[str]:
     for claim in raw_claims:
         if not isinstance(claim, str):
             continue
-        normalized = _normalize_claim(claim)
+        normalized = CLAIM_CACHE.normalize(claim)
         if normalized:
             deduped.add(normalized)
     return sorted(deduped)
@@ -211,6 +344,10 @@ def _token_set(text: str) -> set[str]:
     return canonical_tokens
 
 
+# Process-wide memo of claim normalization and token IDs, shared by every scorer.
+CLAIM_CACHE = ClaimCache(_normalize_claim, _token_set)
+
+
 def _jaccard_similarity(a: str, b: str) -> float:
     ta = _token_set(a)
     tb = _token_set(b)
@@ -222,25 +359,53 @@ def _jaccard_similarity(a: str, b: str) -> float:
     return len(ta & tb) / len(union)
 
 
-def _is_specific_action(action: str) -> bool:
-    lowered = action.strip().lower()
+def _keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    # Longest first so the alternation never stops at a shorter keyword's prefix.
+    return re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+
+# Keyword tables compiled once into single-alternation matchers.
+_VAGUE_PREFIX_RE = _keyword_pattern(VAGUE_PREFIXES)
+_VAGUE_MARKER_RE = _keyword_pattern(VAGUE_MARKERS)
+_BLOCKER_RE = _keyword_pattern(BLOCKER_KEYWORDS)
+_OWNERSHIP_RE = _keyword_pattern(OWNERSHIP_MARKERS)
+_CONCRETE_ARTIFACT_RE = re.compile(r"https?://|\b(pr|branch|file|url|command|tool)\b|\b\w+\.\w+\b|[/`$]")
+_PUNCTUATION = string.punctuation
+
+
+@lru_cache(maxsize=65536)
+def _text_features(text: str) -> tuple[bool, bool, bool]:
+    """(is specific action, has ownership language, has blocker keyword) for one string.
+
+    Cached because next_actions and open_questions are often repeated verbatim
+    across rounds.
+    """
+
+    lowered = text.lower()
+    has_ownership = _OWNERSHIP_RE.search(lowered) is not None
+    has_blocker = _BLOCKER_RE.search(lowered) is not None
+    return _is_specific_lowered(lowered.strip()), has_ownership, has_blocker
+
+
+def _is_specific_lowered(lowered: str) -> bool:
     if not lowered:
         return False
 
-    if any(lowered.startswith(prefix) for prefix in VAGUE_PREFIXES):
+    if _VAGUE_PREFIX_RE.match(lowered):
         return False
-    if any(marker in lowered for marker in VAGUE_MARKERS):
+    if _VAGUE_MARKER_RE.search(lowered):
         return False
 
     words = lowered.split()
-    has_verb = any(word.strip(string.punctuation) in IMPERATIVE_VERBS for word in words)
-    has_concrete_artifact = bool(
-        re.search(r"https?://|\b(pr|branch|file|url|command|tool)\b|\b\w+\.\w+\b|[/`$]", lowered)
-    )
+    has_verb = any(word.strip(_PUNCTUATION) in IMPERATIVE_VERBS for word in words)
     if len(words) < 5 and not has_verb:
         return False
 
-    return has_verb or has_concrete_artifact
+    return has_verb or _CONCRETE_ARTIFACT_RE.search(lowered) is not None
+
+
+def _is_specific_action(action: str) -> bool:
+    return _text_features(action)[0]
 
 
 def _next_actions_score(next_actions: Any) -> float:
@@ -251,12 +416,13 @@ def _next_actions_score(next_actions: Any) -> float:
     if not actions:
         return 0.0
 
-    specific_actions = [a for a in actions if _is_specific_action(a)]
-    if not specific_actions:
+    features = [_text_features(a) for a in actions]
+    specific_count = sum(1 for f in features if f[0])
+    if not specific_count:
         return 0.3
 
-    has_ownership_language = any(marker in a.lower() for a in actions for marker in OWNERSHIP_MARKERS)
-    if len(specific_actions) >= 2 and has_ownership_language:
+    has_ownership_language = any(f[1] for f in features)
+    if specific_count >= 2 and has_ownership_language:
         return 1.0
     return 0.7
 
@@ -278,13 +444,10 @@ def _open_questions_score(current: Any, previous: Any | None) -> float:
 
 
 def _blocker_score(open_questions: Any, next_actions: Any) -> float:
-    texts: list[str] = []
-    if isinstance(open_questions, list):
-        texts.extend(q for q in open_questions if isinstance(q, str))
-    if isinstance(next_actions, list):
-        texts.extend(a for a in next_actions if isinstance(a, str))
-    haystack = "\n".join(texts).lower()
-    return 0.0 if any(keyword in haystack for keyword in BLOCKER_KEYWORDS) else 1.0
+    for texts in (open_questions, next_actions):
+        if isinstance(texts, list) and any(_text_features(t)[2] for t in texts if isinstance(t, str)):
+            return 0.0
+    return 1.0
 
 
 def _readiness_classification(action_readiness: float) -> str:
@@ -295,14 +458,42 @@ def _readiness_classification(action_readiness: float) -> str:
     return "LOW"
 
 
-def _classify_novelty_rate(rate: float) -> str:
-    if rate > HIGH_NOVELTY_THRESHOLD:
+def _classify_novelty_rate(rate: float, low: float = LOW_NOVELTY_THRESHOLD, high: float = HIGH_NOVELTY_THRESHOLD) -> str:
+    if rate > high:
         return "HIGH"
-    if rate < LOW_NOVELTY_THRESHOLD:
+    if rate < low:
         return "LOW"
     return "MEDIUM"
 
 
+def _stop_signal(
+    novelty_classification: str,
+    readiness_classification: str,
+    blocker_present: bool,
+    trailing_low: int,
+    trailing_low_had_high: bool,
+    k_escalate: int = K_LOW_NOVELTY_ESCALATE,
+) -> str:
+    """Decision matrix from docs/novelty-and-readiness-spec.md section 4."""
+
+    if novelty_classification in {"HIGH", "MEDIUM"}:
+        signal = "CONTINUE"
+    elif readiness_classification == "LOW":
+        signal = "ESCALATE"
+    elif blocker_present:
+        signal = "ESCALATE"
+    else:
+        signal = "SHIP"
+
+    if trailing_low >= k_escalate and not trailing_low_had_high:
+        signal = "ESCALATE"
+
+    # Spec intent: blockers are decisive and must prevent SHIP.
+    if blocker_present and signal == "SHIP":
+        signal = "ESCALATE"
+    return signal
+
+
 def _compute_readiness(outputs: dict[str, Any], previous_outputs: dict[str, Any] | None) -> dict[str, float | str]:
     next_score = _next_actions_score(outputs.get("next_actions"))
     oq_score = _open_questions_score(
@@ -320,180 +511,358 @@ def _compute_readiness(outputs: dict[str, Any], previous_outputs: dict[str, Any]
     }
 
 
-def score_transcript(transcript: Dict[str, Any]) -> Dict[str, Any]:
-    rounds = transcript.get("rounds")
-    if not isinstance(rounds, list) or not rounds:
-        raise ValueError("Transcript must contain a non-empty 'rounds' array.")
-
-    seen_claims_l0: set[str] = set()
-    seen_claims_l1: set[str] = set()
-    novelty_by_round: list[dict[str, Any]] = []
-    readiness_by_round: list[dict[str, Any]] = []
-    per_round_novelty_rates: list[float] = []
-
-    # Optional semantic convergence (embeddings). Best-effort; failures should not break scoring.
-    embedding_config = embedding_config_from_env()
-    semantic_centroids: list[list[float] | None] = []
-    semantic_similarity_by_round: list[float | None] = []
-
-    peak_new_l0 = 0
-    peak_new_l1 = 0
-
-    previous_outputs: dict[str, Any] | None = None
-    last_outputs: dict[str, Any] = {}
-    latest_readiness: dict[str, float | str] = {
-        "next_actions_score": 0.0,
-        "open_questions_score": 0.0,
-        "blocker_score": 1.0,
-        "action_readiness": 0.0,
-        "readiness_classification": "LOW",
-    }
-
-    for r in rounds:
-        if not isinstance(r, dict):
-            raise ValueError("Each transcript round must be an object.")
-
+def _round_outputs(r: Any) -> tuple[dict[str, Any], list[Any]]:
+    """A round's `outputs` object and raw claims list, or ValueError for a malformed round."""
+
+    if not isinstance(r, dict):
+        raise ValueError("Each transcript round must be an object.")
+    outputs = r.get("outputs") or {}
+    if not isinstance(outputs, dict):
+        raise ValueError("Each transcript round must contain an object at 'outputs'.")
+    raw_claims = outputs.get("claims")
+    if not isinstance(raw_claims, list):
+        raise ValueError("Each transcript round must contain an array at 'outputs.claims'.")
+    return outputs, raw_claims
+
+
+def validate_round(r: Any) -> None:
+    """Raise ValueError if `r` is not a round `IncrementalScorer.add_round` accepts."""
+
+    _round_outputs(r)
+
+
+class IncrementalScorer:
+    """Round-at-a-time scorer for live loops.
+
+    Keeps the L0/L1 seen-claim state, peak counters, previous outputs and the
+    trailing low-novelty window between calls, so `add_round` does O(new claims)
+    work instead of rescoring the whole transcript. `result()` returns exactly what
+    `score_transcript` returns for the same rounds.
+
+    With `keep_rounds=False` the per-round entries are only returned from
+    `add_round`, not accumulated, so memory does not grow with the number of
+    rounds; use `summary()` for the final verdict (see `dr.output`).
+
+    `profile` (True, a `dr.profiling.Profiler`, or DR_PROFILE=1 by default) times
+    each scoring stage and adds a `timings` block to `summary()` / `result()`.
+
+    With a `claim_store` (`dr.claim_store.ClaimStore` or a path), claims new to this
+    conversation are also looked up among earlier conversations on the same
+    `topic`; matches are listed in the round's `corpus_repeats` (they do not change
+    novelty rates). The round's claims are then recorded under `conversation_id`,
+    unless it is None.
+    """
+
+    def __init__(
+        self,
+        l1_backend: str = "exact",
+        embedding_config: Any = _FROM_ENV,
+        keep_rounds: bool = True,
+        profile: Any = _FROM_ENV,
+        claim_store: Any = None,
+        conversation_id: str | None = None,
+        topic: str | None = None,
+    ) -> None:
+        self.seen_claims_l0: set[str] = set()
+        self.seen_claims_l1 = make_l1_index(l1_backend, JACCARD_THRESHOLD, CLAIM_CACHE.token_ids)
+        self.keep_rounds = keep_rounds
+        self.profiler = _profiler(profile, keep_rounds=keep_rounds)
+        self.rounds_scored = 0
+        self._latest_novelty: dict[str, Any] | None = None
+        self.novelty_by_round: list[dict[str, Any]] = []
+        self.readiness_by_round: list[dict[str, Any]] = []
+        self.semantic_by_round: list[dict[str, Any]] = []
+
+        # Optional semantic convergence (embeddings). Best-effort; failures should not break scoring.
+        self.embedding_config = _embedding_config_from_env() if embedding_config is _FROM_ENV else embedding_config
+        self._prev_centroid: list[float] | None = None
+        self._semantic_similarity: float | None = None
+        # L2 novelty is active whenever embeddings are configured.
+        self.seen_claim_embeddings: Any = None
+        if self.embedding_config:
+            from .vectors import VectorIndex
+
+            self.seen_claim_embeddings = VectorIndex(exact_limit=self.embedding_config.index_exact_limit)
+        # Claims whose vectors are in `seen_claim_embeddings`, so repeats are indexed once.
+        self._embedded_claims: set[str] = set()
+        self.peak_new_l2 = 0
+        self.claim_store = _claim_store(claim_store)
+        self.conversation_id = conversation_id
+        self.topic = topic or ""
+
+        self.peak_new_l0 = 0
+        self.peak_new_l1 = 0
+
+        self.previous_outputs: dict[str, Any] | None = None
+        self.latest_readiness: dict[str, float | str] = {
+            "next_actions_score": 0.0,
+            "open_questions_score": 0.0,
+            "blocker_score": 1.0,
+            "action_readiness": 0.0,
+            "readiness_classification": "LOW",
+        }
+        self.trailing_low = 0
+        # Whether any round in the trailing low-novelty window had HIGH readiness.
+        self._trailing_low_had_high = False
+
+    def __len__(self) -> int:
+        return self.rounds_scored
+
+    def add_round(self, r: Any, embeddings: Any = None) -> Dict[str, Any]:
+        """Score one round and return its entries plus the current stop recommendation.
+
+        `embeddings` optionally supplies this round's claim vectors, already computed
+        (in the sorted order of its normalized claims), or a future resolving to
+        them; by default they are requested here when embeddings are configured.
+        """
+
+        outputs, raw_claims = _round_outputs(r)
         round_number = r.get("round")
-        outputs = r.get("outputs") or {}
-        if not isinstance(outputs, dict):
-            raise ValueError("Each transcript round must contain an object at 'outputs'.")
-
-        raw_claims = outputs.get("claims")
-        if not isinstance(raw_claims, list):
-            raise ValueError("Each transcript round must contain an array at 'outputs.claims'.")
 
+        prof = self.profiler
+        if prof is not None:
+            lap = perf_counter()
         claims = _normalized_round_claims(raw_claims)
+        if prof is not None:
+            lap = prof.lap("normalize", lap)
 
-        # Semantic centroid for the round (optional).
-        centroid: list[float] | None = None
+        # Semantic centroid and L2 novelty for the round (optional).
         sim_to_prev: float | None = None
-        if embedding_config and claims:
+        new_l2_count: int | None = 0 if self.seen_claim_embeddings is not None else None
+        if self.embedding_config and claims:
+            from .semantic import cosine_similarity, count_network, mean_vector
+
             try:
-                embeddings = embed_ollama(embedding_config, claims)
+                if embeddings is not None:
+                    if hasattr(embeddings, "result"):
+                        embeddings = embeddings.result()
+                    if len(embeddings) != len(claims):
+                        raise ValueError("Expected one embedding per normalized claim.")
+                    if prof is not None:
+                        lap = prof.lap("embed", lap)
+                elif prof is not None:
+                    tally = prof.new_tally()
+                    try:
+                        embeddings = count_network(tally, embed_ollama, self.embedding_config, claims)
+                    finally:
+                        prof.add_network(tally)
+                        lap = prof.lap("embed", lap)
+                else:
+                    embeddings = embed_ollama(self.embedding_config, claims)
                 centroid = mean_vector(embeddings)
-                prev_centroid = semantic_centroids[-1] if semantic_centroids else None
-                if prev_centroid is not None:
-                    sim_to_prev = cosine_similarity(prev_centroid, centroid)
+                if self._prev_centroid is not None:
+                    sim_to_prev = cosine_similarity(self._prev_centroid, centroid)
+                best = self.seen_claim_embeddings.max_similarities(embeddings)
+                fresh = [i for i, claim in enumerate(claims) if claim not in self._embedded_claims]
+                self.seen_claim_embeddings.add_many([embeddings[i] for i in fresh])
+                self._embedded_claims.update(claims[i] for i in fresh)
+                new_l2_count = sum(1 for sim in best if sim < L2_SIMILARITY_THRESHOLD)
+                self._prev_centroid = centroid
             except Exception:
-                centroid = None
+                self._prev_centroid = None
                 sim_to_prev = None
-
-        semantic_centroids.append(centroid)
-        semantic_similarity_by_round.append(sim_to_prev)
-
-        new_l0_claims = [claim for claim in claims if claim not in seen_claims_l0]
-
-        new_l1_claims: list[str] = []
-        for claim in claims:
-            if not seen_claims_l1:
-                new_l1_claims.append(claim)
-                continue
-            max_similarity = max(_jaccard_similarity(claim, seen) for seen in seen_claims_l1)
-            if max_similarity < JACCARD_THRESHOLD:
-                new_l1_claims.append(claim)
-
-        seen_claims_l0.update(claims)
+                new_l2_count = None
+            if prof is not None:
+                lap = prof.lap("l2", lap)
+        else:
+            self._prev_centroid = None
+        self._semantic_similarity = sim_to_prev
+
+        seen_claims_l1 = self.seen_claims_l1
+        new_l0_claims = [claim for claim in claims if claim not in self.seen_claims_l0]
+        self.seen_claims_l0.update(claims)
+        if prof is not None:
+            lap = prof.lap("l0", lap)
+        new_l1_claims = [claim for claim in claims if not seen_claims_l1.matches(claim)]
         seen_claims_l1.update(claims)
-
-        peak_new_l0 = max(peak_new_l0, len(new_l0_claims))
-        peak_new_l1 = max(peak_new_l1, len(new_l1_claims))
-
-        novelty_rate_l0 = len(new_l0_claims) / max(peak_new_l0, 1)
-        novelty_rate_l1 = len(new_l1_claims) / max(peak_new_l1, 1)
+        if prof is not None:
+            lap = prof.lap("l1", lap)
+        corpus_repeats: list[dict[str, Any]] | None = None
+        if self.claim_store is not None:
+            corpus_repeats = self._corpus_repeats(claims, new_l1_claims)
+            if prof is not None:
+                lap = prof.lap("corpus", lap)
+
+        self.peak_new_l0 = max(self.peak_new_l0, len(new_l0_claims))
+        self.peak_new_l1 = max(self.peak_new_l1, len(new_l1_claims))
+
+        novelty_rate_l0 = len(new_l0_claims) / max(self.peak_new_l0, 1)
+        novelty_rate_l1 = len(new_l1_claims) / max(self.peak_new_l1, 1)
         novelty_rate_round = min(novelty_rate_l0, novelty_rate_l1)
-        per_round_novelty_rates.append(novelty_rate_round)
-
-        readiness = _compute_readiness(outputs, previous_outputs)
-        readiness_by_round.append(
-            {
-                "round": round_number,
-                "action_readiness": _round_float(readiness["action_readiness"]),
-                "readiness_classification": readiness["readiness_classification"],
-                "next_actions_score": _round_float(readiness["next_actions_score"]),
-                "open_questions_score": _round_float(readiness["open_questions_score"]),
-                "blocker_score": _round_float(readiness["blocker_score"]),
-            }
+        novelty_rate_l2: float | None = None
+        if new_l2_count is not None:
+            self.peak_new_l2 = max(self.peak_new_l2, new_l2_count)
+            novelty_rate_l2 = new_l2_count / max(self.peak_new_l2, 1)
+            novelty_rate_round = min(novelty_rate_round, novelty_rate_l2)
+
+        readiness = _compute_readiness(outputs, self.previous_outputs)
+        if prof is not None:
+            lap = prof.lap("readiness", lap)
+        readiness_entry = {
+            "round": round_number,
+            "action_readiness": _round_float(readiness["action_readiness"]),
+            "readiness_classification": readiness["readiness_classification"],
+            "next_actions_score": _round_float(readiness["next_actions_score"]),
+            "open_questions_score": _round_float(readiness["open_questions_score"]),
+            "blocker_score": _round_float(readiness["blocker_score"]),
+        }
+        novelty_entry = {
+            "round": round_number,
+            "claims": len(claims),
+            "new_claims": min(len(new_l0_claims), len(new_l1_claims)),
+            "new_claims_L0": len(new_l0_claims),
+            "new_claims_L1": len(new_l1_claims),
+            "novelty_rate": _round_float(novelty_rate_round),
+            "novelty_rate_L0": _round_float(novelty_rate_l0),
+            "novelty_rate_L1": _round_float(novelty_rate_l1),
+        }
+        if self.seen_claim_embeddings is not None:
+            # None when embedding this round failed; L2 then sits the round out.
+            novelty_entry["new_claims_L2"] = new_l2_count
+            novelty_entry["novelty_rate_L2"] = _round_float(novelty_rate_l2) if novelty_rate_l2 is not None else None
+            if new_l2_count is not None:
+                novelty_entry["new_claims"] = min(novelty_entry["new_claims"], new_l2_count)
+        if corpus_repeats is not None:
+            novelty_entry["corpus_repeats"] = corpus_repeats
+        semantic_entry = {
+            "round": round_number,
+            "centroid": None,
+            "similarity_to_prev": _round_float(sim_to_prev) if sim_to_prev is not None else None,
+        }
+        if self.keep_rounds:
+            self.readiness_by_round.append(readiness_entry)
+            self.novelty_by_round.append(novelty_entry)
+            self.semantic_by_round.append(semantic_entry)
+        self._latest_novelty = novelty_entry
+        self.rounds_scored += 1
+
+        if novelty_rate_round < LOW_NOVELTY_THRESHOLD:
+            self.trailing_low += 1
+            self._trailing_low_had_high = self._trailing_low_had_high or readiness["readiness_classification"] == "HIGH"
+        else:
+            self.trailing_low = 0
+            self._trailing_low_had_high = False
+
+        self.previous_outputs = outputs
+        self.latest_readiness = readiness
+
+        stop_recommendation, hint, _ = self._stop_recommendation()
+        if prof is not None:
+            prof.lap("stop", lap)
+            prof.end_round(round_number)
+        return {
+            "novelty": novelty_entry,
+            "readiness": readiness_entry,
+            "semantic": semantic_entry,
+            "stop_recommendation": stop_recommendation,
+            "hint": hint,
+        }
+
+    def _corpus_repeats(self, claims: list[str], new_claims: list[str]) -> list[dict[str, Any]]:
+        token_ids = CLAIM_CACHE.token_ids
+        store = self.claim_store
+        matches = store.lookup(
+            self.topic, [token_ids(c) for c in new_claims], JACCARD_THRESHOLD, exclude_conversation=self.conversation_id
         )
-
-        novelty_by_round.append(
-            {
-                "round": round_number,
-                "claims": len(claims),
-                "new_claims": min(len(new_l0_claims), len(new_l1_claims)),
-                "new_claims_L0": len(new_l0_claims),
-                "new_claims_L1": len(new_l1_claims),
-                "novelty_rate": _round_float(novelty_rate_round),
-                "novelty_rate_L0": _round_float(novelty_rate_l0),
-                "novelty_rate_L1": _round_float(novelty_rate_l1),
-            }
+        if self.conversation_id is not None:
+            store.add(self.conversation_id, self.topic, [(c, token_ids(c)) for c in claims])
+        return [
+            {"claim": claim, "conversation_id": match[0], "matched_claim": match[1]}
+            for claim, match in zip(new_claims, matches)
+            if match is not None
+        ]
+
+    def add_rounds(self, rounds: Iterable[Any], prefetch: int | None = None) -> Iterator[Dict[str, Any]]:
+        """`add_round` for each round of an iterable, yielding the updates in order.
+
+        With embeddings configured, the next `prefetch` rounds (default
+        `embedding_config.prefetch`) are embedded on background threads while the
+        current round is scored, so network waits overlap lexical scoring. The
+        updates are the same as calling `add_round` round by round. Rounds are read
+        ahead of scoring, so use `add_round` directly for a live source.
+        """
+
+        prof = self.profiler
+        if prof is not None:
+            rounds = prof.timed(rounds)
+        depth = getattr(self.embedding_config, "prefetch", 0) if prefetch is None else prefetch
+        if not self.embedding_config or depth < 1:
+            for r in rounds:
+                yield self.add_round(r)
+            return
+
+        # Requests overlap rounds, so network use is only counted for the whole run.
+        tally = prof.new_tally() if prof is not None else None
+        try:
+            for r, embeddings in _prefetch_embeddings(rounds, self.embedding_config, depth, tally):
+                yield self.add_round(r, embeddings=embeddings)
+        finally:
+            if prof is not None:
+                prof.add_network(tally, per_round=False)
+
+    def _stop_recommendation(self) -> tuple[Dict[str, Any], str, float]:
+        latest_novelty = self._latest_novelty
+        assert latest_novelty is not None
+        rates = [latest_novelty["novelty_rate_L0"], latest_novelty["novelty_rate_L1"]]
+        if latest_novelty.get("novelty_rate_L2") is not None:
+            rates.append(latest_novelty["novelty_rate_L2"])
+        novelty_rate = _round_float(min(rates))
+        trailing_low = self.trailing_low
+        latest_readiness = self.latest_readiness
+
+        raw_novelty_class = _classify_novelty_rate(novelty_rate)
+        novelty_classification = raw_novelty_class
+
+        readiness_classification = str(latest_readiness["readiness_classification"])
+
+        blocker_present = float(latest_readiness["blocker_score"]) == 0.0
+        signal = _stop_signal(
+            novelty_classification, readiness_classification, blocker_present, trailing_low, self._trailing_low_had_high
         )
 
-        previous_outputs = outputs
-        last_outputs = outputs
-        latest_readiness = readiness
-
-    novelty_rate_l0 = novelty_by_round[-1]["novelty_rate_L0"]
-    novelty_rate_l1 = novelty_by_round[-1]["novelty_rate_L1"]
-    novelty_rate = _round_float(min(novelty_rate_l0, novelty_rate_l1))
-
-    trailing_low = 0
-    for rate in reversed(per_round_novelty_rates):
-        if rate < LOW_NOVELTY_THRESHOLD:
-            trailing_low += 1
+        if signal == "SHIP":
+            hint = "Converged. Ship the decision and verify."
+        elif signal == "ESCALATE":
+            hint = "Converged but blocked or not actionable. Escalate: change scope/owner or unblock dependencies."
         else:
-            break
-
-    raw_novelty_class = _classify_novelty_rate(novelty_rate)
-    novelty_classification = raw_novelty_class
-
-    readiness_classification = str(latest_readiness["readiness_classification"])
-
-    # Decision matrix from docs/novelty-and-readiness-spec.md section 4.
-    blocker_present = float(latest_readiness["blocker_score"]) == 0.0
-    if novelty_classification in {"HIGH", "MEDIUM"}:
-        signal = "CONTINUE"
-    elif readiness_classification == "LOW":
-        signal = "ESCALATE"
-    elif blocker_present:
-        signal = "ESCALATE"
-    else:
-        signal = "SHIP"
-
-    if trailing_low >= K_LOW_NOVELTY_ESCALATE:
-        low_window = readiness_by_round[-trailing_low:]
-        had_high_readiness = any(entry["readiness_classification"] == "HIGH" for entry in low_window)
-        if not had_high_readiness:
-            signal = "ESCALATE"
-
-    # Spec intent: blockers are decisive and must prevent SHIP.
-    if blocker_present and signal == "SHIP":
-        signal = "ESCALATE"
+            hint = "Still producing useful novelty. Continue the loop."
+
+        rationale_parts: list[str] = [
+            f"Novelty is {novelty_classification} (k-consecutive low rounds: {trailing_low}).",
+            f"Action readiness is {readiness_classification}.",
+        ]
+        if blocker_present:
+            rationale_parts.append("Blocker keywords detected in latest open questions/next actions.")
+            if signal == "ESCALATE":
+                rationale_parts.append("Blocker override applied: cannot SHIP while blocked.")
+
+        semantic_similarity = self._semantic_similarity
+        stop_recommendation = {
+            "signal": signal,
+            "novelty_classification": novelty_classification,
+            "readiness_classification": readiness_classification,
+            "k_consecutive_low_novelty": trailing_low,
+            "rationale": " ".join(rationale_parts)
+            + (f" Semantic similarity to previous round: {_round_float(semantic_similarity)}." if semantic_similarity is not None else ""),
+        }
+        return stop_recommendation, hint, novelty_rate
 
-    if signal == "SHIP":
-        hint = "Converged. Ship the decision and verify."
-    elif signal == "ESCALATE":
-        hint = "Converged but blocked or not actionable. Escalate: change scope/owner or unblock dependencies."
-    else:
-        hint = "Still producing useful novelty. Continue the loop."
+    def summary(self) -> Dict[str, Any]:
+        """`result()` without the per-round lists: score, components and the verdict."""
 
-    rationale_parts: list[str] = [
-        f"Novelty is {novelty_classification} (k-consecutive low rounds: {trailing_low}).",
-        f"Action readiness is {readiness_classification}.",
-    ]
-    if blocker_present:
-        rationale_parts.append("Blocker keywords detected in latest open questions/next actions.")
-        if signal == "ESCALATE":
-            rationale_parts.append("Blocker override applied: cannot SHIP while blocked.")
+        latest_novelty = self._latest_novelty
+        if latest_novelty is None:
+            raise ValueError("Transcript must contain a non-empty 'rounds' array.")
 
-    semantic_similarity = semantic_similarity_by_round[-1]
+        stop_recommendation, hint, novelty_rate = self._stop_recommendation()
+        latest_readiness = self.latest_readiness
+        semantic_similarity = self._semantic_similarity
 
-    return {
-        "score": _round_float(1.0 - novelty_rate),
-        "components": {
+        components: Dict[str, Any] = {
             "semantic_similarity": _round_float(semantic_similarity) if semantic_similarity is not None else None,
             "novelty_rate": novelty_rate,
-            "novelty_rate_L0": _round_float(float(novelty_rate_l0)),
-            "novelty_rate_L1": _round_float(float(novelty_rate_l1)),
+            "novelty_rate_L0": _round_float(float(latest_novelty["novelty_rate_L0"])),
+            "novelty_rate_L1": _round_float(float(latest_novelty["novelty_rate_L1"])),
             "structural_agreement": None,
             "action_readiness": _round_float(float(latest_readiness["action_readiness"])),
             "action_readiness_detail": {
@@ -501,24 +870,262 @@ def score_transcript(transcript: Dict[str, Any]) -> Dict[str, Any]:
                 "open_questions_score": _round_float(float(latest_readiness["open_questions_score"])),
                 "blocker_score": _round_float(float(latest_readiness["blocker_score"])),
             },
-        },
-        "novelty_by_round": novelty_by_round,
-        "readiness_by_round": readiness_by_round,
-        "semantic_by_round": [
-            {
-                "round": (r.get("round") if isinstance(r, dict) else None),
-                "centroid": None,
-                "similarity_to_prev": _round_float(s) if s is not None else None,
-            }
-            for r, s in zip(transcript.get("rounds") or [], semantic_similarity_by_round)
-        ],
-        "stop_recommendation": {
-            "signal": signal,
-            "novelty_classification": novelty_classification,
-            "readiness_classification": readiness_classification,
-            "k_consecutive_low_novelty": trailing_low,
-            "rationale": " ".join(rationale_parts)
-            + (f" Semantic similarity to previous round: {_round_float(semantic_similarity)}." if semantic_similarity is not None else ""),
-        },
-        "hint": hint,
+        }
+        if "novelty_rate_L2" in latest_novelty:
+            components["novelty_rate_L2"] = latest_novelty["novelty_rate_L2"]
+
+        out = {
+            "score": _round_float(1.0 - novelty_rate),
+            "components": components,
+            "stop_recommendation": stop_recommendation,
+            "hint": hint,
+        }
+        if self.profiler is not None:
+            out["timings"] = self.profiler.report()
+        return out
+
+    def result(self) -> Dict[str, Any]:
+        """Full score output for the rounds added so far (same shape as `score_transcript`)."""
+
+        if not self.keep_rounds:
+            raise ValueError("Per-round results were not kept (keep_rounds=False); use summary().")
+        out = self.summary()
+        out["novelty_by_round"] = list(self.novelty_by_round)
+        out["readiness_by_round"] = list(self.readiness_by_round)
+        out["semantic_by_round"] = list(self.semantic_by_round)
+        return out
+
+
+def _round_claims(r: Any) -> list[str]:
+    outputs = r.get("outputs") if isinstance(r, dict) else None
+    raw_claims = outputs.get("claims") if isinstance(outputs, dict) else None
+    return _normalized_round_claims(raw_claims) if isinstance(raw_claims, list) else []
+
+
+def _prefetch_embeddings(
+    rounds: Iterable[Any], config: Any, depth: int, tally: Dict[str, int] | None = None
+) -> Iterator[tuple[Any, Any]]:
+    """Yield `(round, embeddings future or None)`, keeping up to `depth` later rounds in flight.
+
+    The requests' network use is added to `tally` (see `dr.semantic.count_network`).
+    """
+
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .semantic import count_network
+
+    pending: deque = deque()
+    executor = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="dr-prefetch")
+    try:
+        it = iter(rounds)
+        while True:
+            try:
+                r = next(it)
+            except StopIteration:
+                break
+            except Exception:
+                # A bad later line must not pre-empt the rounds before it.
+                while pending:
+                    yield pending.popleft()
+                raise
+            claims = _round_claims(r)
+            pending.append((r, executor.submit(count_network, tally, embed_ollama, config, claims) if claims else None))
+            if len(pending) > depth:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def score_transcript(
+    transcript: Dict[str, Any],
+    l1_backend: str = "exact",
+    validate: bool = False,
+    profile: Any = _FROM_ENV,
+    cache: Any = _FROM_ENV,
+    claim_store: Any = _FROM_ENV,
+) -> Dict[str, Any]:
+    """Score a transcript v0.1 dict.
+
+    `l1_backend` selects the L1 paraphrase matcher: "exact" (inverted-index Jaccard,
+    the default) or "minhash" (approximate LSH for very large claim histories).
+    With `validate=True` the transcript is checked against the v0.1 schema first and
+    `dr.schema.TranscriptValidationError` lists every violation before any scoring.
+    `profile` adds a `timings` block (see `IncrementalScorer`).
+
+    `cache` (a directory, a `dr.result_cache.ResultCache`, or DR_RESULT_CACHE_DIR by
+    default) returns the stored output for a transcript already scored with the
+    same parameters; it is keyed by the transcript's canonical JSON. Profiled runs
+    bypass it.
+
+    `claim_store` (a path, a `dr.claim_store.ClaimStore`, or DR_CLAIM_STORE by
+    default) flags claims already stated in other conversations on the
+    transcript's `topic` and records this one's under its `conversation_id` (see
+    `IncrementalScorer`). Its output depends on the store, so it is never cached.
+    """
+
+    profiler = _profiler(profile)
+    store = _claim_store(claim_store)
+    results = _result_cache(cache) if profiler is None and store is None else None
+    if results is not None:
+        from .result_cache import transcript_digest
+
+        key = results.key(transcript_digest(transcript), _cache_params(l1_backend, validate=validate))
+        hit = results.get(key)
+        if hit is not None:
+            return hit
+    if validate:
+        from .schema import TranscriptValidationError, validate_transcript
+
+        start = perf_counter()
+        errors = validate_transcript(transcript)
+        if profiler is not None:
+            profiler.add("validate", perf_counter() - start, per_round=False)
+        if errors:
+            raise TranscriptValidationError(errors)
+    rounds = transcript.get("rounds")
+    if not isinstance(rounds, list) or not rounds:
+        raise ValueError("Transcript must contain a non-empty 'rounds' array.")
+    result = score_rounds(
+        rounds,
+        l1_backend=l1_backend,
+        profile=profiler,
+        claim_store=store,
+        conversation_id=transcript.get("conversation_id"),
+        topic=transcript.get("topic"),
+    )
+    if results is not None and _cacheable(result):
+        results.put(key, result)
+    return result
+
+
+def score_rounds(
+    rounds: Iterable[Any],
+    l1_backend: str = "exact",
+    profile: Any = _FROM_ENV,
+    claim_store: Any = _FROM_ENV,
+    conversation_id: str | None = None,
+    topic: str | None = None,
+) -> Dict[str, Any]:
+    """Score rounds from any iterable (e.g. `dr.io.iter_jsonl_rounds`) without materializing them."""
+
+    scorer = IncrementalScorer(
+        l1_backend=l1_backend,
+        profile=profile,
+        claim_store=_claim_store(claim_store),
+        conversation_id=conversation_id,
+        topic=topic,
+    )
+    for _ in scorer.add_rounds(rounds):
+        pass
+    return scorer.result()
+
+
+def iter_path_rounds(
+    path: str | Path,
+    first: int | None = None,
+    last: int | None = None,
+    reorder_window: int = DEFAULT_REORDER_WINDOW,
+) -> Iterable[Any]:
+    """Rounds of a transcript file: streamed for JSONL traces, loaded for JSON.
+
+    `first`/`last` keep only rounds numbered within those (inclusive) bounds. For a
+    `.drpack` container the footer index is used, so only those records are read.
+    JSONL rounds are reordered within `reorder_window` (see `dr.io.iter_jsonl_rounds`);
+    with `reorder_window=0` the whole trace is loaded and sorted instead.
+    """
+
+    suffix = transcript_suffix(path)
+    if suffix == ".drpack":
+        from .pack import iter_pack_rounds
+
+        return iter_pack_rounds(path, first, last)
+    if suffix == ".jsonl" and reorder_window:
+        rounds: Iterable[Any] = iter_jsonl_rounds(path, reorder_window)
+    else:
+        rounds = load_transcript(path).get("rounds")
+        if not isinstance(rounds, list) or not rounds:
+            raise ValueError("Transcript must contain a non-empty 'rounds' array.")
+    if first is None and last is None:
+        return rounds
+    return (r for r in rounds if _in_round_range(r, first, last))
+
+
+def _in_round_range(r: Any, first: int | None, last: int | None) -> bool:
+    number = r.get("round") if isinstance(r, dict) else None
+    if not isinstance(number, int):
+        return last is None
+    return (first is None or number >= first) and (last is None or number <= last)
+
+
+def score_path(
+    path: str | Path,
+    l1_backend: str = "exact",
+    first: int | None = None,
+    last: int | None = None,
+    validate: bool = False,
+    profile: Any = _FROM_ENV,
+    cache: Any = _FROM_ENV,
+    claim_store: Any = _FROM_ENV,
+    reorder_window: int = DEFAULT_REORDER_WINDOW,
+) -> Dict[str, Any]:
+    """Load and score a transcript file; JSONL traces and packs are streamed into the scorer.
+
+    With `validate=True` the whole file is schema-checked in a streaming pass first
+    (see `dr.schema.validate_path`), so a bad round fails the file before any scoring.
+    With profiling on, `timings.stages` also has `validate` and `load` (reading a
+    whole JSON document; streamed formats are charged to `parse` round by round).
+
+    With a result cache (`cache`, see `score_transcript`) the file is keyed by the
+    SHA-256 of its bytes and its suffix, so a hit skips parsing entirely. With a
+    `claim_store` the file's header supplies `conversation_id` and `topic`.
+
+    A JSONL round displaced by more than `reorder_window` rounds aborts the stream;
+    the file is then scored again from all of its rounds sorted, as `load_transcript`
+    orders them, so the result never depends on the window.
+    """
+
+    profiler = _profiler(profile)
+    store = _claim_store(claim_store)
+    results = _result_cache(cache) if profiler is None and store is None else None
+    if results is not None:
+        from .result_cache import file_digest
+
+        params = _cache_params(
+            l1_backend, validate=validate, first=first, last=last, suffix=transcript_suffix(path)
+        )
+        key = results.key(file_digest(path), params)
+        hit = results.get(key)
+        if hit is not None:
+            return hit
+    if validate:
+        from .schema import check_path
+
+        start = perf_counter()
+        check_path(path)
+        if profiler is not None:
+            profiler.add("validate", perf_counter() - start, per_round=False)
+    start = perf_counter()
+    header = read_transcript_header(path) if store is not None else {}
+    rounds = iter_path_rounds(path, first, last, reorder_window)
+    if profiler is not None:
+        profiler.add("load", perf_counter() - start, per_round=False)
+    kwargs = {
+        "l1_backend": l1_backend,
+        "claim_store": store,
+        "conversation_id": header.get("conversation_id"),
+        "topic": header.get("topic"),
     }
+    try:
+        result = score_rounds(rounds, profile=profiler, **kwargs)
+    except ReorderWindowExceeded:
+        # Recording claims again is a no-op, so the aborted pass leaves the store as it was.
+        # Stage totals keep its time (it was spent); its per-round entries are dropped.
+        if profiler is not None:
+            profiler.rounds.clear()
+        result = score_rounds(iter_path_rounds(path, first, last, reorder_window=0), profile=profiler, **kwargs)
+    if results is not None and _cacheable(result):
+        results.put(key, result)
+    return result
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import contextvars
+import http.client
 import json
 import os
-import urllib.request
+import queue
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from operator import mul
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -12,6 +20,16 @@ class EmbeddingConfig:
     url: str
     model: str
     timeout_s: float = 10.0
+    # Prompts per POST /api/embed request, and how many requests may be in flight at once.
+    batch_size: int = 32
+    concurrency: int = 4
+    # Optional on-disk embedding cache (see dr.embedding_cache).
+    cache_dir: Optional[str] = None
+    cache_max_entries: int = 200_000
+    # Rounds embedded ahead of the one being scored (`IncrementalScorer.add_rounds`); 0 disables.
+    prefetch: int = 4
+    # Seen-claim vectors compared by brute force before L2 switches to an IVF index (dr.vectors.VectorIndex).
+    index_exact_limit: int = 2048
 
 
 def embedding_config_from_env() -> Optional[EmbeddingConfig]:
@@ -20,6 +38,13 @@ def embedding_config_from_env() -> Optional[EmbeddingConfig]:
     Environment variables:
     - DR_OLLAMA_URL: e.g. http://127.0.0.1:11434
     - DR_OLLAMA_EMBED_MODEL: e.g. nomic-embed-text (default)
+    - DR_OLLAMA_TIMEOUT_S: per-request timeout in seconds (default 10)
+    - DR_OLLAMA_BATCH_SIZE: prompts per batch request (default 32)
+    - DR_OLLAMA_CONCURRENCY: max concurrent requests (default 4)
+    - DR_EMBED_CACHE_DIR: directory for the persistent embedding cache (off if unset)
+    - DR_EMBED_CACHE_MAX_ENTRIES: LRU bound on cached vectors (default 200000)
+    - DR_OLLAMA_PREFETCH: rounds embedded ahead while scoring a transcript (default 4, 0 = off)
+    - DR_L2_EXACT_LIMIT: distinct claims searched by brute force before L2 uses IVF (default 2048)
     """
 
     url = os.environ.get("DR_OLLAMA_URL")
@@ -27,19 +52,27 @@ def embedding_config_from_env() -> Optional[EmbeddingConfig]:
         return None
     model = os.environ.get("DR_OLLAMA_EMBED_MODEL") or "nomic-embed-text"
     timeout_s = float(os.environ.get("DR_OLLAMA_TIMEOUT_S") or "10")
-    return EmbeddingConfig(url=url.rstrip("/"), model=model, timeout_s=timeout_s)
+    batch_size = max(1, int(os.environ.get("DR_OLLAMA_BATCH_SIZE") or "32"))
+    concurrency = max(1, int(os.environ.get("DR_OLLAMA_CONCURRENCY") or "4"))
+    return EmbeddingConfig(
+        url=url.rstrip("/"),
+        model=model,
+        timeout_s=timeout_s,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        cache_dir=os.environ.get("DR_EMBED_CACHE_DIR") or None,
+        cache_max_entries=int(os.environ.get("DR_EMBED_CACHE_MAX_ENTRIES") or "200000"),
+        prefetch=max(0, int(os.environ.get("DR_OLLAMA_PREFETCH") or "4")),
+        index_exact_limit=max(0, int(os.environ.get("DR_L2_EXACT_LIMIT") or "2048")),
+    )
 
 
 def cosine_similarity(a: List[float], b: List[float]) -> float:
     if len(a) != len(b):
         raise ValueError("Vectors must have same dimension")
-    dot = 0.0
-    na = 0.0
-    nb = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        na += x * x
-        nb += y * y
+    dot = sum(map(mul, a, b), 0.0)
+    na = sum(map(mul, a, a), 0.0)
+    nb = sum(map(mul, b, b), 0.0)
     if na == 0.0 and nb == 0.0:
         return 1.0
     if na == 0.0 or nb == 0.0:
@@ -55,40 +88,262 @@ def mean_vector(vectors: Iterable[List[float]]) -> List[float]:
     if any(len(v) != dim for v in vectors):
         raise ValueError("Vectors must have same dimension")
 
-    out = [0.0] * dim
-    for v in vectors:
-        for i, x in enumerate(v):
-            out[i] += float(x)
     n = float(len(vectors))
-    return [x / n for x in out]
+    return [sum(map(float, column), 0.0) / n for column in zip(*vectors)]
+
+
+class _EndpointNotFound(Exception):
+    pass
+
+
+def _error_message(data: bytes) -> Optional[str]:
+    """The `error` field of an Ollama JSON error body, if there is one."""
+
+    try:
+        parsed = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    error = parsed.get("error") if isinstance(parsed, dict) else None
+    return error if isinstance(error, str) else None
+
+
+class OllamaEmbeddingClient:
+    """Embedding client with batching, keep-alive connections and bounded concurrency.
+
+    Prompts are sent in batches of `config.batch_size` to POST {url}/api/embed. If the
+    server does not have that endpoint (older Ollama), the client falls back to one
+    POST {url}/api/embeddings per prompt. A 404 naming the model (not pulled, or a
+    typo) is an error like any other and leaves the endpoint undecided. Up to `config.concurrency` requests run on
+    worker threads, each reusing a pooled HTTP/1.1 connection.
+    """
+
+    def __init__(self, config: EmbeddingConfig) -> None:
+        self.config = config
+        parts = urllib.parse.urlsplit(config.url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported embedding URL: {config.url!r}")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._base_path = parts.path.rstrip("/")
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # None until the first batch request tells us whether /api/embed exists.
+        self.batch_supported: Optional[bool] = None
+        # Completed round trips and payload bytes (request bodies sent, response bodies read).
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self.config.timeout_s)
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        try:
+            conn = self._pool.get_nowait()
+            reused = True
+        except queue.Empty:
+            conn = self._connect()
+            reused = False
+        try:
+            try:
+                conn.request("POST", self._base_path + path, body=body, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.CannotSendRequest):
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry once on a fresh one.
+                conn.close()
+                conn = self._connect()
+                conn.request("POST", self._base_path + path, body=body, headers=headers)
+                resp = conn.getresponse()
+            data = resp.read()
+            with self._lock:
+                self.requests += 1
+                self.bytes_sent += len(body)
+                self.bytes_received += len(data)
+            tally = _network_tally.get()
+            if tally is not None:
+                with _tally_lock:
+                    tally["requests"] += 1
+                    tally["bytes_sent"] += len(body)
+                    tally["bytes_received"] += len(data)
+        except BaseException:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._pool.put(conn)
+        if resp.status >= 400:
+            error = _error_message(data)
+            # Ollama also answers 404 for a model it does not have; only a 404 without
+            # such an error means the endpoint itself is missing.
+            if resp.status == 404 and (error is None or "model" not in error.lower()):
+                raise _EndpointNotFound(path)
+            raise OSError(f"Ollama {path} returned HTTP {resp.status}" + (f": {error}" if error else ""))
+        parsed = json.loads(data.decode("utf-8"))
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Ollama {path} returned a non-object response")
+        return parsed
+
+    def _embed_batch(self, prompts: List[str]) -> List[List[float]]:
+        if self.batch_supported is not False:
+            try:
+                data = self._post("/api/embed", {"model": self.config.model, "input": prompts})
+            except _EndpointNotFound:
+                self.batch_supported = False
+            else:
+                self.batch_supported = True
+                embeddings = data.get("embeddings")
+                if not isinstance(embeddings, list) or len(embeddings) != len(prompts):
+                    raise ValueError("Ollama embed response missing 'embeddings'")
+                out: List[List[float]] = []
+                for emb in embeddings:
+                    if not isinstance(emb, list) or not emb:
+                        raise ValueError("Ollama embed response has an empty embedding")
+                    out.append([float(x) for x in emb])
+                return out
+        return [self._embed_one(prompt) for prompt in prompts]
+
+    def _embed_one(self, prompt: str) -> List[float]:
+        data = self._post("/api/embeddings", {"model": self.config.model, "prompt": prompt})
+        emb = data.get("embedding")
+        if not isinstance(emb, list) or not emb:
+            raise ValueError("Ollama embeddings response missing 'embedding'")
+        return [float(x) for x in emb]
+
+    def embed(self, prompts: List[str]) -> List[List[float]]:
+        """Embed prompts, preserving order."""
+
+        if not prompts:
+            return []
+        size = max(1, self.config.batch_size)
+        batches = [prompts[i : i + size] for i in range(0, len(prompts), size)]
+        if self.batch_supported is None:
+            # Probe the batch endpoint once before fanning out.
+            first = self._embed_batch(batches[0])
+            batches = batches[1:]
+        else:
+            first = []
+
+        workers = max(1, self.config.concurrency)
+        if self.batch_supported is False:
+            # Legacy endpoint: one prompt per request, so parallelize across prompts.
+            batches = [[p] for batch in batches for p in batch]
+        if len(batches) <= 1 or workers == 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dr-embed")
+                executor = self._executor
+            # Each batch runs in a copy of the caller's context, so `count_network` sees it.
+            contexts = [contextvars.copy_context() for _ in batches]
+            results = list(executor.map(lambda ctx, batch: ctx.run(self._embed_batch, batch), contexts, batches))
+
+        out = list(first)
+        for batch_embeddings in results:
+            out.extend(batch_embeddings)
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_clients: Dict[EmbeddingConfig, OllamaEmbeddingClient] = {}
+_clients_lock = threading.Lock()
+
+
+def embedding_client(config: EmbeddingConfig) -> OllamaEmbeddingClient:
+    """Return the shared client for `config`, so connections are reused across calls."""
+
+    with _clients_lock:
+        client = _clients.get(config)
+        if client is None:
+            client = _clients[config] = OllamaEmbeddingClient(config)
+        return client
+
+
+# The tally `count_network` is filling for the current caller, if any.
+_network_tally: "contextvars.ContextVar[Optional[Dict[str, int]]]" = contextvars.ContextVar(
+    "dr_network_tally", default=None
+)
+_tally_lock = threading.Lock()
+
+
+def count_network(tally: Optional[Dict[str, int]], fn: Callable[..., T], *args: Any) -> T:
+    """Call `fn(*args)`, adding the round trips and payload bytes of its embedding requests to `tally`.
+
+    Requests the client makes on its worker threads are included. Only this call's
+    requests are counted, so concurrent scorers (`dr serve` sessions, prefetch
+    threads) each get their own numbers; `dr.profiling` uses this per round.
+    """
+
+    token = _network_tally.set(tally)
+    try:
+        return fn(*args)
+    finally:
+        _network_tally.reset(token)
+
+
+def network_counters() -> Dict[str, int]:
+    """Round trips and payload bytes so far, summed over every shared client in the process.
+
+    Includes every caller's requests; use `count_network` to attribute them.
+    """
+
+    totals = {"requests": 0, "bytes_sent": 0, "bytes_received": 0}
+    with _clients_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        with client._lock:
+            totals["requests"] += client.requests
+            totals["bytes_sent"] += client.bytes_sent
+            totals["bytes_received"] += client.bytes_received
+    return totals
 
 
 def embed_ollama(config: EmbeddingConfig, prompts: List[str]) -> List[List[float]]:
-    """Embed prompts using Ollama's embeddings endpoint.
+    """Embed prompts using Ollama's embedding endpoints.
 
-    Calls POST {url}/api/embeddings with JSON: {model, prompt}
+    Uses POST {url}/api/embed with JSON {model, input: [...]} in batches, falling back
+    to POST {url}/api/embeddings with {model, prompt} for servers without it. See
+    `OllamaEmbeddingClient`.
+
+    When `config.cache_dir` is set, vectors are served from the on-disk
+    `EmbeddingCache` and only misses go to the network.
 
     Notes:
     - We intentionally keep this stdlib-only to avoid extra deps.
     - This is best-effort; caller should handle exceptions.
     """
 
-    out: List[List[float]] = []
-    endpoint = f"{config.url}/api/embeddings"
-
-    for prompt in prompts:
-        payload = json.dumps({"model": config.model, "prompt": prompt}).encode("utf-8")
-        req = urllib.request.Request(
-            endpoint,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=config.timeout_s) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        emb = data.get("embedding")
-        if not isinstance(emb, list) or not emb:
-            raise ValueError("Ollama embeddings response missing 'embedding'")
-        out.append([float(x) for x in emb])
+    prompts = list(prompts)
+    client = embedding_client(config)
+    if not config.cache_dir:
+        return client.embed(prompts)
+
+    from .embedding_cache import embedding_cache
 
-    return out
+    cache = embedding_cache(config.cache_dir, max_entries=config.cache_max_entries)
+    cached = cache.get_many(config.model, prompts)
+    missing = list(dict.fromkeys(p for p, v in zip(prompts, cached) if v is None))
+    if missing:
+        fetched = dict(zip(missing, client.embed(missing)))
+        cache.put_many(config.model, missing, [fetched[p] for p in missing])
+        cached = [v if v is not None else fetched[p] for p, v in zip(prompts, cached)]
+    return [v for v in cached if v is not None]
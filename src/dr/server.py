@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import unquote
+
+from .score import (
+    IncrementalScorer,
+    claim_store_from_env,
+    profile_from_env,
+    result_cache_from_env,
+    score_transcript,
+    validate_round,
+)
+from .semantic import embedding_config_from_env
+
+DEFAULT_IDLE_TIMEOUT_S = 900.0
+DEFAULT_MAX_SESSIONS = 10_000
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+class _Session:
+    __slots__ = ("scorer", "lock", "last_used")
+
+    def __init__(self, scorer: IncrementalScorer, now: float) -> None:
+        self.scorer = scorer
+        self.lock = threading.Lock()
+        self.last_used = now
+
+
+class SessionStore:
+    """Per-conversation incremental scorers with idle and LRU eviction.
+
+    A session is dropped once it has been idle for `idle_timeout` seconds, and the
+    least recently used session is dropped when more than `max_sessions` are live.
+    Eviction runs on every access, so no background thread is needed.
+    `scorer_factory` builds a conversation's scorer from its ID.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_S,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        scorer_factory: Callable[[str], IncrementalScorer] = lambda conversation_id: IncrementalScorer(
+            conversation_id=conversation_id
+        ),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._factory = scorer_factory
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self, now: float) -> None:
+        while self._sessions:
+            key, session = next(iter(self._sessions.items()))
+            if len(self._sessions) > self.max_sessions or now - session.last_used >= self.idle_timeout:
+                del self._sessions[key]
+                self.evicted += 1
+            else:
+                break
+
+    def get(self, conversation_id: str, create: bool = False) -> Optional[_Session]:
+        now = self._clock()
+        with self._lock:
+            self._evict(now)
+            session = self._sessions.get(conversation_id)
+            if session is None:
+                if not create:
+                    return None
+                session = self._sessions[conversation_id] = _Session(self._factory(conversation_id), now)
+                self._evict(now)
+            else:
+                session.last_used = now
+                self._sessions.move_to_end(conversation_id)
+            return session
+
+    def drop(self, conversation_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(conversation_id, None) is not None
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    """JSON API.
+
+    - POST /score                               body: transcript -> score_transcript output
+    - POST /conversations/{id}/rounds           body: round or {"rounds": [...]} -> latest round update
+    - GET  /conversations/{id}                  -> score_transcript output for the rounds so far
+    - DELETE /conversations/{id}                -> drop the session
+    - GET  /healthz
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "dr-serve"
+    # Buffer each response so headers and body leave in one write (flushed after
+    # every request). Written separately, Nagle plus the client's delayed ACK
+    # holds the body back ~40ms on a keep-alive TCP connection.
+    wbufsize = -1
+    store: SessionStore
+    # Keyword arguments for `score_transcript`, resolved once by `make_server`.
+    score_options: Dict[str, Any] = {}
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _read_json(self) -> Any:
+        header = self.headers.get("Content-Length")
+        if header is None:
+            raise _HttpError(411, "Content-Length required.")
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise _HttpError(400, f"Invalid Content-Length: {header!r}")
+        if length > MAX_BODY_BYTES:
+            raise _HttpError(413, "Request body too large.")
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise _HttpError(400, f"Invalid JSON body: {exc}") from exc
+
+    def _send(self, status: int, body: Any) -> None:
+        data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self) -> Tuple[str, Optional[str]]:
+        parts = [unquote(p) for p in self.path.split("?", 1)[0].strip("/").split("/")]
+        if parts == ["score"]:
+            return "score", None
+        if parts == ["healthz"]:
+            return "healthz", None
+        if len(parts) == 2 and parts[0] == "conversations":
+            return "conversation", parts[1]
+        if len(parts) == 3 and parts[0] == "conversations" and parts[2] == "rounds":
+            return "rounds", parts[1]
+        raise _HttpError(404, f"No such endpoint: {self.path}")
+
+    def _dispatch(self, method: str) -> None:
+        try:
+            route, conversation_id = self._route()
+            self._send(200, self._handle(method, route, conversation_id))
+        except (_HttpError, ValueError) as exc:
+            # The request body may be unread; don't reuse this connection.
+            self.close_connection = True
+            self._send(getattr(exc, "status", 400), {"error": str(exc)})
+        except Exception as exc:  # a scoring, embedding or store failure still gets a response
+            self.close_connection = True
+            self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+    def _handle(self, method: str, route: str, conversation_id: Optional[str]) -> Any:
+        store = self.store
+        if route == "healthz" and method == "GET":
+            return {"ok": True, "sessions": len(store), "evicted": store.evicted}
+
+        if route == "score" and method == "POST":
+            transcript = self._read_json()
+            if not isinstance(transcript, dict):
+                raise _HttpError(400, "Transcript must be a JSON object.")
+            return score_transcript(transcript, **self.score_options)
+
+        if route == "rounds" and method == "POST":
+            body = self._read_json()
+            rounds = body.get("rounds") if isinstance(body, dict) and "rounds" in body else [body]
+            if not isinstance(rounds, list) or not rounds:
+                raise _HttpError(400, "Expected a round object or a non-empty 'rounds' array.")
+            # All or nothing: a bad round rejects the request before any round is applied.
+            for r in rounds:
+                validate_round(r)
+            session = store.get(conversation_id or "", create=True)
+            assert session is not None
+            with session.lock:
+                for r in rounds:
+                    update = session.scorer.add_round(r)
+            return update
+
+        if route == "conversation":
+            if method == "DELETE":
+                if not store.drop(conversation_id or ""):
+                    raise _HttpError(404, f"Unknown conversation: {conversation_id}")
+                return {"deleted": conversation_id}
+            if method == "GET":
+                session = store.get(conversation_id or "")
+                if session is None:
+                    raise _HttpError(404, f"Unknown conversation: {conversation_id}")
+                with session.lock:
+                    return session.scorer.result()
+
+        raise _HttpError(405, f"{method} not allowed on {self.path}")
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self) -> Tuple[socket.socket, Tuple[str, int]]:
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects an (host, port) client address.
+        return request, ("unix", 0)
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[str] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_S,
+    max_sessions: int = DEFAULT_MAX_SESSIONS,
+    l1_backend: str = "exact",
+) -> socketserver.BaseServer:
+    """Build (but do not start) a scoring server on localhost TCP or a Unix socket.
+
+    The environment is read once, here: the embedding config, DR_CLAIM_STORE and
+    DR_PROFILE apply alike to `/score` and to every session (whose claims are
+    recorded under its conversation ID), and DR_RESULT_CACHE_DIR to `/score`.
+    """
+
+    embedding_config = embedding_config_from_env()
+    options: Dict[str, Any] = {
+        "l1_backend": l1_backend,
+        # A flag, not a Profiler: each request or session gets its own.
+        "profile": profile_from_env(),
+        "claim_store": claim_store_from_env(),
+    }
+    store = SessionStore(
+        idle_timeout=idle_timeout,
+        max_sessions=max_sessions,
+        scorer_factory=lambda conversation_id: IncrementalScorer(
+            embedding_config=embedding_config, conversation_id=conversation_id, **options
+        ),
+    )
+    score_options = dict(options, cache=result_cache_from_env())
+    handler = type("BoundScoringHandler", (ScoringHandler,), {"store": store, "score_options": score_options})
+
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        return _UnixHTTPServer(unix_socket, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(**kwargs: Any) -> None:
+    server = make_server(**kwargs)
+    unix_socket = kwargs.get("unix_socket")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if unix_socket and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+from array import array
+from operator import mul
+from typing import Any, Iterable, List, Sequence
+
+try:  # Optional fast path; everything works without NumPy.
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on the environment
+    _np = None
+
+BACKENDS = ("numpy", "python")
+_KMEANS_ITERATIONS = 6
+
+
+def default_backend() -> str:
+    """NumPy when installed, else the stdlib path. Override with DR_VECTOR_BACKEND."""
+
+    forced = os.environ.get("DR_VECTOR_BACKEND")
+    if forced:
+        if forced not in BACKENDS:
+            raise ValueError(f"Unknown DR_VECTOR_BACKEND {forced!r}; expected one of: {', '.join(BACKENDS)}.")
+        return forced
+    return "numpy" if _np is not None else "python"
+
+
+def _cosine(dot: float, nq: float, nr: float) -> float:
+    # Same zero-vector conventions as dr.semantic.cosine_similarity.
+    if nq == 0.0 and nr == 0.0:
+        return 1.0
+    if nq == 0.0 or nr == 0.0:
+        return 0.0
+    return dot / (nq * nr)
+
+
+class VectorMatrix:
+    """Growable matrix of float32 embeddings with batched cosine similarity.
+
+    Rows live in one contiguous NumPy float32 buffer (doubling capacity) when
+    NumPy is available, or as `array('f')` rows otherwise. Row norms are cached on
+    insert, so comparing k queries against n rows is a single k x n product on the
+    NumPy path and one pass of `sum(map(mul, ...))` per pair on the stdlib path.
+    """
+
+    def __init__(self, dim: int | None = None, backend: str | None = None) -> None:
+        backend = backend or default_backend()
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown vector backend {backend!r}; expected one of: {', '.join(BACKENDS)}.")
+        if backend == "numpy" and _np is None:
+            raise ValueError("The numpy vector backend requires NumPy to be installed.")
+        self.backend = backend
+        self.dim = dim
+        self._n = 0
+        self._rows: List[array] = []
+        self._norms: List[float] = []
+        self._matrix: Any = None
+        self._np_norms: Any = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _check_dim(self, vector: Sequence[float]) -> None:
+        if self.dim is None:
+            if not len(vector):
+                raise ValueError("Vectors must be non-empty")
+            self.dim = len(vector)
+        elif len(vector) != self.dim:
+            raise ValueError("Vectors must have same dimension")
+
+    def append(self, vector: Sequence[float]) -> None:
+        self.extend([vector])
+
+    def extend(self, vectors: Iterable[Sequence[float]]) -> None:
+        vectors = list(vectors)
+        if not vectors:
+            return
+        for v in vectors:
+            self._check_dim(v)
+
+        if self.backend == "python":
+            for v in vectors:
+                row = array("f", v)
+                self._rows.append(row)
+                self._norms.append(math.sqrt(sum(map(mul, row, row))))
+            self._n += len(vectors)
+            return
+
+        block = _np.asarray(vectors, dtype=_np.float32)
+        needed = self._n + len(block)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = max(needed, 2 * (len(self._matrix) if self._matrix is not None else 0), 16)
+            grown = _np.empty((capacity, self.dim), dtype=_np.float32)
+            grown_norms = _np.empty(capacity, dtype=_np.float64)
+            if self._n:
+                grown[: self._n] = self._matrix[: self._n]
+                grown_norms[: self._n] = self._np_norms[: self._n]
+            self._matrix, self._np_norms = grown, grown_norms
+        self._matrix[self._n : needed] = block
+        self._np_norms[self._n : needed] = _np.linalg.norm(block.astype(_np.float64), axis=1)
+        self._n = needed
+
+    def row(self, i: int) -> List[float]:
+        if not -self._n <= i < self._n:
+            raise IndexError(i)
+        if self.backend == "python":
+            return self._rows[i].tolist()
+        return self._matrix[: self._n][i].astype(float).tolist()
+
+    def similarity_matrix(self, queries: Sequence[Sequence[float]]) -> List[List[float]]:
+        """Cosine similarity of each query (rows) against every stored vector (columns)."""
+
+        queries = list(queries)
+        for q in queries:
+            if self.dim is not None and len(q) != self.dim:
+                raise ValueError("Vectors must have same dimension")
+        if not queries or not self._n:
+            return [[] for _ in queries]
+
+        if self.backend == "python":
+            out: List[List[float]] = []
+            rows, norms = self._rows, self._norms
+            for q in queries:
+                qf = array("f", q)
+                nq = math.sqrt(sum(map(mul, qf, qf)))
+                out.append([_cosine(sum(map(mul, qf, row)), nq, nr) for row, nr in zip(rows, norms)])
+            return out
+
+        return self._np_similarity(queries).tolist()
+
+    def _np_similarity(self, queries: List[Sequence[float]]) -> Any:
+        q = _np.asarray(queries, dtype=_np.float32)
+        nq = _np.linalg.norm(q.astype(_np.float64), axis=1)
+        nr = self._np_norms[: self._n]
+        dots = (q @ self._matrix[: self._n].T).astype(_np.float64)
+        denom = _np.outer(nq, nr)
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            sims = _np.where(denom > 0.0, dots / _np.where(denom > 0.0, denom, 1.0), 0.0)
+        both_zero = _np.outer(nq == 0.0, nr == 0.0)
+        sims[both_zero] = 1.0
+        return sims
+
+    def similarities(self, query: Sequence[float]) -> List[float]:
+        return self.similarity_matrix([query])[0]
+
+    def max_similarities(self, queries: Sequence[Sequence[float]]) -> List[float]:
+        """Best cosine similarity of each query against the stored vectors (-inf if empty)."""
+
+        queries = list(queries)
+        if not self._n:
+            return [float("-inf")] * len(queries)
+        if self.backend == "numpy" and queries:
+            for q in queries:
+                if len(q) != self.dim:
+                    raise ValueError("Vectors must have same dimension")
+            return self._np_similarity(queries).max(axis=1).tolist()
+        return [max(row) for row in self.similarity_matrix(queries)]
+
+    def mean(self) -> List[float]:
+        if not self._n:
+            raise ValueError("Cannot compute mean of empty vector list")
+        if self.backend == "python":
+            n = float(self._n)
+            return [math.fsum(col) / n for col in zip(*self._rows)]
+        return self._matrix[: self._n].astype(_np.float64).mean(axis=0).tolist()
+
+
+class VectorIndex:
+    """Nearest-neighbour index for "best cosine similarity against everything seen".
+
+    Up to `exact_limit` vectors it is a brute-force `VectorMatrix`. Past that it
+    builds an inverted-file (IVF) index: spherical k-means over a sample picks
+    about sqrt(n) centroids, every vector is filed under its nearest centroid, and
+    a query is compared only against the members of its `nprobe` nearest clusters.
+    The clustering is rebuilt whenever the index doubles in size.
+
+    IVF results are approximate: a true nearest neighbour filed under a cluster
+    that was not probed is missed, so `max_similarities` can under-report. On
+    clustered embeddings the default `nprobe=8` keeps the "is any seen vector at
+    or above the L2 threshold" decision at >= 95% recall versus brute force (see
+    tests/test_vectors.py); raise `nprobe` to trade speed for recall.
+    """
+
+    def __init__(
+        self,
+        exact_limit: int = 2048,
+        nprobe: int = 8,
+        train_sample: int = 4096,
+        backend: str | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.exact_limit = exact_limit
+        self.nprobe = nprobe
+        self.train_sample = train_sample
+        self.backend = backend or default_backend()
+        self._rng = random.Random(seed)
+        self._all = VectorMatrix(backend=self.backend)
+        self._centroids: VectorMatrix | None = None
+        self._lists: List[VectorMatrix] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    @property
+    def is_approximate(self) -> bool:
+        return self._centroids is not None
+
+    def add_many(self, vectors: Sequence[Sequence[float]]) -> None:
+        vectors = list(vectors)
+        if not vectors:
+            return
+        self._all.extend(vectors)
+        n = len(self._all)
+        if n <= self.exact_limit:
+            return
+        if self._centroids is None or n >= 2 * self._trained_size:
+            self._train()
+        else:
+            self._assign(vectors)
+
+    def _assign(self, vectors: List[Sequence[float]]) -> None:
+        assert self._centroids is not None
+        for v, sims in zip(vectors, self._centroids.similarity_matrix(vectors)):
+            self._lists[max(range(len(sims)), key=sims.__getitem__)].append(v)
+
+    def _train(self) -> None:
+        n = len(self._all)
+        k = max(2, math.isqrt(n))
+        # The stdlib path pays per element, so it trains on a smaller sample.
+        sample_size = self.train_sample if self.backend == "numpy" else min(self.train_sample, 8 * k)
+        sample_ids = self._rng.sample(range(n), min(n, max(sample_size, k)))
+        init_ids = self._rng.sample(range(len(sample_ids)), k)
+
+        if self.backend == "numpy":
+            rows = self._all._matrix[:n].astype(_np.float64)
+            unit = rows / _np.maximum(_np.linalg.norm(rows, axis=1, keepdims=True), 1e-12)
+            sample = unit[sample_ids]
+            centroids = sample[init_ids].copy()
+            for _ in range(_KMEANS_ITERATIONS):
+                labels = (sample @ centroids.T).argmax(axis=1)
+                for c in range(k):
+                    group = sample[labels == c]
+                    if len(group):
+                        centroids[c] = group.mean(axis=0)
+            labels = (unit @ centroids.T).argmax(axis=1)
+            self._centroids = VectorMatrix(backend=self.backend)
+            self._centroids.extend(centroids)
+            self._lists = [VectorMatrix(dim=self._all.dim, backend=self.backend) for _ in range(k)]
+            for c in range(k):
+                self._lists[c].extend(self._all._matrix[:n][labels == c])
+            self._trained_size = n
+            return
+
+        sample = [self._all.row(i) for i in sample_ids]
+        centroids = [sample[i] for i in init_ids]
+        for _ in range(_KMEANS_ITERATIONS):
+            matrix = VectorMatrix(backend=self.backend)
+            matrix.extend(centroids)
+            members: List[List[Sequence[float]]] = [[] for _ in range(k)]
+            for v, sims in zip(sample, matrix.similarity_matrix(sample)):
+                members[max(range(k), key=sims.__getitem__)].append(v)
+            for c, group in enumerate(members):
+                if group:
+                    # Spherical k-means: only the centroid direction matters for cosine.
+                    norms = [math.sqrt(sum(map(mul, v, v))) or 1.0 for v in group]
+                    centroids[c] = [sum(x / nv for x, nv in zip(col, norms)) / len(group) for col in zip(*group)]
+
+        self._centroids = VectorMatrix(backend=self.backend)
+        self._centroids.extend(centroids)
+        self._lists = [VectorMatrix(dim=self._all.dim, backend=self.backend) for _ in range(k)]
+        self._assign([self._all.row(i) for i in range(n)])
+        self._trained_size = n
+
+    def max_similarities(self, queries: Sequence[Sequence[float]]) -> List[float]:
+        """Best cosine similarity of each query against the indexed vectors (-inf if empty)."""
+
+        queries = list(queries)
+        if self._centroids is None:
+            return self._all.max_similarities(queries)
+
+        best = [float("-inf")] * len(queries)
+        probes: dict[int, List[int]] = {}
+        nprobe = min(self.nprobe, len(self._lists))
+        for qi, sims in enumerate(self._centroids.similarity_matrix(queries)):
+            for c in sorted(range(len(sims)), key=sims.__getitem__, reverse=True)[:nprobe]:
+                probes.setdefault(c, []).append(qi)
+        for c, query_ids in probes.items():
+            if not len(self._lists[c]):
+                continue
+            for qi, sim in zip(query_ids, self._lists[c].max_similarities([queries[qi] for qi in query_ids])):
+                if sim > best[qi]:
+                    best[qi] = sim
+        return best
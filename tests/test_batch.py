@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from dr.batch import expand_inputs, score_batch
+from dr.score import score_path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CALIBRATION_DIR = ROOT / "examples" / "calibration"
+
+
+class ExpandInputsTests(unittest.TestCase):
+    def test_directories_globs_and_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "sub").mkdir()
+            for name in ("b.json", "a.jsonl", "sub/c.json", "a.expected.json", "notes.md"):
+                (base / name).write_text("{}", encoding="utf-8")
+            manifest = base / "manifest.txt"
+            manifest.write_text("# nightly\nsub/c.json\n\nmissing.json\n", encoding="utf-8")
+
+            paths = expand_inputs([str(base), str(base / "*.json")], manifest=str(manifest))
+
+        self.assertEqual(
+            [p.relative_to(base).as_posix() for p in paths],
+            ["a.jsonl", "b.json", "sub/c.json", "a.expected.json", "missing.json"],
+        )
+
+
+class ScoreBatchTests(unittest.TestCase):
+    def test_parallel_results_match_serial_in_input_order(self) -> None:
+        paths = sorted(CALIBRATION_DIR.glob("*.json")) * 3 + [ROOT / "examples" / "trace.example.jsonl"]
+        serial = list(score_batch(paths, jobs=1))
+        parallel = list(score_batch(paths, jobs=2))
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual([r["path"] for r in parallel], [str(p) for p in paths])
+        self.assertEqual(parallel[0]["result"], score_path(paths[0]))
+
+    def test_errors_are_reported_per_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad = Path(tmpdir) / "bad.json"
+            bad.write_text("{", encoding="utf-8")
+            paths = [bad, CALIBRATION_DIR / "exact-repeat.json", Path(tmpdir) / "missing.json"]
+            records = list(score_batch(paths, jobs=2))
+
+        self.assertIn("ValueError", records[0]["error"])
+        self.assertIn("result", records[1])
+        self.assertIn("FileNotFoundError", records[2]["error"])
+
+
+class CliScoreBatchTests(unittest.TestCase):
+    def test_cli_emits_one_json_line_per_file(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad = Path(tmpdir) / "bad.json"
+            bad.write_text("[]", encoding="utf-8")
+            proc = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    "from dr.cli import main; main()",
+                    "score-batch",
+                    "examples/calibration",
+                    str(bad),
+                    "--jobs",
+                    "2",
+                ],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+        self.assertEqual(proc.returncode, 1)
+        records = [json.loads(line) for line in proc.stdout.splitlines()]
+        self.assertEqual(len(records), len(list(CALIBRATION_DIR.glob("*.json"))) + 1)
+        self.assertTrue(all("result" in r for r in records[:-1]))
+        self.assertIn("error", records[-1])
+        self.assertIn("bad.json", proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+from dr.schema import validate_transcript
+from dr.score import score_transcript
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from suite import compare  # noqa: E402
+from synth import generate_transcript  # noqa: E402
+
+
+class SyntheticTranscriptTests(unittest.TestCase):
+    def test_seeded_and_schema_valid(self) -> None:
+        a = generate_transcript(rounds=40, seed=7)
+        self.assertEqual(a, generate_transcript(rounds=40, seed=7))
+        self.assertNotEqual(a, generate_transcript(rounds=40, seed=8))
+        self.assertEqual(validate_transcript(a), [])
+
+    def test_knobs_drive_the_scores(self) -> None:
+        novelty = score_transcript(generate_transcript(rounds=20, paraphrase_rate=1.0))["novelty_by_round"]
+        # Round 1 starts the history; every later claim rewords an earlier one.
+        self.assertEqual([r["new_claims_L1"] for r in novelty[1:]], [0] * 19)
+        self.assertTrue(all(r["new_claims_L0"] > 0 for r in novelty[1:]))
+
+        rounds = generate_transcript(rounds=30, question_growth=0.5, blocker_rate=1.0)["rounds"]
+        self.assertEqual(len(rounds[-1]["outputs"]["open_questions"]), 16)
+        readiness = score_transcript({"rounds": rounds})["readiness_by_round"]
+        self.assertTrue(all(r["blocker_score"] == 0.0 for r in readiness))
+
+    def test_rejects_out_of_range_knobs(self) -> None:
+        with self.assertRaises(ValueError):
+            generate_transcript(rounds=5, paraphrase_rate=1.5)
+
+
+class RegressionGateTests(unittest.TestCase):
+    def test_flags_drops_past_threshold_after_calibration(self) -> None:
+        def run(calibration_s: float, novelty: float, score: float) -> dict:
+            return {
+                "calibration_s": calibration_s,
+                "results": [
+                    {"case": "novelty", "rounds": 100, "rounds_per_s": novelty},
+                    {"case": "score", "rounds": 100, "rounds_per_s": score},
+                ],
+            }
+
+        baseline = run(0.1, 1000.0, 1000.0)
+        self.assertEqual(compare(run(0.1, 800.0, 1000.0), baseline, 0.25), [])
+        self.assertEqual([f[:2] for f in compare(run(0.1, 700.0, 1000.0), baseline, 0.25)], [("novelty", 100)])
+        # A machine half as fast is expected to run at half the throughput.
+        self.assertEqual(compare(run(0.2, 500.0, 450.0), baseline, 0.25), [])
+        self.assertEqual(compare(run(0.2, 500.0, 300.0), baseline, 0.25)[0][:2], ("score", 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
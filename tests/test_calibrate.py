@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+
+from dr.batch import expand_inputs
+from dr.calibrate import (
+    StopParams,
+    _agreement,
+    _new_l1_counts,
+    calibrate,
+    evaluate,
+    format_table,
+    load_features,
+    make_grid,
+    parse_values,
+    sweep,
+)
+from dr.io import load_transcript
+from dr.matching import JaccardIndex
+from dr.score import CLAIM_CACHE, IncrementalScorer, _normalized_round_claims
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PATHS = expand_inputs([str(ROOT / "examples")])
+
+
+class CalibrationFeatureTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.corpus = load_features(PATHS)
+
+    def test_default_params_replay_the_scorer(self) -> None:
+        for path, features in zip(PATHS, self.corpus):
+            with self.subTest(path=path.name):
+                scorer = IncrementalScorer(embedding_config=None, profile=False)
+                signals = [u["stop_recommendation"]["signal"] for u in scorer.add_rounds(load_transcript(path)["rounds"])]
+                self.assertEqual(evaluate(features)["signals"], signals)
+
+    def test_cached_similarities_give_l1_counts_at_any_threshold(self) -> None:
+        for path, features in zip(PATHS, self.corpus):
+            for threshold in (0.0, 0.3, 0.65, 1.0):
+                with self.subTest(path=path.name, threshold=threshold):
+                    index = JaccardIndex(threshold, CLAIM_CACHE.token_ids)
+                    expected = []
+                    for r in load_transcript(path)["rounds"]:
+                        claims = _normalized_round_claims(r["outputs"]["claims"])
+                        expected.append(sum(1 for c in claims if not index.matches(c)))
+                        index.update(claims)
+                    self.assertEqual(_new_l1_counts(features.rounds, threshold), expected)
+
+    def test_expectations_are_read_from_notes_and_fixtures(self) -> None:
+        by_name = {Path(f.name).name: f for f in self.corpus}
+        meeting = by_name["transcript.meeting-stop.json"]
+        self.assertEqual((meeting.expected_signal, meeting.recommended_stop_round), ("SHIP", 4))
+        self.assertEqual(by_name["blocker-present.json"].expected_signal, "ESCALATE")
+        self.assertIsNone(by_name["trace.example.jsonl"].expected_signal)
+
+    def test_sweep_matches_per_setting_evaluation(self) -> None:
+        grid = make_grid(
+            jaccard_threshold=[0.3, 0.5, 0.7],
+            low_novelty_threshold=[0.1, 0.25, 0.6],
+            high_novelty_threshold=[0.3, 0.5],
+            k_low_novelty_escalate=[1, 2, 4],
+        )
+        self.assertNotIn(StopParams(low_novelty_threshold=0.6, high_novelty_threshold=0.5), grid)
+        rows = sweep(self.corpus, grid)
+        self.assertEqual(len(rows), len(grid))
+        for row in rows:
+            params = StopParams(**row["params"])
+            naive = _agreement(self.corpus, [evaluate(f, params) for f in self.corpus])
+            self.assertEqual(row, {"params": asdict(params), **naive})
+        totals = [row["signal_matches"] + row["stop_round_matches"] for row in rows]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+
+    def test_grid_specs(self) -> None:
+        self.assertEqual(parse_values("0.3:0.5:0.1"), [0.3, 0.4, 0.5])
+        self.assertEqual(parse_values("2,4", int), [2, 4])
+        with self.assertRaises(ValueError):
+            parse_values("0.1:0.5")
+        with self.assertRaisesRegex(ValueError, "bogus"):
+            make_grid(bogus=[1])
+        with self.assertRaisesRegex(ValueError, ">= 1"):
+            make_grid(k_low_novelty_escalate=[0, 2])
+        self.assertEqual(make_grid(), [StopParams()])
+
+    def test_report_always_lists_the_defaults(self) -> None:
+        report = calibrate(self.corpus, make_grid(jaccard_threshold=[0.6], k_low_novelty_escalate=[3, 4]), top=1)
+        self.assertEqual(report["settings"], 3)
+        self.assertEqual(len(report["results"]), 1)
+        self.assertEqual(report["default"]["params"], asdict(StopParams()))
+        lines = format_table(report).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[-1].endswith(f"(current defaults, rank {report['default']['rank']})"))
+
+    def test_cli_calibrate(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        proc = subprocess.run(
+            [sys.executable, "-m", "dr.cli", "calibrate", "examples", "--jaccard", "0.4,0.5", "--top", "2", "--format", "json"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        doc = json.loads(proc.stdout)
+        self.assertEqual(doc["transcripts"], len(PATHS))
+        self.assertEqual(doc["settings"], 2 * 7 * 5 * 3)
+        self.assertEqual(len(doc["results"]), 2)
+        self.assertEqual(doc["default"]["params"], asdict(StopParams()))
+
+
+if __name__ == "__main__":
+    unittest.main()
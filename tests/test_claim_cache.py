@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import unittest
+
+from dr.claim_cache import ClaimCache, token_id
+from dr.score import CLAIM_CACHE, _normalize_claim, _token_set
+
+
+class ClaimCacheTests(unittest.TestCase):
+    def test_matches_uncached_functions(self) -> None:
+        cache = ClaimCache(_normalize_claim, _token_set)
+        for raw in ("  - Caching the QUERIES speeds up lookups!  ", "1) Use a pooler.", "", "the and of"):
+            normalized = cache.normalize(raw)
+            self.assertEqual(normalized, _normalize_claim(raw))
+            self.assertEqual(cache.token_ids(normalized), frozenset(token_id(t) for t in _token_set(normalized)))
+
+    def test_token_ids_are_stable_and_shared_by_canonical_tokens(self) -> None:
+        cache = ClaimCache(_normalize_claim, _token_set)
+        self.assertEqual(cache.token_ids("caching queries"), cache.token_ids("cache query"))
+        self.assertEqual(token_id("cache"), token_id("cache"))
+        self.assertNotEqual(token_id("cache"), token_id("query"))
+
+    def test_reports_hit_rate(self) -> None:
+        cache = ClaimCache(_normalize_claim, _token_set)
+        for _ in range(4):
+            cache.normalize("Same claim again.")
+        stats = cache.stats()["normalize"]
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (3, 1, 0.75))
+
+    def test_is_bounded(self) -> None:
+        cache = ClaimCache(_normalize_claim, _token_set, max_entries=8)
+        for i in range(100):
+            cache.token_ids(cache.normalize(f"claim number {i} about topic {i * 7}"))
+        stats = cache.stats()
+        self.assertTrue(all(entry["entries"] <= 8 for entry in stats.values()))
+
+    def test_scorer_uses_shared_cache(self) -> None:
+        from dr.score import score_transcript
+
+        CLAIM_CACHE.clear()
+        transcript = {"rounds": [{"round": n, "outputs": {"claims": ["Repeated claim."]}} for n in (1, 2, 3)]}
+        score_transcript(transcript)
+        self.assertEqual(CLAIM_CACHE.stats()["normalize"]["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from dr.claim_store import ClaimStore
+from dr.io import load_transcript
+from dr.matching import JaccardIndex
+from dr.score import CLAIM_CACHE, score_path, score_transcript
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE = ROOT / "examples" / "transcript.meeting-stop.json"
+
+
+def _claims(rng: random.Random, count: int) -> list[str]:
+    vocabulary = [f"term{i}" for i in range(40)]
+    return [" ".join(rng.sample(vocabulary, rng.randint(1, 6))) for _ in range(count)]
+
+
+class ClaimStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = ClaimStore(Path(self._tmp.name) / "claims.sqlite3")
+        self.addCleanup(self.store.close)
+
+    def _add(self, conversation_id: str, claims: list[str], topic: str = "t") -> None:
+        self.store.add(conversation_id, topic, [(c, CLAIM_CACHE.token_ids(c)) for c in claims])
+
+    def test_lookup_matches_exhaustive_jaccard(self) -> None:
+        rng = random.Random(3)
+        stored = _claims(rng, 300)
+        self._add("old", stored)
+        queries = _claims(rng, 200) + stored[:20]
+        for threshold in (0.2, 0.5, 0.8, 1.0):
+            with self.subTest(threshold=threshold):
+                index = JaccardIndex(threshold, CLAIM_CACHE.token_ids)
+                index.update(stored)
+                found = self.store.lookup("t", [CLAIM_CACHE.token_ids(q) for q in queries], threshold)
+                self.assertEqual([m is not None for m in found], [index.matches(q) for q in queries])
+
+    def test_topics_and_conversations(self) -> None:
+        self._add("a", ["the cache is warm"])
+        self._add("b", ["the cache is warm", "ship on friday"])
+        self._add("c", ["ship on friday"], topic="other")
+        tokens = [CLAIM_CACHE.token_ids("cache is warm"), CLAIM_CACHE.token_ids("ship on friday")]
+
+        self.assertEqual(self.store.lookup("t", tokens, 0.5), [("a", "the cache is warm"), ("b", "ship on friday")])
+        self.assertEqual(self.store.lookup("t", tokens, 0.5, exclude_conversation="b"), [("a", "the cache is warm"), None])
+        self.assertEqual(self.store.lookup("nope", tokens, 0.5), [None, None])
+        self._add("b", ["ship on friday"])
+        self.assertEqual(self.store.stats(), {"topics": 2, "token_sets": 3, "mentions": 4, "conversations": 3})
+        with self.assertRaises(ValueError):
+            self.store.lookup("t", tokens, 0.0)
+
+
+class ScoringWithClaimStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "claims.sqlite3"
+
+    def test_flags_claims_from_earlier_conversations(self) -> None:
+        transcript = load_transcript(EXAMPLE)
+        plain = score_transcript(transcript, claim_store=None)
+
+        first = score_transcript(dict(transcript, conversation_id="one"), claim_store=self.path)
+        self.assertEqual([r["corpus_repeats"] for r in first["novelty_by_round"]], [[]] * len(transcript["rounds"]))
+        # Scoring the same conversation again does not flag it against itself.
+        again = score_transcript(dict(transcript, conversation_id="one"), claim_store=self.path)
+        self.assertEqual(again, first)
+
+        second = score_transcript(dict(transcript, conversation_id="two"), claim_store=self.path)
+        repeats = [r["corpus_repeats"] for r in second["novelty_by_round"]]
+        self.assertTrue(repeats[0])
+        self.assertTrue(all(rep["conversation_id"] == "one" for rnd in repeats for rep in rnd))
+        for entry in second["novelty_by_round"]:
+            del entry["corpus_repeats"]
+        self.assertEqual(second, plain)
+
+        other_topic = score_transcript(dict(transcript, conversation_id="three", topic="elsewhere"), claim_store=self.path)
+        self.assertFalse(any(r["corpus_repeats"] for r in other_topic["novelty_by_round"]))
+
+    def test_score_path_reads_the_header_and_cli_reports(self) -> None:
+        trace = ROOT / "examples" / "trace.example.jsonl"
+        score_path(trace, claim_store=self.path)
+        env = dict(os.environ, PYTHONPATH="src", DR_CLAIM_STORE=str(self.path))
+        run = lambda *argv: subprocess.run(  # noqa: E731
+            [sys.executable, "-m", "dr.cli", *argv], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        stats = json.loads(run("claim-store", "stats").stdout)
+        self.assertEqual(stats["conversations"], 1)
+        self.assertEqual(stats["topics"], 1)
+        self.assertEqual(json.loads(run("claim-store", "clear").stdout)["mentions"], 0)
+
+    def test_columnar_and_stream_formats_report_corpus_repeats(self) -> None:
+        transcript = load_transcript(EXAMPLE)
+        paths = {}
+        for cid in ("one", "two"):
+            paths[cid] = Path(self._tmp.name) / f"{cid}.json"
+            paths[cid].write_text(json.dumps(dict(transcript, conversation_id=cid, topic="t")), encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH="src", DR_CLAIM_STORE=str(self.path))
+        run = lambda *argv: json.loads(  # noqa: E731
+            subprocess.run(
+                [sys.executable, "-m", "dr.cli", "score", *argv], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+            ).stdout
+        )
+        run(str(paths["one"]))
+
+        expected = [r["corpus_repeats"] for r in run(str(paths["two"]))["novelty_by_round"]]
+        self.assertTrue(expected[0])
+        self.assertEqual(run("--format", "columnar", str(paths["two"]))["rounds"]["corpus_repeats"], expected)
+        self.assertEqual([r["corpus_repeats"] for r in run("--format", "stream", str(paths["two"]))["rounds"]], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
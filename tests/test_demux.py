@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from itertools import zip_longest
+from pathlib import Path
+
+from dr.batch import expand_inputs
+from dr.demux import DemuxScorer, iter_stdin_events, score_multiplexed
+from dr.io import load_transcript
+from dr.score import IncrementalScorer
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PATHS = expand_inputs([str(ROOT / "examples")])[:6]
+
+
+def _interleaved() -> tuple[list[dict], dict[str, list[dict]]]:
+    """Round-robin events of several example conversations, plus each one's rounds."""
+
+    rounds = {p.name: load_transcript(p)["rounds"] for p in PATHS}
+    events = [{"type": "transcript_header", "conversation_id": name, "topic": "t"} for name in rounds]
+    for batch in zip_longest(*[[(name, r) for r in rs] for name, rs in rounds.items()]):
+        for item in batch:
+            if item is not None:
+                name, r = item
+                events.append({"type": "round", "conversation_id": name, "round": r.get("round"), "outputs": r["outputs"]})
+    return events, rounds
+
+
+class DemuxScorerTests(unittest.TestCase):
+    def test_each_conversation_scores_as_if_alone(self) -> None:
+        events, rounds = _interleaved()
+        records = list(score_multiplexed(enumerate(events, start=1)))
+
+        for name, rs in rounds.items():
+            with self.subTest(conversation=name):
+                scorer = IncrementalScorer(embedding_config=None, keep_rounds=False, profile=False)
+                signals = [scorer.add_round(r)["stop_recommendation"]["signal"] for r in rs]
+                mine = [rec for rec in records if rec["conversation_id"] == name]
+                self.assertEqual([rec["stop_recommendation"]["signal"] for rec in mine[:-1]], signals)
+                self.assertEqual(mine[-1]["reason"], "end")
+                self.assertEqual(mine[-1]["rounds_scored"], len(rs))
+                self.assertEqual(mine[-1]["stop_recommendation"], scorer.summary()["stop_recommendation"])
+
+    def test_lru_bound_evicts_least_recently_active(self) -> None:
+        demux = DemuxScorer(max_active=2)
+        out = []
+        for i, cid in enumerate(["a", "b", "a", "c", "a", "b"], start=1):
+            out += demux.add_event({"type": "round", "conversation_id": cid, "round": i, "outputs": {"claims": [f"claim {i}"]}})
+        summaries = [(r["conversation_id"], r["rounds_scored"]) for r in out if r["type"] == "summary"]
+        self.assertEqual(summaries, [("b", 1), ("c", 1)])
+        self.assertEqual((demux.evicted, len(demux), demux.rounds_scored), (2, 2, 6))
+        self.assertEqual([(r["conversation_id"], r["reason"]) for r in demux.finish()], [("a", "end"), ("b", "end")])
+
+    def test_resumed_conversation_keeps_its_topic_and_memory_is_bounded(self) -> None:
+        demux = DemuxScorer(max_active=1, max_remembered=2)
+        demux.add_event({"type": "transcript_header", "conversation_id": "a", "topic": "cache"})
+        for cid in ("a", "b", "a"):
+            demux.add_event({"type": "round", "conversation_id": cid, "round": 1, "outputs": {"claims": ["x"]}})
+        self.assertEqual((demux.evicted, demux._active["a"].topic), (2, "cache"))
+
+        for i in range(10):
+            demux.add_event({"type": "transcript_header", "conversation_id": f"h{i}", "topic": "t"})
+            demux.add_event({"type": "round", "conversation_id": f"f{i}", "round": 1, "outputs": "bad"})
+        self.assertEqual((len(demux._topics), len(demux._failed), demux.errors), (2, 2, 10))
+        self.assertEqual(list(demux._failed), ["f8", "f9"])
+
+    def test_changes_only_and_errors(self) -> None:
+        events, _ = _interleaved()
+        everything = list(score_multiplexed(enumerate(events, start=1)))
+        changes = list(score_multiplexed(enumerate(events, start=1), changes_only=True))
+        self.assertLess(len(changes), len(everything))
+        last: dict = {}
+        for rec in changes:
+            if rec["type"] == "round":
+                self.assertNotEqual(last.get(rec["conversation_id"]), rec["stop_recommendation"]["signal"])
+                last[rec["conversation_id"]] = rec["stop_recommendation"]["signal"]
+
+        records = list(score_multiplexed(iter_stdin_events(['{"type":"note"}\n', '{"type":"round","round":1}\n'])))
+        self.assertEqual([(r["type"], r["line"]) for r in records], [("error", "<stdin>:2")])
+
+    def test_bad_conversation_is_dropped_and_the_others_carry_on(self) -> None:
+        events, rounds = _interleaved()
+        bad = {"type": "round", "conversation_id": "bad", "round": 1, "outputs": "not an object"}
+        later = {"type": "round", "conversation_id": "bad", "round": 2, "outputs": {"claims": ["x"]}}
+        mixed = events[:3] + [bad] + events[3:10] + [later] + events[10:]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "combined.jsonl"
+            path.write_text("".join(json.dumps(e) + "\n" for e in mixed), encoding="utf-8")
+            records = list(score_multiplexed(path))
+        clean = list(score_multiplexed(enumerate(events, start=1)))
+
+        errors = [r for r in records if r["type"] == "error"]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual((errors[0]["conversation_id"], errors[0]["line"]), ("bad", f"{path}:4"))
+        self.assertIn("outputs", errors[0]["error"])
+        self.assertEqual([r for r in records if r["conversation_id"] != "bad"], clean)
+
+
+class CliDemuxTests(unittest.TestCase):
+    def test_compressed_file_and_stdin(self) -> None:
+        events, rounds = _interleaved()
+        lines = "".join(json.dumps(e) + "\n" for e in events)
+        env = dict(os.environ, PYTHONPATH="src")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "combined.jsonl.gz"
+            with gzip.open(path, "wt", encoding="utf-8") as fh:
+                fh.write(lines)
+            outputs = [
+                subprocess.run(
+                    [sys.executable, "-m", "dr.cli", "demux", source],
+                    cwd=ROOT,
+                    env=env,
+                    input=stdin,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+                for source, stdin in ((str(path), None), ("-", lines))
+            ]
+        self.assertEqual(outputs[0], outputs[1])
+        records = [json.loads(line) for line in outputs[0].splitlines()]
+        self.assertEqual(sum(r["type"] == "round" for r in records), sum(map(len, rounds.values())))
+        self.assertEqual(sorted(r["conversation_id"] for r in records if r["type"] == "summary"), sorted(rounds))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from unittest import mock
+
+from dr.embedding_cache import EmbeddingCache
+from dr.semantic import EmbeddingConfig, embed_ollama
+
+
+class EmbeddingCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = EmbeddingCache(self._tmp.name, max_entries=3)
+        self.addCleanup(self.cache.close)
+
+    def test_round_trips_vectors_per_model(self) -> None:
+        self.cache.put_many("m1", ["a", "b"], [[0.1, 0.2], [1.0 / 3.0, -2.5]])
+
+        self.assertEqual(self.cache.get_many("m1", ["b", "a", "c"]), [[1.0 / 3.0, -2.5], [0.1, 0.2], None])
+        self.assertEqual(self.cache.get_many("m2", ["a"]), [None])
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 2, 2))
+
+    def test_evicts_least_recently_used(self) -> None:
+        for text in ("a", "b", "c"):
+            self.cache.put_many("m", [text], [[1.0]])
+        self.cache.get_many("m", ["a"])
+        self.cache.put_many("m", ["d"], [[1.0]])
+
+        self.assertEqual(self.cache.get_many("m", ["a", "b", "c", "d"]), [[1.0], None, [1.0], [1.0]])
+
+    def test_persists_across_instances(self) -> None:
+        self.cache.put_many("m", ["a"], [[4.0, 2.0]])
+        self.cache.get_many("m", ["a"])
+        self.cache.close()
+
+        reopened = EmbeddingCache(self._tmp.name)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get_many("m", ["a"]), [[4.0, 2.0]])
+        self.assertEqual(reopened.stats()["total_hits"], 2)
+
+    def test_lookups_defer_their_writes(self) -> None:
+        self.cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+        writes = self.cache._db.total_changes
+        with mock.patch("dr.embedding_cache.FLUSH_EVERY", 2):
+            self.cache.get_many("m", ["a", "x"])
+            self.cache.get_many("m", ["a"])
+            self.assertEqual(self.cache._db.total_changes, writes)
+            self.cache.get_many("m", ["b"])
+        self.assertGreater(self.cache._db.total_changes, writes)
+        self.assertEqual(self.cache.stats()["total_hits"], 3)
+
+    def test_overwrites_do_not_count_towards_the_bound(self) -> None:
+        for _ in range(3):
+            self.cache.put_many("m", ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        self.cache.put_many("m", ["a"], [[9.0]])
+
+        self.assertEqual(self.cache.get_many("m", ["a", "b", "c"]), [[9.0], [2.0], [3.0]])
+        self.assertEqual(self.cache.stats()["entries"], 3)
+
+
+class EmbedOllamaCacheTests(unittest.TestCase):
+    def test_only_misses_go_to_the_network(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = EmbeddingConfig(url="http://127.0.0.1:1", model="stub", cache_dir=tmpdir)
+            calls: list[list[str]] = []
+
+            def fake_embed(self, prompts):
+                calls.append(list(prompts))
+                return [[float(len(p))] for p in prompts]
+
+            with mock.patch("dr.semantic.OllamaEmbeddingClient.embed", fake_embed):
+                self.assertEqual(embed_ollama(config, ["aa", "b"]), [[2.0], [1.0]])
+                self.assertEqual(embed_ollama(config, ["b", "ccc", "aa"]), [[1.0], [3.0], [2.0]])
+
+            from dr.embedding_cache import embedding_cache
+
+            embedding_cache(tmpdir).close()
+
+        self.assertEqual(calls, [["aa", "b"], ["ccc"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import random
+import unittest
+from pathlib import Path
+
+from dr.matching import JaccardIndex, MinHashIndex, make_l1_index
+from dr.score import JACCARD_THRESHOLD, _jaccard_similarity, _normalized_round_claims, _token_set, score_transcript
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE_FILES = sorted((ROOT / "examples").glob("**/*.json"))
+
+
+def _brute_force_new_l1(rounds: list[list[str]], threshold: float) -> list[int]:
+    seen: set[str] = set()
+    counts: list[int] = []
+    for claims in rounds:
+        new = 0
+        for claim in claims:
+            if not seen or max(_jaccard_similarity(claim, s) for s in seen) < threshold:
+                new += 1
+        seen.update(claims)
+        counts.append(new)
+    return counts
+
+
+def _indexed_new_l1(rounds: list[list[str]], threshold: float, backend: str = "exact") -> list[int]:
+    index = make_l1_index(backend, threshold, _token_set)
+    counts: list[int] = []
+    for claims in rounds:
+        counts.append(sum(1 for claim in claims if not index.matches(claim)))
+        index.update(claims)
+    return counts
+
+
+class JaccardIndexTests(unittest.TestCase):
+    def test_empty_index_matches_nothing(self) -> None:
+        index = JaccardIndex(JACCARD_THRESHOLD, _token_set)
+        self.assertFalse(index.matches("anything at all"))
+        self.assertEqual(len(index), 0)
+
+    def test_empty_token_sets_match_each_other(self) -> None:
+        index = JaccardIndex(JACCARD_THRESHOLD, _token_set)
+        index.add("the")
+        self.assertTrue(index.matches("a"))
+        self.assertFalse(index.matches("database migration"))
+
+    def test_matches_brute_force_on_examples(self) -> None:
+        for path in EXAMPLE_FILES:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if not isinstance(data, dict) or not isinstance(data.get("rounds"), list):
+                continue
+            rounds = [_normalized_round_claims(r["outputs"]["claims"]) for r in data["rounds"]]
+            for threshold in (0.3, JACCARD_THRESHOLD, 0.8):
+                with self.subTest(path=path.name, threshold=threshold):
+                    self.assertEqual(_indexed_new_l1(rounds, threshold), _brute_force_new_l1(rounds, threshold))
+
+    def test_matches_brute_force_on_random_claims(self) -> None:
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(40)] + ["the", "and", "caching", "cache", "queries", "query"]
+        rounds = [
+            [" ".join(rng.choice(vocab) for _ in range(rng.randint(0, 8))) for _ in range(rng.randint(1, 6))]
+            for _ in range(30)
+        ]
+        for threshold in (0.0, 0.25, JACCARD_THRESHOLD, 1.0):
+            with self.subTest(threshold=threshold):
+                self.assertEqual(_indexed_new_l1(rounds, threshold), _brute_force_new_l1(rounds, threshold))
+
+    def test_max_similarity_is_exact_above_floor(self) -> None:
+        rng = random.Random(11)
+        # Zipf-like draws, so a few tokens are shared by most claims.
+        vocab = [f"w{i}" for i in range(60)]
+        weights = [1 / (i + 1) for i in range(60)]
+        claims = [" ".join(rng.choices(vocab, weights=weights, k=rng.randint(1, 12))) for _ in range(300)]
+        index = JaccardIndex(JACCARD_THRESHOLD, _token_set)
+        index.update(claims[:200])
+        for claim in claims[200:]:
+            best = max(_jaccard_similarity(claim, seen) for seen in claims[:200])
+            self.assertEqual(index.max_similarity(claim), best)
+            for floor in (0.2, JACCARD_THRESHOLD, 0.75):
+                found = index.max_similarity(claim, floor)
+                self.assertEqual(found >= floor, best >= floor)
+                if best >= floor:
+                    self.assertEqual(found, best)
+
+
+class MinHashIndexTests(unittest.TestCase):
+    def test_agrees_with_exact_on_example_corpora(self) -> None:
+        for path in EXAMPLE_FILES:
+            if path.parent.name not in {"calibration", "livefire"}:
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+            rounds = [_normalized_round_claims(r["outputs"]["claims"]) for r in data["rounds"]]
+            with self.subTest(path=path.name):
+                self.assertEqual(
+                    _indexed_new_l1(rounds, JACCARD_THRESHOLD, "minhash"),
+                    _indexed_new_l1(rounds, JACCARD_THRESHOLD, "exact"),
+                )
+
+    def test_never_reports_a_false_match(self) -> None:
+        rng = random.Random(11)
+        vocab = [f"w{i}" for i in range(60)]
+        exact = JaccardIndex(JACCARD_THRESHOLD, _token_set)
+        approx = MinHashIndex(JACCARD_THRESHOLD, _token_set)
+        for _ in range(300):
+            claim = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 8)))
+            if approx.matches(claim):
+                self.assertTrue(exact.matches(claim))
+            exact.add(claim)
+            approx.add(claim)
+
+    def test_score_transcript_accepts_minhash_backend(self) -> None:
+        transcript = json.loads((ROOT / "examples" / "calibration" / "paraphrase-rounds.json").read_text(encoding="utf-8"))
+        self.assertEqual(score_transcript(transcript, l1_backend="minhash"), score_transcript(transcript))
+
+    def test_unknown_backend_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            make_l1_index("bogus", JACCARD_THRESHOLD, _token_set)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from dr.output import score_columnar, write_json_stream
+from dr.score import IncrementalScorer, iter_path_rounds, score_path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLES = [
+    ROOT / "examples" / "transcript.meeting-stop.json",
+    ROOT / "examples" / "transcript.chinese-room.json",
+    ROOT / "examples" / "trace.ship-of-theseus.jsonl",
+]
+
+
+def _expected_rows(result: dict) -> list[dict]:
+    rows = []
+    for novelty, readiness, semantic in zip(
+        result["novelty_by_round"], result["readiness_by_round"], result["semantic_by_round"]
+    ):
+        row = {**novelty, **readiness, "similarity_to_prev": semantic["similarity_to_prev"]}
+        rows.append(row)
+    return rows
+
+
+def _summary(result: dict) -> dict:
+    return {k: v for k, v in result.items() if not k.endswith("_by_round")}
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_columns_match_per_round_dicts(self) -> None:
+        for path in EXAMPLES:
+            with self.subTest(path=path.name):
+                expected = score_path(path)
+                out = score_columnar(iter_path_rounds(path))
+                columns = out.pop("rounds")
+                rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+                self.assertEqual(rows, _expected_rows(expected))
+                self.assertEqual(out, _summary(expected))
+
+
+class JsonStreamTests(unittest.TestCase):
+    def test_stream_parses_to_rows_and_summary(self) -> None:
+        for path in EXAMPLES:
+            with self.subTest(path=path.name):
+                buf = io.StringIO()
+                write_json_stream(iter_path_rounds(path), buf)
+                doc = json.loads(buf.getvalue())
+                expected = score_path(path)
+                self.assertEqual(doc.pop("rounds"), _expected_rows(expected))
+                self.assertEqual(doc, _summary(expected))
+
+    def test_empty_transcript_writes_nothing(self) -> None:
+        buf = io.StringIO()
+        with self.assertRaisesRegex(ValueError, "non-empty 'rounds'"):
+            write_json_stream([], buf)
+        self.assertEqual(buf.getvalue(), "")
+
+    def test_scorer_without_kept_rounds_does_not_accumulate(self) -> None:
+        scorer = IncrementalScorer(keep_rounds=False)
+        for i in range(1, 51):
+            scorer.add_round({"round": i, "outputs": {"claims": [f"claim {i}"]}})
+        self.assertEqual(len(scorer), 50)
+        self.assertEqual(scorer.novelty_by_round, [])
+        self.assertEqual(scorer.summary()["stop_recommendation"]["signal"], "CONTINUE")
+        with self.assertRaises(ValueError):
+            scorer.result()
+
+    def test_cli_formats(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        path = "examples/transcript.meeting-stop.json"
+        docs = {}
+        for fmt in ("columnar", "stream"):
+            proc = subprocess.run(
+                [sys.executable, "-c", "from dr.cli import main; main()", "score", path, "--format", fmt],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            docs[fmt] = json.loads(proc.stdout)
+
+        self.assertEqual(docs["columnar"]["rounds"]["round"], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(docs["stream"]["rounds"]), 6)
+        self.assertEqual(docs["columnar"]["stop_recommendation"], docs["stream"]["stop_recommendation"])
+
+
+if __name__ == "__main__":
+    unittest.main()
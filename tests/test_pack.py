@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from dr.io import load_transcript
+from dr.pack import PackedTranscript, pack_file, write_pack
+from dr.score import IncrementalScorer, iter_path_rounds, score_path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA = json.loads((ROOT / "spec" / "transcript.v0.1.schema.json").read_text(encoding="utf-8"))
+
+# Exercises every property the v0.1 schema names, plus extra keys at each level
+# (the schema allows additionalProperties everywhere), empty vs absent lists and
+# non-ASCII text.
+FULL_TRANSCRIPT = {
+    "version": "0.1",
+    "conversation_id": "conv-ü-1",
+    "topic": "Pack round trip",
+    "extra_top": {"nested": [1, 2.5, None, True]},
+    "rounds": [
+        {
+            "round": 1,
+            "inputs": {"prompt": "p1", "refs": ["a"]},
+            "outputs": {
+                "claims": ["First claim.", "Zweite Behauptung — ü", ""],
+                "decisions": ["Use SQLite"],
+                "open_questions": [],
+                "next_actions": ["Run tests in CI"],
+                "citations": [{"url": "https://example.com", "note": "n", "extra": 1}, {"url": "u2"}],
+                "summary": "Round one.",
+                "custom_output": {"k": "v"},
+            },
+            "telemetry": {"tokens": 1234, "model": "m"},
+            "custom_round": "x",
+        },
+        {"round": 2, "outputs": {"claims": ["Only claims."]}},
+        {"round": 3, "outputs": {"claims": ["c"], "open_questions": ["Who owns it?"], "next_actions": [1, 2]}},
+    ],
+}
+
+
+class PackRoundTripTests(unittest.TestCase):
+    def test_fixture_covers_every_schema_property(self) -> None:
+        round_schema = SCHEMA["properties"]["rounds"]["items"]
+        outputs_schema = round_schema["properties"]["outputs"]
+        citation_schema = outputs_schema["properties"]["citations"]["items"]
+        first = FULL_TRANSCRIPT["rounds"][0]
+        self.assertLessEqual(set(SCHEMA["properties"]), set(FULL_TRANSCRIPT))
+        self.assertLessEqual(set(round_schema["properties"]), set(first))
+        self.assertLessEqual(set(outputs_schema["properties"]), set(first["outputs"]))
+        self.assertLessEqual(set(citation_schema["properties"]), set(first["outputs"]["citations"][0]))
+
+    def test_round_trip_is_lossless(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "full.drpack"
+            self.assertEqual(write_pack(FULL_TRANSCRIPT, path), 3)
+            self.assertEqual(load_transcript(path), FULL_TRANSCRIPT)
+
+    def test_examples_round_trip_and_score_identically(self) -> None:
+        sources = sorted((ROOT / "examples").glob("transcript.*.json")) + sorted((ROOT / "examples").glob("trace.*.jsonl"))
+        sources = [p for p in sources if not p.name.endswith(".expected.json")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for source in sources:
+                with self.subTest(source=source.name):
+                    packed = pack_file(source, Path(tmpdir) / (source.stem + ".drpack"))
+                    self.assertEqual(load_transcript(packed), load_transcript(source))
+                    self.assertEqual(score_path(packed), score_path(source))
+
+    def test_unsorted_rounds_are_rejected(self) -> None:
+        transcript = {"rounds": [{"round": 2, "outputs": {"claims": []}}, {"round": 1, "outputs": {"claims": []}}]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaisesRegex(ValueError, "'round' order"):
+                write_pack(transcript, Path(tmpdir) / "bad.drpack")
+
+    def test_corrupt_files_raise_value_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "t.drpack"
+            write_pack(FULL_TRANSCRIPT, path)
+            data = path.read_bytes()
+            path.write_bytes(data[:-3])
+            with self.assertRaisesRegex(ValueError, "Invalid pack"):
+                load_transcript(path)
+            path.write_bytes(b"{}")
+            with self.assertRaisesRegex(ValueError, "too short"):
+                load_transcript(path)
+
+
+class PackRangeTests(unittest.TestCase):
+    def _write(self, tmpdir: str, n: int) -> Path:
+        transcript = {
+            "version": "0.1",
+            "conversation_id": "range",
+            "rounds": [{"round": i, "outputs": {"claims": [f"claim {i % 7}", f"fact {i}"]}} for i in range(1, n + 1)],
+        }
+        path = Path(tmpdir) / "range.drpack"
+        write_pack(transcript, path)
+        return path
+
+    def test_range_reads_only_requested_rounds(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write(tmpdir, 1000)
+            with PackedTranscript(path) as pack:
+                self.assertEqual(len(pack), 1000)
+                self.assertEqual([r["round"] for r in pack.iter_rounds(500, 600)], list(range(500, 601)))
+                self.assertEqual([r["round"] for r in pack.iter_rounds(999)], [999, 1000])
+                self.assertEqual(list(pack.iter_rounds(2000, 3000)), [])
+
+            json_path = Path(tmpdir) / "range.json"
+            json_path.write_text(json.dumps(load_transcript(path)), encoding="utf-8")
+            self.assertEqual(score_path(path, first=500, last=600), score_path(json_path, first=500, last=600))
+
+    def test_resume_incremental_scorer_from_offset(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write(tmpdir, 50)
+            resumed = IncrementalScorer()
+            for r in iter_path_rounds(path, last=20):
+                resumed.add_round(r)
+            for r in iter_path_rounds(path, first=21):
+                resumed.add_round(r)
+            self.assertEqual(resumed.result(), score_path(path))
+
+    def test_cli_pack_and_range_stop(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "m.drpack"
+            proc = subprocess.run(
+                [sys.executable, "-m", "dr.cli", "pack", "examples/trace.meeting-stop.jsonl", "-o", str(out)],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            proc = subprocess.run(
+                [sys.executable, "-m", "dr.cli", "score", str(out), "--rounds", "2:4"],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual([r["round"] for r in json.loads(proc.stdout)["novelty_by_round"]], [2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
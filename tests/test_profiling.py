@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dr.output import score_columnar
+from dr.profiling import Profiler
+from dr.score import iter_path_rounds, score_path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE = ROOT / "examples" / "trace.ship-of-theseus.jsonl"
+ROUND_STAGES = {"parse", "normalize", "l0", "l1", "readiness", "stop"}
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_timings_block_leaves_scores_unchanged(self) -> None:
+        expected = score_path(EXAMPLE)
+        self.assertNotIn("timings", expected)
+
+        seen = []
+        result = score_path(EXAMPLE, profile=Profiler(hook=seen.append))
+        timings = result.pop("timings")
+        self.assertEqual(result, expected)
+
+        rounds = len(expected["novelty_by_round"])
+        self.assertEqual(set(timings["stages"]), ROUND_STAGES | {"load"})
+        for stage in ROUND_STAGES - {"parse"}:
+            self.assertEqual(timings["stages"][stage]["calls"], rounds)
+        self.assertEqual(timings["network"], {"requests": 0, "bytes_sent": 0, "bytes_received": 0})
+        self.assertEqual([r["round"] for r in timings["rounds"]], [r["round"] for r in expected["novelty_by_round"]])
+        self.assertEqual(seen, timings["rounds"])
+        total = sum(s["seconds"] for s in timings["stages"].values())
+        self.assertLessEqual(total, timings["wall_s"] + 1e-3)
+
+    def test_env_switch_and_streaming_outputs(self) -> None:
+        with mock.patch.dict(os.environ, {"DR_PROFILE": "1"}):
+            self.assertIn("timings", score_path(EXAMPLE))
+            columnar = score_columnar(iter_path_rounds(EXAMPLE))
+        with mock.patch.dict(os.environ, {"DR_PROFILE": "0"}):
+            self.assertNotIn("timings", score_path(EXAMPLE))
+        # Without kept rounds only the totals are reported, so memory stays flat.
+        self.assertNotIn("rounds", columnar["timings"])
+        self.assertEqual(columnar["timings"]["stages"]["l1"]["calls"], len(columnar["rounds"]["round"]))
+
+    def test_cli_profile_flag(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        env.pop("DR_PROFILE", None)
+        proc = subprocess.run(
+            [sys.executable, "-m", "dr.cli", "score", "examples/transcript.meeting-stop.json", "--profile", "--validate"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        stages = json.loads(proc.stdout)["timings"]["stages"]
+        self.assertEqual(stages["validate"]["calls"], 1)
+        self.assertEqual(stages["readiness"]["calls"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
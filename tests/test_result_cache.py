@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import dr.score as score_module
+from dr.batch import score_batch
+from dr.io import load_transcript
+from dr.result_cache import ResultCache
+from dr.score import score_path, score_transcript
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE = ROOT / "examples" / "transcript.meeting-stop.json"
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = ResultCache(self._tmp.name, version="test")
+        self.addCleanup(self.cache.close)
+
+    def test_round_trips_copies(self) -> None:
+        key = self.cache.key(b"digest", {"l1_backend": "exact"})
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {"score": 0.5, "rounds": [1, 2]})
+
+        hit = self.cache.get(key)
+        self.assertEqual(hit, {"score": 0.5, "rounds": [1, 2]})
+        hit["score"] = 0.0
+        self.assertEqual(self.cache.get(key)["score"], 0.5)
+        self.assertIsNone(self.cache.get(self.cache.key(b"digest", {"l1_backend": "minhash"})))
+        stats = self.cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"]), (1, 2, 2))
+
+    def test_evicts_least_recently_used_past_max_bytes(self) -> None:
+        payload = {"text": os.urandom(300).hex()}
+        self.cache.put(b"a", payload)
+        self.cache.max_bytes = 2 * self.cache.stats()["bytes"] + 10
+        self.cache.put(b"b", payload)
+        self.cache.get(b"a")
+        self.cache.put(b"c", payload)
+
+        self.assertEqual([self.cache.get(k) is not None for k in (b"a", b"b", b"c")], [True, False, True])
+        self.assertLessEqual(self.cache.stats()["bytes"], self.cache.max_bytes)
+
+    def test_entries_from_another_scorer_version_are_dropped(self) -> None:
+        self.cache.put(b"a", {"score": 1.0})
+        self.cache.close()
+
+        same = ResultCache(self._tmp.name, version="test")
+        self.assertEqual(same.get(b"a"), {"score": 1.0})
+        same.close()
+        bumped = ResultCache(self._tmp.name, version="test2")
+        self.addCleanup(bumped.close)
+        self.assertEqual(bumped.stats()["entries"], 0)
+
+
+class ScoringWithResultCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = ResultCache(self._tmp.name)
+        self.addCleanup(self.cache.close)
+
+    def test_hits_skip_scoring_and_match(self) -> None:
+        transcript = load_transcript(EXAMPLE)
+        expected = score_transcript(transcript, cache=None)
+        self.assertEqual(score_transcript(transcript, cache=self.cache), expected)
+        self.assertEqual(score_path(EXAMPLE, cache=self.cache), expected)
+
+        with mock.patch.object(score_module, "score_rounds", side_effect=AssertionError("rescored")):
+            self.assertEqual(score_transcript(json.loads(json.dumps(transcript)), cache=self.cache), expected)
+            self.assertEqual(score_path(EXAMPLE, cache=self.cache), expected)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_parameters_and_content_are_part_of_the_key(self) -> None:
+        transcript = load_transcript(EXAMPLE)
+        score_transcript(transcript, cache=self.cache)
+        minhash = score_transcript(transcript, l1_backend="minhash", cache=self.cache)
+        self.assertEqual(minhash, score_transcript(transcript, l1_backend="minhash", cache=None))
+        transcript["rounds"] = transcript["rounds"][:2]
+        self.assertEqual(score_transcript(transcript, cache=self.cache), score_transcript(transcript, cache=None))
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+        with mock.patch.object(score_module, "JACCARD_THRESHOLD", 0.9):
+            score_transcript(transcript, cache=self.cache)
+        with mock.patch.dict(os.environ, {"DR_OLLAMA_URL": "http://127.0.0.1:1", "DR_OLLAMA_EMBED_MODEL": "m"}):
+            with_model = score_module._cache_params("exact")
+        self.assertEqual(with_model["embedding_model"], "m")
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+    def test_profiled_runs_bypass_the_cache(self) -> None:
+        self.assertIn("timings", score_path(EXAMPLE, profile=True, cache=self.cache))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_batch_and_cli_read_the_environment(self) -> None:
+        copy = Path(self._tmp.name) / "t.json"
+        shutil.copy(EXAMPLE, copy)
+        with mock.patch.dict(os.environ, {"DR_RESULT_CACHE_DIR": self._tmp.name}):
+            [first] = score_batch([copy])
+            with mock.patch.object(score_module, "score_rounds", side_effect=AssertionError("rescored")):
+                [second] = score_batch([copy])
+        self.assertEqual(first["result"], second["result"])
+
+        env = dict(os.environ, PYTHONPATH="src", DR_RESULT_CACHE_DIR=self._tmp.name)
+        run = lambda *argv: subprocess.run(  # noqa: E731
+            [sys.executable, "-m", "dr.cli", *argv], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(json.loads(run("score", str(copy)).stdout), first["result"])
+        stats = json.loads(run("result-cache", "stats").stdout)
+        self.assertGreaterEqual(stats["total_hits"], 2)
+        self.assertEqual(json.loads(run("result-cache", "clear").stdout)["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dr.batch import score_file
+from dr.pack import pack_file
+from dr.schema import SCHEMA_PATH, SchemaError, TranscriptValidationError, compile_schema, validate_path, validate_transcript
+from dr.score import IncrementalScorer, score_path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _bad_transcript() -> dict:
+    return {
+        "version": "0.2",
+        "rounds": [
+            {"round": 1, "outputs": {"claims": ["fine"]}},
+            {"round": 0, "outputs": {"claims": ["ok", 7], "citations": [{"note": 1}]}},
+            {"outputs": []},
+            "not a round",
+        ],
+    }
+
+
+class SchemaValidationTests(unittest.TestCase):
+    def test_packaged_schema_matches_spec(self) -> None:
+        spec = ROOT / "spec" / "transcript.v0.1.schema.json"
+        self.assertEqual(json.loads(SCHEMA_PATH.read_text(encoding="utf-8")), json.loads(spec.read_text(encoding="utf-8")))
+
+    def test_examples_are_valid(self) -> None:
+        paths = [p for p in sorted((ROOT / "examples").rglob("*.json*")) if not p.name.endswith(".expected.json")]
+        self.assertGreater(len(paths), 10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths.append(pack_file(ROOT / "examples" / "trace.meeting-stop.jsonl", Path(tmpdir) / "m.drpack"))
+            for path in paths:
+                with self.subTest(path=path.name):
+                    self.assertEqual(validate_path(path), [])
+
+    def test_reports_every_error_with_json_pointers(self) -> None:
+        self.assertEqual(
+            [str(e) for e in validate_transcript(_bad_transcript())],
+            [
+                "/: missing required property 'conversation_id'",
+                '/version: expected "0.1"',
+                "/rounds/1/round: must be >= 1",
+                "/rounds/1/outputs/claims/1: expected string",
+                "/rounds/1/outputs/citations/0: missing required property 'url'",
+                "/rounds/1/outputs/citations/0/note: expected string",
+                "/rounds/2: missing required property 'round'",
+                "/rounds/2/outputs: expected object",
+                "/rounds/3: expected object",
+            ],
+        )
+
+    def test_jsonl_errors_carry_line_numbers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "t.jsonl"
+            path.write_text(
+                "\n".join(
+                    json.dumps(e)
+                    for e in [
+                        {"type": "round", "round": 1, "outputs": {"claims": ["a"]}},
+                        {"type": "round", "round": "2", "outputs": {"claims": "b"}},
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+            errors = validate_path(path)
+
+        self.assertEqual(
+            errors,
+            [
+                SchemaError("/round", "expected integer", line=2),
+                SchemaError("/outputs/claims", "expected array", line=2),
+                SchemaError("", "missing required property 'conversation_id'"),
+            ],
+        )
+
+    def test_unsupported_keywords_are_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "pattern"):
+            compile_schema({"type": "string", "pattern": "^a"})
+
+    def test_additional_properties_and_pointer_escaping(self) -> None:
+        validate = compile_schema({"type": "object", "properties": {"a/b": {"type": "integer"}}, "additionalProperties": False})
+        errors: list = []
+        validate({"a/b": 1.0, "c~d": 1, "a/b ": 2}, "", errors)
+        self.assertEqual(errors, [("/c~0d", "unexpected property"), ("/a~1b ", "unexpected property")])
+
+
+class ValidateBeforeScoringTests(unittest.TestCase):
+    def _write_bad(self, tmpdir: str) -> Path:
+        transcript = json.loads((ROOT / "examples" / "transcript.meeting-stop.json").read_text(encoding="utf-8"))
+        transcript["rounds"][-1]["outputs"]["claims"].append({"text": "not a string"})
+        path = Path(tmpdir) / "bad.json"
+        path.write_text(json.dumps(transcript), encoding="utf-8")
+        return path
+
+    def test_bad_last_round_fails_before_any_round_is_scored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write_bad(tmpdir)
+            with mock.patch.object(IncrementalScorer, "add_round") as add_round:
+                with self.assertRaises(TranscriptValidationError) as ctx:
+                    score_path(path, validate=True)
+            add_round.assert_not_called()
+            self.assertEqual([str(e) for e in ctx.exception.errors], ["/rounds/5/outputs/claims/2: expected string"])
+
+            record = score_file(path, validate=True)
+            self.assertIn("TranscriptValidationError", record["error"])
+
+    def test_cli_validate(self) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad = self._write_bad(tmpdir)
+            proc = subprocess.run(
+                [sys.executable, "-m", "dr.cli", "validate", "examples/transcript.meeting-stop.json", str(bad)],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        self.assertEqual(proc.returncode, 1, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), f"{bad}: /rounds/5/outputs/claims/2: expected string")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import bz2
+import gzip
+import importlib.util
 import json
+import lzma
 import os
+import re
+import string
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import tracemalloc
 import unittest
+from unittest import mock
 from pathlib import Path
 
-from dr.io import load_transcript
-from dr.score import score_transcript
+import dr.score as score_module
+from dr.io import JsonlTail, ReorderWindowExceeded, iter_jsonl_rounds, load_transcript
+from dr.pack import write_pack
+from dr.score import (
+    BLOCKER_KEYWORDS,
+    IMPERATIVE_VERBS,
+    OWNERSHIP_MARKERS,
+    VAGUE_MARKERS,
+    VAGUE_PREFIXES,
+    IncrementalScorer,
+    _blocker_score,
+    _next_actions_score,
+    score_rounds,
+    score_transcript,
+)
+from dr.semantic import EmbeddingConfig
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -107,6 +131,218 @@ class CalibrationExamplesTests(unittest.TestCase):
             self._run_calibration_case(fixture.stem)
 
 
+class IncrementalScorerTests(unittest.TestCase):
+    def test_final_result_matches_score_transcript_on_examples(self) -> None:
+        for path in sorted((ROOT / "examples").glob("**/*.json")):
+            transcript = load_transcript(path)
+            if not isinstance(transcript.get("rounds"), list):
+                continue
+            scorer = IncrementalScorer()
+            for r in transcript["rounds"]:
+                scorer.add_round(r)
+            with self.subTest(path=path.name):
+                self.assertEqual(scorer.result(), score_transcript(transcript))
+
+    def test_add_round_matches_score_transcript_on_each_prefix(self) -> None:
+        transcript = load_transcript(ROOT / "examples" / "transcript.meeting-stop.json")
+        scorer = IncrementalScorer()
+        for i, r in enumerate(transcript["rounds"], start=1):
+            update = scorer.add_round(r)
+            expected = score_transcript({"rounds": transcript["rounds"][:i]})
+            self.assertEqual(update["novelty"], expected["novelty_by_round"][-1])
+            self.assertEqual(update["readiness"], expected["readiness_by_round"][-1])
+            self.assertEqual(update["stop_recommendation"], expected["stop_recommendation"])
+            self.assertEqual(update["hint"], expected["hint"])
+
+    def test_result_without_rounds_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            IncrementalScorer().result()
+
+
+def _reference_is_specific_action(action: str) -> bool:
+    lowered = action.strip().lower()
+    if not lowered:
+        return False
+    if any(lowered.startswith(prefix) for prefix in VAGUE_PREFIXES):
+        return False
+    if any(marker in lowered for marker in VAGUE_MARKERS):
+        return False
+    words = lowered.split()
+    has_verb = any(word.strip(string.punctuation) in IMPERATIVE_VERBS for word in words)
+    has_concrete_artifact = bool(
+        re.search(r"https?://|\b(pr|branch|file|url|command|tool)\b|\b\w+\.\w+\b|[/`$]", lowered)
+    )
+    if len(words) < 5 and not has_verb:
+        return False
+    return has_verb or has_concrete_artifact
+
+
+def _reference_next_actions_score(next_actions: list) -> float:
+    actions = [a for a in next_actions if isinstance(a, str) and a.strip()]
+    if not actions:
+        return 0.0
+    specific_actions = [a for a in actions if _reference_is_specific_action(a)]
+    if not specific_actions:
+        return 0.3
+    has_ownership_language = any(marker in a.lower() for a in actions for marker in OWNERSHIP_MARKERS)
+    if len(specific_actions) >= 2 and has_ownership_language:
+        return 1.0
+    return 0.7
+
+
+def _reference_blocker_score(open_questions: list, next_actions: list) -> float:
+    haystack = "\n".join(t for t in open_questions + next_actions if isinstance(t, str)).lower()
+    return 0.0 if any(keyword in haystack for keyword in BLOCKER_KEYWORDS) else 1.0
+
+
+class ReadinessHeuristicsTests(unittest.TestCase):
+    """The compiled matchers must score exactly like the original substring scans."""
+
+    EXTRA_TEXTS = [
+        "",
+        "   ",
+        "Consider caching.",
+        "  - investigate the flaky test in ci.yml",
+        "Maybe run the migration",
+        "Run it",
+        "Ship",
+        "We will open a PR against main tomorrow morning",
+        "Owned by @alice: deploy build 1.2.3",
+        "Waiting on legal review before we merge",
+        "This is a long sentence without any verbs at all here",
+        "see https://example.com for details",
+        "Can't proceed until creds arrive",
+        "Prerequisites are MISSING",
+    ]
+
+    def test_matches_reference_on_example_texts(self) -> None:
+        rounds_outputs = []
+        for path in sorted((ROOT / "examples").glob("**/*.json")):
+            data = json.loads(path.read_text(encoding="utf-8"))
+            rounds_outputs.extend(r.get("outputs") or {} for r in data.get("rounds") or [] if isinstance(r, dict))
+        rounds_outputs.append({"next_actions": self.EXTRA_TEXTS, "open_questions": []})
+        rounds_outputs.extend({"next_actions": [t], "open_questions": [t]} for t in self.EXTRA_TEXTS)
+        rounds_outputs.extend({"next_actions": [a, b], "open_questions": []} for a in self.EXTRA_TEXTS for b in self.EXTRA_TEXTS)
+
+        for outputs in rounds_outputs:
+            actions = outputs.get("next_actions") or []
+            questions = outputs.get("open_questions") or []
+            with self.subTest(actions=actions, questions=questions):
+                self.assertEqual(_next_actions_score(actions), _reference_next_actions_score(actions))
+                self.assertEqual(_blocker_score(questions, actions), _reference_blocker_score(questions, actions))
+
+
+class L2NoveltyTests(unittest.TestCase):
+    # Claims about the same idea share a direction, whatever their wording.
+    TOPICS = {
+        "cache the hot queries in redis": [1.0, 0.0, 0.0],
+        "put a redis layer in front of frequent lookups": [0.98, 0.05, 0.0],
+        "add an index on user_id": [0.0, 1.0, 0.0],
+        "shard the orders table by region": [0.0, 0.0, 1.0],
+    }
+
+    def _score(self, rounds: list[dict]) -> dict:
+        scorer = IncrementalScorer(embedding_config=EmbeddingConfig(url="http://127.0.0.1:1", model="stub"))
+        with mock.patch("dr.score.embed_ollama", lambda config, claims: [self.TOPICS[c] for c in claims]):
+            for r in rounds:
+                scorer.add_round(r)
+        return scorer.result()
+
+    def test_l2_catches_semantic_paraphrase_missed_by_l0_and_l1(self) -> None:
+        result = self._score(
+            [
+                {"round": 1, "outputs": {"claims": ["Cache the hot queries in Redis.", "Add an index on user_id."]}},
+                {"round": 2, "outputs": {"claims": ["Put a Redis layer in front of frequent lookups."]}},
+                {"round": 3, "outputs": {"claims": ["Shard the orders table by region."]}},
+            ]
+        )
+        r2, r3 = result["novelty_by_round"][1], result["novelty_by_round"][2]
+        self.assertEqual((r2["new_claims_L0"], r2["new_claims_L1"], r2["new_claims_L2"]), (1, 1, 0))
+        self.assertEqual((r2["novelty_rate_L2"], r2["novelty_rate"], r2["new_claims"]), (0.0, 0.0, 0))
+        self.assertEqual((r3["new_claims_L2"], r3["novelty_rate_L2"]), (1, 0.5))
+        self.assertEqual(result["components"]["novelty_rate_L2"], 0.5)
+
+    def test_repeated_claims_are_indexed_once(self) -> None:
+        config = EmbeddingConfig(url="http://127.0.0.1:1", model="stub", index_exact_limit=16)
+        scorer = IncrementalScorer(embedding_config=config)
+        claims = ["Cache the hot queries in Redis.", "Add an index on user_id."]
+        with mock.patch("dr.score.embed_ollama", lambda config, claims: [self.TOPICS[c] for c in claims]):
+            for i in range(1, 6):
+                scorer.add_round({"round": i, "outputs": {"claims": claims[: 1 + i % 2]}})
+        self.assertEqual(len(scorer.seen_claim_embeddings), 2)
+        self.assertEqual(scorer.seen_claim_embeddings.exact_limit, 16)
+
+    def test_embedding_failure_drops_l2_for_that_round(self) -> None:
+        scorer = IncrementalScorer(embedding_config=EmbeddingConfig(url="http://127.0.0.1:1", model="stub"))
+        with mock.patch("dr.score.embed_ollama", side_effect=OSError("down")):
+            update = scorer.add_round({"round": 1, "outputs": {"claims": ["A"]}})
+        self.assertIsNone(update["novelty"]["new_claims_L2"])
+        self.assertIsNone(update["novelty"]["novelty_rate_L2"])
+        self.assertEqual(update["novelty"]["novelty_rate"], 1.0)
+
+    def _pipelined(self, rounds: list[dict], prefetch: int) -> tuple[list[dict], dict]:
+        def embed(config, claims):
+            return [self.TOPICS.get(c, [0.5, 0.5, 0.5]) for c in claims]
+
+        scorer = IncrementalScorer(embedding_config=EmbeddingConfig(url="http://127.0.0.1:1", model="stub"))
+        with mock.patch("dr.score.embed_ollama", embed):
+            updates = list(scorer.add_rounds(rounds, prefetch=prefetch))
+        return updates, scorer.result()
+
+    def test_prefetched_embeddings_match_sequential_scoring(self) -> None:
+        claims = list(self.TOPICS) + ["Something else entirely."]
+        rounds = [{"round": i, "outputs": {"claims": claims[i % 5 : i % 5 + 2]}} for i in range(1, 13)]
+        rounds[4]["outputs"]["claims"] = []
+        self.assertEqual(self._pipelined(rounds, prefetch=3), self._pipelined(rounds, prefetch=0))
+
+    def test_prefetch_requests_next_round_while_scoring_the_current_one(self) -> None:
+        rounds = [{"round": i, "outputs": {"claims": [f"Claim {i}."]}} for i in range(1, 11)]
+        real_readiness = score_module._compute_readiness
+
+        for prefetch in (4, 0):
+            started = {r["round"]: threading.Event() for r in rounds}
+            overlapped = []
+
+            def embed(config, claims):
+                started[int(claims[0].split()[1])].set()
+                return [[0.5, 0.5, 0.5] for _ in claims]
+
+            def readiness(outputs, previous):
+                # Lexical scoring of round N: has round N+1's embed request started?
+                n = int(outputs["claims"][0].split()[1].rstrip("."))
+                if n + 1 in started:
+                    # Sequential scoring cannot have started it, so don't wait there.
+                    overlapped.append(started[n + 1].wait(timeout=10.0 if prefetch else 0))
+                return real_readiness(outputs, previous)
+
+            scorer = IncrementalScorer(embedding_config=EmbeddingConfig(url="http://127.0.0.1:1", model="stub"))
+            with mock.patch("dr.score.embed_ollama", embed), mock.patch.object(
+                score_module, "_compute_readiness", readiness
+            ):
+                list(scorer.add_rounds(rounds, prefetch=prefetch))
+            with self.subTest(prefetch=prefetch):
+                self.assertEqual(overlapped, [bool(prefetch)] * (len(rounds) - 1))
+
+    def test_bad_later_round_does_not_preempt_earlier_ones(self) -> None:
+        def rounds():
+            yield {"round": 1, "outputs": {"claims": ["Add an index on user_id."]}}
+            yield {"round": 2, "outputs": "not an object"}
+            raise ValueError("Invalid JSON on line 3")
+
+        scorer = IncrementalScorer(embedding_config=EmbeddingConfig(url="http://127.0.0.1:1", model="stub"))
+        with mock.patch("dr.score.embed_ollama", lambda config, claims: [self.TOPICS[c] for c in claims]):
+            updates = scorer.add_rounds(rounds(), prefetch=1)
+            self.assertEqual(next(updates)["novelty"]["new_claims_L2"], 1)
+            with self.assertRaisesRegex(ValueError, "'outputs'"):
+                next(updates)
+
+    def test_l2_fields_absent_without_embeddings(self) -> None:
+        result = IncrementalScorer(embedding_config=None)
+        result.add_round({"round": 1, "outputs": {"claims": ["A"]}})
+        self.assertNotIn("new_claims_L2", result.result()["novelty_by_round"][0])
+        self.assertNotIn("novelty_rate_L2", result.result()["components"])
+
+
 class JsonlLoadTests(unittest.TestCase):
     def test_sorts_round_events_by_round_number(self) -> None:
         events = [
@@ -157,6 +393,214 @@ class JsonlLoadTests(unittest.TestCase):
         self.assertIn("bad.json:2", str(ctx.exception))
 
 
+class JsonlStreamTests(unittest.TestCase):
+    def _write_trace(self, tmpdir: str, events: list[dict]) -> Path:
+        path = Path(tmpdir) / "trace.jsonl"
+        path.write_text("\n".join(json.dumps(e) for e in events) + "\n", encoding="utf-8")
+        return path
+
+    def test_streamed_rounds_match_load_transcript_on_examples(self) -> None:
+        for path in sorted((ROOT / "examples").glob("trace.*.jsonl")):
+            with self.subTest(path=path.name):
+                self.assertEqual(list(iter_jsonl_rounds(path)), load_transcript(path)["rounds"])
+                self.assertEqual(score_rounds(iter_jsonl_rounds(path)), score_transcript(load_transcript(path)))
+
+    def test_reorders_within_window(self) -> None:
+        events = [{"type": "round", "round": n, "outputs": {"claims": [str(n)]}} for n in (2, 1, 4, 3, 5)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rounds = list(iter_jsonl_rounds(self._write_trace(tmpdir, events), reorder_window=2))
+        self.assertEqual([r["round"] for r in rounds], [1, 2, 3, 4, 5])
+
+    def test_rejects_round_older_than_window_with_line_number(self) -> None:
+        events = [{"type": "round", "round": n, "outputs": {"claims": [str(n)]}} for n in (2, 3, 4, 1)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write_trace(tmpdir, events)
+            with self.assertRaises(ValueError) as ctx:
+                list(iter_jsonl_rounds(path, reorder_window=2))
+        self.assertIn("trace.jsonl:4", str(ctx.exception))
+
+    def test_round_displaced_beyond_window_falls_back_to_full_sort(self) -> None:
+        # Round 1 arrives after rounds 2-301: more than the default window of 256 late.
+        order = list(range(2, 302)) + [1]
+        events = [{"type": "round", "round": n, "outputs": {"claims": [f"claim {n % 7}"]}} for n in order]
+        env = dict(os.environ, PYTHONPATH="src")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write_trace(tmpdir, events)
+            with self.assertRaises(ReorderWindowExceeded):
+                list(iter_jsonl_rounds(path))
+            expected = score_transcript(load_transcript(path))
+            self.assertEqual(score_module.score_path(path), expected)
+            self.assertEqual(score_module.score_path(path, reorder_window=0), expected)
+            for args in (["stop"], ["score", "--format", "columnar"], ["score", "--reorder-window", "400"]):
+                with self.subTest(args=args):
+                    proc = subprocess.run(
+                        [sys.executable, "-m", "dr.cli", *args, str(path)],
+                        cwd=ROOT,
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                        check=False,
+                    )
+                    self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertEqual(json.loads(proc.stdout), expected)
+
+    def test_reports_parse_errors_with_line_number(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "trace.jsonl"
+            path.write_text('{"type":"round","round":1,"outputs":{"claims":["A"]}}\n\n{oops\n', encoding="utf-8")
+            with self.assertRaises(ValueError) as ctx:
+                list(iter_jsonl_rounds(path))
+        self.assertIn("trace.jsonl:3", str(ctx.exception))
+
+    def test_peak_memory_does_not_grow_with_file_size(self) -> None:
+        def peak_for(n_rounds: int) -> int:
+            events = [
+                {"type": "round", "round": n, "outputs": {"claims": [f"claim {n} " + "x" * 200] * 5}}
+                for n in range(1, n_rounds + 1)
+            ]
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = self._write_trace(tmpdir, events)
+                del events
+                tracemalloc.start()
+                try:
+                    for _ in iter_jsonl_rounds(path, reorder_window=8):
+                        pass
+                    return tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+        small = peak_for(500)
+        large = peak_for(5000)
+        self.assertLess(large, small * 2)
+
+
+class CompressedInputTests(unittest.TestCase):
+    CODECS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+
+    def _compress(self, source: Path, name: str, opener=gzip.open) -> Path:
+        path = self.tmp / name
+        with opener(path, "wb") as fh:
+            fh.write(source.read_bytes())
+        return path
+
+    def test_every_reader_matches_the_uncompressed_file(self) -> None:
+        from dr.batch import expand_inputs
+        from dr.schema import validate_path
+
+        for source in (ROOT / "examples" / "trace.example.jsonl", ROOT / "examples" / "transcript.meeting-stop.json"):
+            expected = load_transcript(source)
+            for suffix, opener in self.CODECS.items():
+                with self.subTest(source=source.name, codec=suffix):
+                    path = self._compress(source, source.name + suffix, opener)
+                    self.assertEqual(load_transcript(path), expected)
+                    self.assertEqual(score_module.score_path(path), score_module.score_path(source))
+                    self.assertEqual(validate_path(path), [])
+                    if source.suffix == ".jsonl":
+                        self.assertEqual(list(iter_jsonl_rounds(path)), expected["rounds"])
+        # Magic bytes identify a compressed file whatever its name.
+        disguised = self._compress(ROOT / "examples" / "trace.example.jsonl", "plain.jsonl")
+        self.assertEqual(load_transcript(disguised)["rounds"], list(iter_jsonl_rounds(disguised)))
+        self.assertIn(self.tmp / "trace.example.jsonl.gz", expand_inputs([str(self.tmp)]))
+
+    def test_peak_memory_does_not_grow_with_uncompressed_size(self) -> None:
+        def peak_for(n_rounds: int) -> int:
+            path = self.tmp / f"trace{n_rounds}.jsonl.gz"
+            with gzip.open(path, "wt", encoding="utf-8") as fh:
+                for n in range(1, n_rounds + 1):
+                    event = {"type": "round", "round": n, "outputs": {"claims": [f"claim {n} " + "x" * 200] * 5}}
+                    fh.write(json.dumps(event) + "\n")
+            tracemalloc.start()
+            try:
+                for _ in iter_jsonl_rounds(path, reorder_window=8):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(peak_for(5000), peak_for(500) * 2)
+
+    def test_unreadable_inputs_raise_value_error(self) -> None:
+        source = ROOT / "examples" / "trace.example.jsonl"
+        truncated = self._compress(source, "trace.jsonl.gz")
+        truncated.write_bytes(truncated.read_bytes()[:-40])
+        with self.assertRaisesRegex(ValueError, "Corrupt gzip"):
+            load_transcript(truncated)
+
+        pack = self.tmp / "t.drpack"
+        write_pack(load_transcript(source), pack)
+        with self.assertRaisesRegex(ValueError, "memory-mapped"):
+            load_transcript(self._compress(pack, "t.drpack.gz"))
+        with self.assertRaisesRegex(ValueError, "compressed"):
+            JsonlTail(truncated)
+
+        zst = self.tmp / "trace.jsonl.zst"
+        zst.write_bytes(b"\x28\xb5\x2f\xfd" + b"\0" * 16)
+        if importlib.util.find_spec("compression") is None:  # stdlib zstd arrived in Python 3.14
+            with self.assertRaisesRegex(ValueError, "zstd"):
+                load_transcript(zst)
+
+
+class JsonlTailTests(unittest.TestCase):
+    def test_reads_only_appended_complete_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "trace.jsonl"
+            path.write_text('{"type":"round","round":1,"outputs":{"claims":["A"]}}\n{"type":"rou', encoding="utf-8")
+            with JsonlTail(path) as tail:
+                self.assertEqual([e["round"] for e in tail.read_events()], [1])
+                offset = tail.offset
+                self.assertEqual(tail.read_events(), [])
+                with path.open("a", encoding="utf-8") as fh:
+                    fh.write('nd","round":2,"outputs":{"claims":["B"]}}\nnot-json\n')
+                with self.assertRaises(ValueError) as ctx:
+                    tail.read_events()
+                self.assertGreater(tail.offset, offset)
+
+        self.assertIn("trace.jsonl:3", str(ctx.exception))
+
+
+class CliTailTests(unittest.TestCase):
+    def test_cli_tail_prints_verdict_changes_as_rounds_are_appended(self) -> None:
+        lines = (ROOT / "examples" / "trace.meeting-stop.jsonl").read_text(encoding="utf-8").splitlines(keepends=True)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = "src"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "live.jsonl"
+            path.write_text("".join(lines[:3]), encoding="utf-8")
+            proc = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    "from dr.cli import main; main()",
+                    "tail",
+                    str(path),
+                    "--poll-interval",
+                    "0.05",
+                    "--idle-timeout",
+                    "1.5",
+                ],
+                cwd=ROOT,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            time.sleep(0.3)
+            with path.open("a", encoding="utf-8") as fh:
+                for line in lines[3:]:
+                    fh.write(line)
+                    fh.flush()
+            stdout, stderr = proc.communicate(timeout=30)
+
+        self.assertEqual(proc.returncode, 0, stderr)
+        signals = [line for line in stdout.splitlines() if line.startswith("Signal: ")]
+        self.assertEqual(signals, ["Signal: CONTINUE", "Signal: SHIP"])
+
+
 class CliScoreTests(unittest.TestCase):
     def test_cli_exits_non_zero_for_invalid_json_with_context(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -204,6 +648,55 @@ class CliStopTests(unittest.TestCase):
         self.assertEqual(lines[5], "Next action:")
         self.assertTrue(lines[6].startswith("- "))
 
+    # Modules only the embedding path needs.
+    HEAVY_MODULES = ("dr.semantic", "dr.vectors", "dr.embedding_cache", "numpy", "http.client", "concurrent.futures")
+
+    def test_cli_stop_skips_embedding_stack(self) -> None:
+        env = {k: v for k, v in os.environ.items() if not k.startswith("DR_")}
+        env["PYTHONPATH"] = "src"
+        script = (
+            "import json, sys\n"
+            "import dr.cli\n"
+            f"heavy = {self.HEAVY_MODULES!r}\n"
+            "after_import = [m for m in heavy if m in sys.modules]\n"
+            "sys.argv = ['dr', 'stop', 'examples/transcript.meeting-stop.json']\n"
+            "dr.cli.main()\n"
+            "print(json.dumps([after_import, [m for m in heavy if m in sys.modules]]), file=sys.stderr)\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True, check=False
+        )
+
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(json.loads(proc.stderr), [[], []])
+
+    # Cumulative `python -X importtime` cost of `dr.cli`, in microseconds. It measures
+    # ~35ms locally (the embedding stack alone used to add ~110ms); the best of a few
+    # runs is compared so one slow run on a busy machine does not fail the test.
+    IMPORT_BUDGET_US = 100_000
+
+    def test_cli_import_stays_within_budget(self) -> None:
+        env = {k: v for k, v in os.environ.items() if not k.startswith("DR_")}
+        env["PYTHONPATH"] = "src"
+        best = None
+        for _ in range(3):
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", "import dr.cli"],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            cumulative = {}
+            for line in proc.stderr.splitlines():
+                if line.startswith("import time:") and "|" in line:
+                    _, cum, name = line.split("|")
+                    if cum.strip().isdigit():
+                        cumulative[name.strip()] = int(cum)
+            best = cumulative["dr.cli"] if best is None else min(best, cumulative["dr.cli"])
+        self.assertLess(best, self.IMPORT_BUDGET_US)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,10 @@
-from dr.semantic import cosine_similarity, mean_vector
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dr.score import IncrementalScorer
+from dr.semantic import EmbeddingConfig, OllamaEmbeddingClient, cosine_similarity, embedding_client, mean_vector
 
 
 def test_cosine_similarity_identity():
@@ -12,3 +18,165 @@ def test_cosine_similarity_orthogonal():
 def test_mean_vector():
     v = mean_vector([[1.0, 2.0], [3.0, 4.0]])
     assert v == [2.0, 3.0]
+
+
+def _fake_embedding(prompt: str) -> list:
+    return [float(len(prompt)), float(sum(map(ord, prompt)) % 97), 1.0]
+
+
+class _StubOllama(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, batch: bool = True) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.batch = batch
+        self.models = {"stub"}
+        self.requests: list = []
+        self.connections: set = set()
+        self.lock = threading.Lock()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, payload))
+            server.connections.add(self.client_address)
+        if self.path in {"/api/embed", "/api/embeddings"} and payload["model"] not in server.models:
+            # What Ollama answers for a model it has not pulled.
+            self._send_json(404, {"error": f'model "{payload["model"]}" not found, try pulling it first'})
+            return
+        if self.path == "/api/embed" and server.batch:
+            body = {"embeddings": [_fake_embedding(p) for p in payload["input"]]}
+        elif self.path == "/api/embeddings":
+            body = {"embedding": _fake_embedding(payload["prompt"])}
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send_json(200, body)
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class OllamaEmbeddingClientTests(unittest.TestCase):
+    def _start(self, batch: bool) -> _StubOllama:
+        server = _StubOllama(batch=batch)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _client(self, server: _StubOllama, model: str = "stub", **kwargs) -> OllamaEmbeddingClient:
+        host, port = server.server_address
+        client = OllamaEmbeddingClient(EmbeddingConfig(url=f"http://{host}:{port}", model=model, **kwargs))
+        self.addCleanup(client.close)
+        return client
+
+    def test_uses_batch_endpoint_and_preserves_order(self) -> None:
+        server = self._start(batch=True)
+        client = self._client(server, batch_size=4, concurrency=3)
+        prompts = [f"claim number {i}" for i in range(22)]
+
+        self.assertEqual(client.embed(prompts), [_fake_embedding(p) for p in prompts])
+        self.assertTrue(client.batch_supported)
+        self.assertEqual(len(server.requests), 6)
+        self.assertTrue(all(path == "/api/embed" for path, _ in server.requests))
+
+    def test_falls_back_to_single_prompt_endpoint(self) -> None:
+        server = self._start(batch=False)
+        client = self._client(server, batch_size=8, concurrency=2)
+        prompts = [f"p{i}" for i in range(5)]
+
+        self.assertEqual(client.embed(prompts), [_fake_embedding(p) for p in prompts])
+        self.assertFalse(client.batch_supported)
+        self.assertEqual(sum(1 for path, _ in server.requests if path == "/api/embeddings"), 5)
+
+        server.requests.clear()
+        client.embed(["again"])
+        self.assertEqual([path for path, _ in server.requests], ["/api/embeddings"])
+
+    def test_missing_model_404_does_not_disable_batch_endpoint(self) -> None:
+        server = self._start(batch=True)
+        client = self._client(server, model="typo", batch_size=4, concurrency=1)
+
+        with self.assertRaisesRegex(OSError, 'HTTP 404: model "typo" not found'):
+            client.embed(["alpha", "beta"])
+        self.assertIsNone(client.batch_supported)
+
+        server.models.add("typo")
+        server.requests.clear()
+        self.assertEqual(client.embed(["alpha", "beta"]), [_fake_embedding("alpha"), _fake_embedding("beta")])
+        self.assertTrue(client.batch_supported)
+        self.assertEqual([path for path, _ in server.requests], ["/api/embed"])
+
+    def test_reuses_keep_alive_connections(self) -> None:
+        server = self._start(batch=True)
+        client = self._client(server, batch_size=1, concurrency=2)
+        for _ in range(3):
+            client.embed([f"c{i}" for i in range(6)])
+
+        self.assertEqual(client.requests, 18)
+        self.assertLessEqual(len(server.connections), 2)
+
+    def test_profiled_scoring_counts_round_trips_and_bytes(self) -> None:
+        server = self._start(batch=True)
+        host, port = server.server_address
+        config = EmbeddingConfig(url=f"http://{host}:{port}", model="stub", batch_size=2, concurrency=1)
+        self.addCleanup(embedding_client(config).close)
+
+        scorer = IncrementalScorer(embedding_config=config, profile=True)
+        scorer.add_round({"round": 1, "outputs": {"claims": ["alpha one", "beta two", "gamma three"]}})
+        scorer.add_round({"round": 2, "outputs": {"claims": ["delta four"]}})
+        timings = scorer.result()["timings"]
+
+        self.assertEqual(timings["network"]["requests"], len(server.requests))
+        self.assertEqual([r["network"]["requests"] for r in timings["rounds"]], [2, 1])
+        sent = sum(len(json.dumps(payload)) for _, payload in server.requests)
+        self.assertEqual(timings["network"]["bytes_sent"], sent)
+        self.assertGreater(timings["network"]["bytes_received"], 0)
+        self.assertEqual(timings["stages"]["embed"]["calls"], 2)
+
+    def test_concurrent_profiled_scorers_count_only_their_own_requests(self) -> None:
+        server = self._start(batch=True)
+        host, port = server.server_address
+        config = EmbeddingConfig(url=f"http://{host}:{port}", model="stub", batch_size=2, concurrency=2)
+        self.addCleanup(embedding_client(config).close)
+        barrier = threading.Barrier(2)
+        timings = {}
+
+        def run(name: str, claims_per_round: int) -> None:
+            scorer = IncrementalScorer(embedding_config=config, profile=True)
+            for i in range(5):
+                barrier.wait()
+                claims = [f"{name} claim {i} {j}" for j in range(claims_per_round)]
+                scorer.add_round({"round": i, "outputs": {"claims": claims}})
+            timings[name] = scorer.result()["timings"]
+
+        threads = [threading.Thread(target=run, args=args) for args in (("wide", 5), ("narrow", 1))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([r["network"]["requests"] for r in timings["wide"]["rounds"]], [3] * 5)
+        self.assertEqual([r["network"]["requests"] for r in timings["narrow"]["rounds"]], [1] * 5)
+        self.assertEqual(timings["wide"]["network"]["requests"] + timings["narrow"]["network"]["requests"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from dr.io import load_transcript
+from dr.score import IncrementalScorer, score_transcript
+from dr.server import SessionStore, make_server
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str) -> None:
+        super().__init__("localhost")
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self._path)
+
+
+class ServerTests(unittest.TestCase):
+    def _start(self, **kwargs):
+        server = make_server(port=0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def _request(self, conn: http.client.HTTPConnection, method: str, path: str, body=None) -> tuple[int, dict]:
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        conn.request(method, path, body=data, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        return resp.status, json.loads(resp.read())
+
+    def test_incremental_rounds_match_score_transcript(self) -> None:
+        server = self._start()
+        conn = http.client.HTTPConnection(*server.server_address)
+        self.addCleanup(conn.close)
+        transcript = load_transcript(ROOT / "examples" / "transcript.meeting-stop.json")
+
+        for i, r in enumerate(transcript["rounds"], start=1):
+            status, update = self._request(conn, "POST", "/conversations/meeting/rounds", r)
+            self.assertEqual(status, 200)
+            expected = score_transcript({"rounds": transcript["rounds"][:i]})
+            self.assertEqual(update["stop_recommendation"], expected["stop_recommendation"])
+            self.assertEqual(update["novelty"], expected["novelty_by_round"][-1])
+
+        status, result = self._request(conn, "GET", "/conversations/meeting")
+        self.assertEqual((status, result), (200, score_transcript(transcript)))
+
+        status, scored = self._request(conn, "POST", "/score", transcript)
+        self.assertEqual((status, scored), (200, score_transcript(transcript)))
+
+        self.assertEqual(self._request(conn, "DELETE", "/conversations/meeting")[0], 200)
+        self.assertEqual(self._request(conn, "GET", "/conversations/meeting")[0], 404)
+
+    def test_bad_requests_return_errors(self) -> None:
+        server = self._start()
+        conn = http.client.HTTPConnection(*server.server_address)
+        self.addCleanup(conn.close)
+
+        status, body = self._request(conn, "POST", "/conversations/x/rounds", {"round": 1, "outputs": {"claims": "no"}})
+        self.assertEqual(status, 400)
+        self.assertIn("outputs.claims", body["error"])
+        conn.close()
+        self.assertEqual(self._request(conn, "GET", "/conversations/x")[0], 404)
+        conn.close()
+        self.assertEqual(self._request(conn, "POST", "/score", {"rounds": []})[0], 400)
+        conn.close()
+        self.assertEqual(self._request(conn, "GET", "/nope")[0], 404)
+
+    def test_missing_or_invalid_content_length_is_rejected(self) -> None:
+        server = self._start()
+        for length, expected in ((None, 411), ("-1", 400), ("ten", 400)):
+            conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+            self.addCleanup(conn.close)
+            conn.putrequest("POST", "/conversations/x/rounds", skip_accept_encoding=True)
+            if length is not None:
+                conn.putheader("Content-Length", length)
+            conn.endheaders()
+            resp = conn.getresponse()
+            with self.subTest(length=length):
+                self.assertEqual(resp.status, expected)
+                self.assertIn("Content-Length", json.loads(resp.read())["error"])
+
+    def test_unexpected_errors_return_500(self) -> None:
+        server = self._start()
+        conn = http.client.HTTPConnection(*server.server_address)
+        self.addCleanup(conn.close)
+        with mock.patch("dr.server.score_transcript", side_effect=TypeError("unhashable type: 'dict'")):
+            status, body = self._request(conn, "POST", "/score", {"rounds": [{"round": 1, "outputs": {"claims": []}}]})
+        self.assertEqual((status, body), (500, {"error": "TypeError: unhashable type: 'dict'"}))
+        conn.close()
+        self.assertEqual(self._request(conn, "GET", "/healthz")[0], 200)
+
+    def test_multi_round_post_is_all_or_nothing(self) -> None:
+        server = self._start()
+        conn = http.client.HTTPConnection(*server.server_address)
+        self.addCleanup(conn.close)
+        good = {"round": 1, "outputs": {"claims": ["A"]}}
+        self.assertEqual(self._request(conn, "POST", "/conversations/m/rounds", good)[0], 200)
+
+        body = {"rounds": [{"round": 2, "outputs": {"claims": ["B"]}}, {"round": 3, "outputs": []}]}
+        status, error = self._request(conn, "POST", "/conversations/m/rounds", body)
+        self.assertEqual(status, 400)
+        self.assertIn("outputs", error["error"])
+        conn.close()
+        status, result = self._request(conn, "GET", "/conversations/m")
+        self.assertEqual((status, result), (200, score_transcript({"rounds": [good]})))
+
+    def test_score_and_sessions_share_environment_options(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = {"DR_CLAIM_STORE": str(Path(tmpdir) / "claims.sqlite3"), "DR_PROFILE": "1"}
+            with mock.patch.dict(os.environ, env):
+                server = self._start()
+            # Read once by make_server: later requests do not consult the environment.
+            conn = http.client.HTTPConnection(*server.server_address)
+            self.addCleanup(conn.close)
+            first = {"conversation_id": "first", "rounds": [{"round": 1, "outputs": {"claims": ["Cache the query plan"]}}]}
+            status, scored = self._request(conn, "POST", "/score", first)
+            self.assertEqual(status, 200)
+            self.assertIn("timings", scored)
+
+            r = {"round": 1, "outputs": {"claims": ["cache the query plan"]}}
+            status, update = self._request(conn, "POST", "/conversations/second/rounds", r)
+            self.assertEqual(status, 200)
+            self.assertEqual(update["novelty"]["corpus_repeats"][0]["conversation_id"], "first")
+            status, result = self._request(conn, "GET", "/conversations/second")
+            self.assertIn("timings", result)
+
+            status, again = self._request(conn, "POST", "/score", dict(first, conversation_id="third"))
+            repeats = again["novelty_by_round"][0]["corpus_repeats"]
+            self.assertEqual([m["conversation_id"] for m in repeats], ["first"])
+            server.server_close()
+
+    def test_unix_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "dr.sock")
+            self._start(unix_socket=path)
+            conn = _UnixHTTPConnection(path)
+            try:
+                status, update = self._request(
+                    conn, "POST", "/conversations/u/rounds", {"rounds": [{"round": 1, "outputs": {"claims": ["A"]}}]}
+                )
+                health = self._request(conn, "GET", "/healthz")
+            finally:
+                conn.close()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(update["stop_recommendation"]["signal"], "CONTINUE")
+        self.assertEqual(health, (200, {"ok": True, "sessions": 1, "evicted": 0}))
+
+    def test_per_round_latency_is_small(self) -> None:
+        server = self._start()
+        conn = http.client.HTTPConnection(*server.server_address)
+        self.addCleanup(conn.close)
+        rounds = load_transcript(ROOT / "examples" / "transcript.meeting-stop.json")["rounds"] * 20
+        start = time.perf_counter()
+        for r in rounds:
+            self._request(conn, "POST", "/conversations/latency/rounds", r)
+        per_round = (time.perf_counter() - start) / len(rounds)
+        # Loose bound for CI; benchmarks/bench_serve.py reports the real number.
+        self.assertLess(per_round, 0.05)
+
+
+class SessionStoreTests(unittest.TestCase):
+    def test_idle_and_lru_eviction(self) -> None:
+        now = [0.0]
+        store = SessionStore(idle_timeout=10.0, max_sessions=2, clock=lambda: now[0])
+        store.get("a", create=True)
+        now[0] = 5.0
+        store.get("b", create=True)
+        store.get("c", create=True)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(len(store), 2)
+
+        now[0] = 8.0
+        store.get("c")
+        now[0] = 16.0
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("c"))
+        self.assertEqual(store.evicted, 2)
+        self.assertIsInstance(store.get("c").scorer, IncrementalScorer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from dr.semantic import cosine_similarity, mean_vector
+from dr.vectors import VectorIndex, VectorMatrix, _np
+
+BACKENDS = ["python"] + (["numpy"] if _np is not None else [])
+TOLERANCE = 1e-5
+
+
+def _random_vectors(rng: random.Random, n: int, dim: int) -> list[list[float]]:
+    return [[rng.uniform(-1.0, 1.0) for _ in range(dim)] for _ in range(n)]
+
+
+class VectorMatrixTests(unittest.TestCase):
+    def test_similarities_match_cosine_similarity(self) -> None:
+        rng = random.Random(3)
+        history = _random_vectors(rng, 40, 64) + [[0.0] * 64]
+        queries = _random_vectors(rng, 5, 64) + [[0.0] * 64]
+        for backend in BACKENDS:
+            matrix = VectorMatrix(backend=backend)
+            matrix.extend(history[:10])
+            for v in history[10:]:
+                matrix.append(v)
+            sims = matrix.similarity_matrix(queries)
+            for q, row in zip(queries, sims):
+                expected = [cosine_similarity(q, h) for h in history]
+                with self.subTest(backend=backend):
+                    self.assertEqual(len(row), len(expected))
+                    for got, want in zip(row, expected):
+                        self.assertAlmostEqual(got, want, delta=TOLERANCE)
+            maxes = matrix.max_similarities(queries)
+            for got, row in zip(maxes, sims):
+                self.assertAlmostEqual(got, max(row), delta=TOLERANCE)
+
+    def test_mean_matches_mean_vector(self) -> None:
+        rng = random.Random(5)
+        vectors = _random_vectors(rng, 25, 32)
+        for backend in BACKENDS:
+            matrix = VectorMatrix(backend=backend)
+            matrix.extend(vectors)
+            with self.subTest(backend=backend):
+                for got, want in zip(matrix.mean(), mean_vector(vectors)):
+                    self.assertAlmostEqual(got, want, delta=TOLERANCE)
+
+    def test_empty_matrix(self) -> None:
+        for backend in BACKENDS:
+            matrix = VectorMatrix(backend=backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(matrix.max_similarities([[1.0, 0.0]]), [float("-inf")])
+                self.assertEqual(matrix.similarities([1.0, 0.0]), [])
+                with self.assertRaises(ValueError):
+                    matrix.mean()
+
+    def test_rejects_mismatched_dimensions(self) -> None:
+        for backend in BACKENDS:
+            matrix = VectorMatrix(backend=backend)
+            matrix.append([1.0, 2.0])
+            with self.subTest(backend=backend):
+                with self.assertRaises(ValueError):
+                    matrix.append([1.0, 2.0, 3.0])
+                with self.assertRaises(ValueError):
+                    matrix.similarities([1.0])
+
+
+class VectorIndexTests(unittest.TestCase):
+    def _clustered(self, rng: random.Random, n: int, dim: int, centers: list[list[float]]) -> list[list[float]]:
+        out = []
+        for _ in range(n):
+            c = rng.choice(centers)
+            out.append([x + rng.gauss(0, 0.35) for x in c])
+        return out
+
+    def test_small_index_is_exact(self) -> None:
+        rng = random.Random(1)
+        vectors = _random_vectors(rng, 50, 16)
+        queries = _random_vectors(rng, 5, 16)
+        index = VectorIndex(exact_limit=100)
+        index.add_many(vectors)
+        matrix = VectorMatrix()
+        matrix.extend(vectors)
+
+        self.assertFalse(index.is_approximate)
+        self.assertEqual(index.max_similarities(queries), matrix.max_similarities(queries))
+
+    def test_ivf_recall_against_brute_force(self) -> None:
+        rng = random.Random(9)
+        dim = 24
+        centers = _random_vectors(rng, 40, dim)
+        history = self._clustered(rng, 1500, dim, centers)
+        # Half near-duplicates of seen vectors (should match), half fresh points.
+        queries = [[x + rng.gauss(0, 0.05) for x in rng.choice(history)] for _ in range(100)]
+        queries += self._clustered(rng, 100, dim, centers)
+        threshold = 0.82
+
+        for backend in BACKENDS:
+            index = VectorIndex(exact_limit=300, backend=backend)
+            for i in range(0, len(history), 100):
+                index.add_many(history[i : i + 100])
+            brute = VectorMatrix(backend=backend)
+            brute.extend(history)
+
+            approx = index.max_similarities(queries)
+            exact = brute.max_similarities(queries)
+            with self.subTest(backend=backend):
+                self.assertTrue(index.is_approximate)
+                self.assertEqual(len(index), len(history))
+                for got, want in zip(approx, exact):
+                    self.assertLessEqual(got, want + TOLERANCE)
+                positives = [i for i, sim in enumerate(exact) if sim >= threshold]
+                found = [i for i in positives if approx[i] >= threshold]
+                self.assertGreater(len(positives), 50)
+                self.assertGreaterEqual(len(found) / len(positives), 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()